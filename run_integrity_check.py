@@ -138,7 +138,7 @@ def main():
 
             if confirm.lower() == "yes":
                 repairer = IntegrityRepairer(db, dry_run=args.dry_run)
-                actions = repairer.repair_all_auto_fixable(issues)
+                repairer.repair_all_auto_fixable(issues)
 
                 # Display repair report
                 repair_report = repairer.generate_repair_report()
@@ -159,9 +159,10 @@ def main():
             confirm = input("Continue with interactive repair? (yes/no): ")
             if confirm.lower() == "yes":
                 repairer = IntegrityRepairer(db, dry_run=args.dry_run)
-                actions = repairer.interactive_repair_files(issues)
+                repairer.interactive_repair_files(issues)
+                repairer.interactive_repair_orphans(issues)
 
-                if actions:
+                if repairer.actions:
                     repair_report = repairer.generate_repair_report()
                     print(repair_report)
 
@@ -58,7 +58,7 @@ DESTRUCTIVE_PATTERNS = [
 
 # Patterns that indicate this is a downgrade (more lenient)
 DOWNGRADE_INDICATORS = [
-    r"def\s+downgrade\s*\(\s*\)\s*:",
+    r"def\s+downgrade\s*\(\s*\)\s*(->\s*None\s*)?:",
 ]
 
 # Timestamp pattern for new migrations
@@ -86,7 +86,7 @@ def scan_migration(filepath: Path) -> List[Issue]:
                 break
 
         # Check for upgrade function (reset flag)
-        if re.search(r"def\s+upgrade\s*\(\s*\)\s*:", line):
+        if re.search(r"def\s+upgrade\s*\(\s*\)\s*(->\s*None\s*)?:", line):
             in_downgrade = False
 
         # Check for destructive patterns
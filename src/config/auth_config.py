@@ -32,6 +32,17 @@ class AuthSettings(BaseSettings):
 
     # Password Settings
     password_min_length: int = Field(default=8, description="Minimum password length")
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor; older hashes are upgraded at login",
+    )
+    password_hash_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Passwords hashed or checked at once per app process",
+    )
 
     # Security Settings
     max_login_attempts: int = Field(
@@ -44,6 +55,16 @@ class AuthSettings(BaseSettings):
     # Token Settings
     token_type: str = "bearer"
 
+    # Auth caches (per app process)
+    token_cache_size: int = Field(
+        default=10000,
+        description="Verified access tokens kept, so repeat requests skip signature checks",
+    )
+    principal_cache_ttl_seconds: int = Field(
+        default=30,
+        description="Seconds a user's active/locked state and roles are reused before re-reading",
+    )
+
     @property
     def access_token_expire_delta(self) -> timedelta:
         """Get access token expiration as timedelta."""
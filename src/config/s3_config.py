@@ -16,6 +16,10 @@ class S3Settings(BaseSettings):
     # Bucket configuration
     S3_BUCKET_NAME: str = "ip2a-documents"
     S3_PRESIGNED_URL_EXPIRY: int = 3600  # 1 hour for presigned URLs
+    S3_URL_CACHE_SIZE: int = 10000  # Presigned URLs kept for reuse
+
+    # Client settings
+    S3_MAX_POOL_CONNECTIONS: int = 50  # HTTP connections shared by all threads using the client
 
     # File upload settings
     MAX_FILE_SIZE_MB: int = 50  # Maximum file size in MB
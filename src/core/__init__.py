@@ -1,6 +1,12 @@
 """Core utilities and security functions."""
 
-from src.core.security import hash_password, verify_password
+from src.core.security import (
+    hash_password,
+    hash_password_async,
+    needs_rehash,
+    verify_password,
+    verify_password_async,
+)
 from src.core.jwt import (
     create_access_token,
     create_refresh_token,
@@ -13,7 +19,10 @@ from src.core.jwt import (
 
 __all__ = [
     "hash_password",
+    "hash_password_async",
+    "needs_rehash",
     "verify_password",
+    "verify_password_async",
     "create_access_token",
     "create_refresh_token",
     "verify_access_token",
@@ -2,6 +2,9 @@
 
 import hashlib
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -28,6 +31,60 @@ class TokenInvalidError(TokenError):
     pass
 
 
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified access tokens and their claims.
+
+    A browser session sends the same token with every request, and a page
+    with several polling HTMX fragments sends it many times a second, so
+    verify_access_token remembers tokens whose signature it has checked
+    until they expire. Only valid tokens are stored; entries are keyed by
+    the signing key too, so a key change is never served from the cache.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> tuple:
+        return token, auth_settings.jwt_secret_key, auth_settings.jwt_algorithm
+
+    def get(self, token: str) -> Optional[dict[str, Any]]:
+        """Claims of a cached, unexpired token, or None."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]  # Expired: let the caller verify and report it
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        """Remember a verified token until its exp claim."""
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(exp), dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every verified token."""
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = VerifiedTokenCache(max_size=auth_settings.token_cache_size)
+
+
 def create_access_token(
     subject: str | int,
     additional_claims: Optional[dict[str, Any]] = None,
@@ -98,6 +155,9 @@ def verify_access_token(token: str) -> dict[str, Any]:
     """
     Verify and decode a JWT access token.
 
+    Tokens that verified before are answered from token_cache until they
+    expire.
+
     Args:
         token: The JWT token to verify
 
@@ -108,6 +168,10 @@ def verify_access_token(token: str) -> dict[str, Any]:
         TokenExpiredError: If token has expired
         TokenInvalidError: If token is invalid
     """
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(
             token,
@@ -119,6 +183,7 @@ def verify_access_token(token: str) -> dict[str, Any]:
         if payload.get("type") != "access":
             raise TokenInvalidError("Invalid token type")
 
+        token_cache.put(token, payload)
         return payload
 
     except jwt.ExpiredSignatureError:
@@ -1,7 +1,141 @@
-"""Security utilities for password hashing and verification."""
+"""Security utilities for password hashing and verification.
+
+bcrypt is deliberately slow (about 250ms per hash at 12 rounds), so every
+hash and check runs on a small dedicated thread pool. bcrypt releases the
+GIL, so the pool's workers are what bound the CPU spent on passwords: a
+burst of logins queues there instead of occupying every request thread,
+and async routes await the result without blocking the event loop. Queue
+depth and wait times are served on /admin/metrics/password-hashing.
+
+The cost factor comes from AUTH_BCRYPT_ROUNDS. Hashes made with a different
+cost still verify; needs_rehash tells login to re-hash them at the new cost.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, Deque, Optional
 
 import bcrypt
 
+from src.config.auth_config import auth_settings
+
+
+def _hash(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=auth_settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _check(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    except Exception:
+        return False
+
+
+class PasswordHashPool:
+    """Bounded thread pool for bcrypt work, with queue-depth metrics."""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+        wait_sample_size: int = 1000,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Hashes computed at once
+            executor_factory: Builds the executor (defaults to a thread pool)
+            wait_sample_size: Recent queue waits kept for percentiles
+        """
+        self.max_workers = max_workers
+        self._executor_factory = executor_factory or self._default_executor
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=wait_sample_size)
+        self.queued = 0
+        self.running = 0
+        self.reset()
+
+    @staticmethod
+    def _default_executor(max_workers: int) -> Executor:
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+
+    def reset(self) -> None:
+        """Clear counters; queued and running jobs are live state and are kept."""
+        with self._lock:
+            self.completed = 0
+            self.peak_queued = self.queued
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self._waits.clear()
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Queue one bcrypt call."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+            executor = self._executor
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+        return executor.submit(self._run, time.monotonic(), fn, *args)
+
+    def _run(self, queued_at: float, fn: Callable, *args):
+        wait = time.monotonic() - queued_at
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self._waits.append(wait)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    def run(self, fn: Callable, *args):
+        """Run a bcrypt call on the pool and wait for it."""
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn: Callable, *args):
+        """Run a bcrypt call on the pool without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def snapshot(self) -> dict:
+        """Current queue state plus counters since the last reset."""
+        with self._lock:
+            waits = sorted(self._waits)
+            wait_count = len(waits)
+            return {
+                "workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "peak_queued": self.peak_queued,
+                "completed": self.completed,
+                "wait_ms": {
+                    "avg": round(self.total_wait / wait_count * 1000, 3) if wait_count else 0.0,
+                    "p95": round(waits[min(int(wait_count * 0.95), wait_count - 1)] * 1000, 3) if wait_count else 0.0,
+                    "max": round(self.max_wait * 1000, 3),
+                    "samples": wait_count,
+                },
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker threads; the next hash starts a new pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+password_hash_pool = PasswordHashPool(max_workers=auth_settings.password_hash_workers)
+
 
 def hash_password(password: str) -> str:
     """
@@ -13,10 +147,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    # Generate salt and hash (12 rounds is the default, good security/performance balance)
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed.decode("utf-8")
+    return password_hash_pool.run(_hash, password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -30,10 +161,22 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    return password_hash_pool.run(_check, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password for async routes."""
+    return await password_hash_pool.run_async(_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password for async routes."""
+    return await password_hash_pool.run_async(_check, plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash uses a cost factor other than the configured one."""
     try:
-        return bcrypt.checkpw(
-            plain_password.encode("utf-8"),
-            hashed_password.encode("utf-8")
-        )
-    except Exception:
+        return int(hashed_password.split("$")[2]) != auth_settings.bcrypt_rounds
+    except (AttributeError, IndexError, ValueError):
         return False
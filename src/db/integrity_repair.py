@@ -1,14 +1,26 @@
 """Database integrity repair - fixes issues found by integrity checker."""
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 
+from src.db.base import Base
 from src.models import Member, MemberEmployment, OrganizationContact, FileAttachment
 from src.db.enums import MemberStatus
+from src.db.integrity_rules import AUTO_DELETE_TABLES
+from src.services.blob_store import delete_blob_content, release_blob
 from .integrity_check import IntegrityIssue
 
 
+def _mapped_class(table_name: str):
+    """The model class mapped to a table, or None."""
+    for mapper in Base.registry.mappers:
+        if mapper.local_table.name == table_name and mapper.inherits is None:
+            return mapper.class_
+    return None
+
+
 class RepairAction:
     """Represents a repair action taken."""
 
@@ -113,48 +125,54 @@ class IntegrityRepairer:
             )
 
     def _repair_foreign_key(self, issue: IntegrityIssue) -> RepairAction:
-        """Repair foreign key issues (delete orphaned records)."""
-        if issue.fix_action != "delete":
+        """Repair foreign key issues (delete the orphan, or clear an optional reference)."""
+        model = _mapped_class(issue.table)
+        if model is None or issue.record_id is None:
             return RepairAction(
                 issue=issue,
                 action_taken="skip",
                 success=False,
-                details="Unexpected fix_action",
+                details=f"No single-row repair for {issue.table}",
             )
 
-        if not self.dry_run:
-            if issue.table == "member_employments":
-                emp = (
-                    self.db.query(MemberEmployment)
-                    .filter(MemberEmployment.id == issue.record_id)
-                    .first()
-                )
-                if emp:
-                    self.db.delete(emp)
-
-            elif issue.table == "organization_contacts":
-                contact = (
-                    self.db.query(OrganizationContact)
-                    .filter(OrganizationContact.id == issue.record_id)
-                    .first()
+        if issue.fix_action == "delete":
+            if issue.table not in AUTO_DELETE_TABLES:
+                return RepairAction(
+                    issue=issue,
+                    action_taken="skip",
+                    success=False,
+                    details="Needs review: run with --interactive",
                 )
-                if contact:
-                    self.db.delete(contact)
+            if not self.dry_run:
+                record = self.db.get(model, issue.record_id)
+                if record is not None:
+                    self._delete_record(record)
+            return RepairAction(
+                issue=issue,
+                action_taken="delete",
+                success=True,
+                details=f"Deleted orphaned {issue.table} record {issue.record_id}",
+            )
 
-            elif issue.table == "file_attachments":
-                attachment = (
-                    self.db.query(FileAttachment)
-                    .filter(FileAttachment.id == issue.record_id)
-                    .first()
-                )
-                if attachment:
-                    self.db.delete(attachment)
+        column = model.__table__.c.get(issue.column) if issue.column else None
+        if issue.fix_action == "set NULL" and column is not None:
+            if not self.dry_run:
+                record = self.db.get(model, issue.record_id)
+                if record is not None:
+                    attribute = inspect(model).get_property_by_column(column).key
+                    setattr(record, attribute, None)
+            return RepairAction(
+                issue=issue,
+                action_taken="update",
+                success=True,
+                details=f"Cleared {issue.table}.{issue.column} on record {issue.record_id}",
+            )
 
         return RepairAction(
             issue=issue,
-            action_taken="delete",
-            success=True,
-            details=f"Deleted orphaned {issue.table} record {issue.record_id}",
+            action_taken="skip",
+            success=False,
+            details="Unexpected fix_action",
         )
 
     def _repair_enum_value(self, issue: IntegrityIssue) -> RepairAction:
@@ -275,7 +293,7 @@ class IntegrityRepairer:
                     .first()
                 )
                 if attachment:
-                    self.db.delete(attachment)
+                    self._delete_attachment(attachment)
 
             return RepairAction(
                 issue=issue,
@@ -291,6 +309,29 @@ class IntegrityRepairer:
             details="Requires manual intervention (file not found)",
         )
 
+    def _delete_record(self, record) -> None:
+        """Delete a row through the ORM, so cascades and session hooks run."""
+        if isinstance(record, FileAttachment):
+            self._delete_attachment(record)
+        else:
+            self.db.delete(record)
+
+    def _delete_attachment(self, attachment: FileAttachment) -> None:
+        """Delete an attachment and release its blob, deleting content nothing else uses."""
+        blob_id = attachment.blob_id
+        self.db.delete(attachment)
+        if blob_id is None:
+            return
+        self.db.flush()
+        blob = release_blob(self.db, blob_id)
+        if blob:
+            s3 = None
+            if blob.storage == "s3":
+                from src.services.s3_service import get_s3_service
+
+                s3 = get_s3_service()
+            delete_blob_content(blob, s3)
+
     def interactive_repair_files(
         self, issues: List[IntegrityIssue]
     ) -> List[RepairAction]:
@@ -341,7 +382,7 @@ class IntegrityRepairer:
 
             if choice == "1":
                 if not self.dry_run:
-                    self.db.delete(attachment)
+                    self._delete_attachment(attachment)
                 self.actions.append(
                     RepairAction(
                         issue=issue,
@@ -377,7 +418,7 @@ class IntegrityRepairer:
                         .first()
                     )
                     if rem_attachment and not self.dry_run:
-                        self.db.delete(rem_attachment)
+                        self._delete_attachment(rem_attachment)
                     self.actions.append(
                         RepairAction(
                             issue=rem_issue,
@@ -414,6 +455,81 @@ class IntegrityRepairer:
 
         return self.actions
 
+    def interactive_repair_orphans(
+        self, issues: List[IntegrityIssue]
+    ) -> List[RepairAction]:
+        """Interactively delete orphaned rows that auto-repair leaves for review."""
+        orphan_issues = [
+            i
+            for i in issues
+            if i.category == "foreign_key"
+            and i.fix_action == "delete"
+            and i.table not in AUTO_DELETE_TABLES
+            and i.record_id is not None
+        ]
+
+        if not orphan_issues:
+            return []
+
+        print("\n🔗 Interactive Orphan Repair")
+        print("=" * 60)
+        print(f"Found {len(orphan_issues)} orphaned records requiring manual review")
+        print()
+
+        for issue in orphan_issues:
+            model = _mapped_class(issue.table)
+            record = self.db.get(model, issue.record_id) if model else None
+            if record is None:
+                continue
+
+            print(f"\n🧩 {issue.description}")
+            print()
+            print("Options:")
+            print("  1) Delete this record")
+            print("  2) Keep record (restore the missing parent instead)")
+            print("  3) Skip (decide later)")
+            print("  4) Abort repair")
+
+            choice = input("\nChoice (1-4): ").strip()
+
+            if choice == "1":
+                if not self.dry_run:
+                    self._delete_record(record)
+                self.actions.append(
+                    RepairAction(
+                        issue=issue,
+                        action_taken="delete",
+                        success=True,
+                        details="User chose to delete",
+                    )
+                )
+                print("   ✅ Deleted")
+
+            elif choice == "2":
+                self.actions.append(
+                    RepairAction(
+                        issue=issue,
+                        action_taken="keep",
+                        success=True,
+                        details="User chose to keep record",
+                    )
+                )
+                print("   ℹ️  Kept record")
+
+            elif choice == "3":
+                print("   ⏭️  Skipped")
+                continue
+
+            elif choice == "4":
+                print("   ❌ Repair aborted by user")
+                return self.actions
+
+        if not self.dry_run:
+            self.db.commit()
+            print("\n✅ Interactive repair complete - changes committed")
+
+        return self.actions
+
     def generate_repair_report(self) -> str:
         """Generate a report of repair actions taken."""
         if not self.actions:
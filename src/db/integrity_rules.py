@@ -0,0 +1,246 @@
+"""
+Per-table integrity rules generated from the model metadata.
+
+Every table gets one query that scans it once: each foreign key is checked
+with a LEFT JOIN on its parent table, NOT NULL and enum columns are checked
+for values the models would not write, and the business rules below are
+added as extra conditions. A row is returned only if at least one rule
+fails, with a flag column per rule.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import Enum, MetaData, String, Table, and_, cast, exists, func, null, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.db.enums import MemberStatus
+
+# Tables whose orphaned rows auto-repair may delete; orphans elsewhere are
+# only deleted after review (run_integrity_check.py --interactive)
+AUTO_DELETE_TABLES = frozenset(
+    {"member_employments", "organization_contacts", "file_attachments"}
+)
+
+
+class RowRule:
+    """One condition checked against every row of a table."""
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        severity: str,
+        condition: ColumnElement,
+        description: str,
+        columns: Sequence[ColumnElement] = (),
+        auto_fixable: bool = False,
+        fix_action: Optional[str] = None,
+        column: Optional[str] = None,
+    ):
+        """
+        Initialize the rule.
+
+        Args:
+            name: Unique name within the table (the rule's flag column)
+            category: Issue category (foreign_key, required_field, enum_value, ...)
+            severity: 'critical', 'warning' or 'info'
+            condition: True for rows that break the rule
+            description: Issue text, formatted with the row (id and the labelled columns)
+            columns: Extra labelled columns the description uses
+            auto_fixable: Whether IntegrityRepairer can fix it
+            fix_action: Repair the fix applies
+            column: Column the fix applies to
+        """
+        self.name = name
+        self.category = category
+        self.severity = severity
+        self.condition = condition
+        self.description = description
+        self.columns = tuple(columns)
+        self.auto_fixable = auto_fixable
+        self.fix_action = fix_action
+        self.column = column
+
+
+class TableRules:
+    """Rules for one table plus the outer joins their conditions need."""
+
+    def __init__(self, table: Table):
+        self.table = table
+        self.joins: List[tuple] = []  # (parent alias, ON clause)
+        self.rules: List[RowRule] = []
+
+    @property
+    def record_id(self) -> Optional[ColumnElement]:
+        """Single-column primary key, if the table has one."""
+        pk = list(self.table.primary_key.columns)
+        return pk[0] if len(pk) == 1 else None
+
+    def query(self):
+        """One SELECT returning every row that breaks a rule, with a flag per rule."""
+        record_id = self.record_id
+        flags = [rule.condition.label(rule.name) for rule in self.rules]
+        columns = {column.key: column for rule in self.rules for column in rule.columns}
+        from_clause = self.table
+        for parent, onclause in self.joins:
+            from_clause = from_clause.outerjoin(parent, onclause)
+        return (
+            select(
+                (record_id if record_id is not None else null()).label("record_id"),
+                *flags,
+                *columns.values(),
+            )
+            .select_from(from_clause)
+            .where(or_(*[rule.condition for rule in self.rules]))
+        )
+
+
+def _foreign_key_rules(rules: TableRules) -> None:
+    table = rules.table
+    for index, fk in enumerate(sorted(table.foreign_key_constraints, key=lambda c: c.column_keys)):
+        parent = fk.referred_table.alias(f"fk_{index}_{fk.referred_table.name}")
+        pairs = [(element.parent, parent.c[element.column.key]) for element in fk.elements]
+        rules.joins.append((parent, and_(*[child == parent_col for child, parent_col in pairs])))
+
+        names = "_".join(child.name for child, _ in pairs)
+        nullable = all(child.nullable for child, _ in pairs)
+        rules.rules.append(
+            RowRule(
+                name=f"fk_{names}",
+                category="foreign_key",
+                severity="critical",
+                condition=and_(
+                    *[child.isnot(None) for child, _ in pairs],
+                    pairs[0][1].is_(None),
+                ),
+                description=(
+                    f"{table.name} record {{record_id}} references non-existent "
+                    f"{fk.referred_table.name} ({names}={{{names}_ref}})"
+                ),
+                columns=[pairs[0][0].label(f"{names}_ref")],
+                # Orphans in optional references lose the reference; required ones are deleted
+                auto_fixable=(nullable and len(pairs) == 1)
+                or table.name in AUTO_DELETE_TABLES,
+                fix_action="set NULL" if nullable and len(pairs) == 1 else "delete",
+                column=names if nullable and len(pairs) == 1 else None,
+            )
+        )
+
+
+def _column_rules(rules: TableRules) -> None:
+    table = rules.table
+    for column in table.columns:
+        if column.primary_key:
+            continue
+        if not column.nullable:
+            rules.rules.append(
+                RowRule(
+                    name=f"required_{column.name}",
+                    category="required_field",
+                    severity="critical",
+                    condition=column.is_(None),
+                    description=f"{table.name} record {{record_id}} missing required field {column.name}",
+                )
+            )
+        if isinstance(column.type, Enum) and column.type.enums:
+            value = cast(column, String)
+            rules.rules.append(
+                RowRule(
+                    name=f"enum_{column.name}",
+                    category="enum_value",
+                    severity="critical",
+                    condition=and_(column.isnot(None), value.notin_(list(column.type.enums))),
+                    description=f"{table.name} record {{record_id}} has invalid {column.name}: {{{column.name}_value}}",
+                    columns=[value.label(f"{column.name}_value")],
+                )
+            )
+
+
+def _business_rules(tables: Dict[str, TableRules]) -> None:
+    """Rules that are not visible in the schema."""
+    members = tables["members"].table
+    employments = tables["member_employments"].table
+    attachments = tables["file_attachments"].table
+
+    tables["members"].rules += [
+        RowRule(
+            name="future_hire_date",
+            category="date_logic",
+            severity="warning",
+            condition=members.c.hire_date > func.current_date(),
+            description="Member {record_id} has future hire_date: {hire_date}",
+            columns=[members.c.hire_date],
+        ),
+    ]
+    tables["member_employments"].rules += [
+        RowRule(
+            name="end_before_start",
+            category="date_logic",
+            severity="critical",
+            condition=and_(employments.c.end_date.isnot(None), employments.c.end_date < employments.c.start_date),
+            description="Employment {record_id} has end_date before start_date",
+            auto_fixable=True,
+            fix_action="swap dates or set end_date to NULL",
+        ),
+        RowRule(
+            name="current_with_end_date",
+            category="date_logic",
+            severity="warning",
+            condition=and_(employments.c.is_current.is_(True), employments.c.end_date.isnot(None)),
+            description="Employment {record_id} marked current but has end_date",
+            auto_fixable=True,
+            fix_action="set is_current=False or end_date=NULL",
+        ),
+        # Hourly rate sanity check ($10-$150 range)
+        RowRule(
+            name="unusual_hourly_rate",
+            category="employment_logic",
+            severity="info",
+            condition=or_(employments.c.hourly_rate < 10, employments.c.hourly_rate > 150),
+            description="Employment {record_id} has unusual hourly_rate: ${hourly_rate}",
+            columns=[employments.c.hourly_rate],
+        ),
+    ]
+    # File attachments -> parent records (polymorphic, so not a real foreign key)
+    tables["file_attachments"].rules += [
+        RowRule(
+            name="missing_member_record",
+            category="foreign_key",
+            severity="warning",
+            condition=and_(
+                attachments.c.record_type == "member",
+                ~exists().where(members.c.id == attachments.c.record_id),
+            ),
+            description="File attachment {record_id} references non-existent member record {attachment_record_id}",
+            columns=[attachments.c.record_id.label("attachment_record_id")],
+            auto_fixable=True,
+            fix_action="delete",
+        ),
+    ]
+
+    # Invalid member statuses are reset to active
+    for rule in tables["members"].rules:
+        if rule.name == "enum_status":
+            rule.description = "Member {record_id} has invalid status: {status_value}"
+            rule.auto_fixable = True
+            rule.fix_action = f"set to '{MemberStatus.ACTIVE.value}'"
+
+
+def build_table_rules(
+    metadata: MetaData,
+    include: Optional[Callable[[Table], bool]] = None,
+) -> List[TableRules]:
+    """Rules for every table in the metadata that has any, in dependency order."""
+    tables = {table.name: TableRules(table) for table in metadata.sorted_tables}
+    for rules in tables.values():
+        _foreign_key_rules(rules)
+        _column_rules(rules)
+    if {"members", "member_employments", "file_attachments"} <= set(tables):
+        _business_rules(tables)
+
+    return [
+        rules
+        for rules in tables.values()
+        if rules.rules and (include is None or include(rules.table))
+    ]
+
@@ -0,0 +1,56 @@
+"""Add unique active dues payment per member/period
+
+Revision ID: 3f1c9a7d2b64
+Revises: 813f955b11af
+Create Date: 2026-10-16 09:00:00.000000
+
+Bulk dues generation inserts every missing bill for a period in one
+INSERT ... SELECT ... ON CONFLICT DO NOTHING, which needs a unique index
+on (member_id, period_id) for live (not soft-deleted) rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, Sequence[str], None] = '813f955b11af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+
+    # Fail loudly rather than silently picking a winner among duplicate bills
+    duplicates = conn.execute(
+        sa.text("""
+            SELECT member_id, period_id, COUNT(*)
+            FROM dues_payments
+            WHERE deleted_at IS NULL
+            GROUP BY member_id, period_id
+            HAVING COUNT(*) > 1
+            LIMIT 10
+        """)
+    ).fetchall()
+    if duplicates:
+        raise RuntimeError(
+            "Duplicate live dues payments found (member_id, period_id, count): "
+            f"{[tuple(d) for d in duplicates]}. Soft-delete the extras and re-run."
+        )
+
+    op.create_index(
+        'uq_dues_payments_member_period_active',
+        'dues_payments',
+        ['member_id', 'period_id'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_dues_payments_member_period_active', table_name='dues_payments')
@@ -0,0 +1,56 @@
+"""Add dues period summaries rollup
+
+Revision ID: 9b2e4d6a1c35
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-16 14:00:00.000000
+
+Per-period totals (member count, paid count, total due, total paid) kept
+current on dues payment writes, so the dues summary report reads one row
+per period instead of loading every payment. Backfilled from dues_payments.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e4d6a1c35'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'dues_period_summaries',
+        sa.Column('period_id', sa.Integer(), nullable=False),
+        sa.Column('member_count', sa.Integer(), nullable=False),
+        sa.Column('paid_count', sa.Integer(), nullable=False),
+        sa.Column('total_due', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('total_paid', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['period_id'], ['dues_periods.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('period_id'),
+    )
+
+    op.execute("""
+        INSERT INTO dues_period_summaries
+            (period_id, member_count, paid_count, total_due, total_paid, refreshed_at)
+        SELECT p.id,
+               COUNT(dp.id),
+               COUNT(dp.id) FILTER (WHERE dp.status = 'PAID'),
+               COALESCE(SUM(dp.amount_due), 0),
+               COALESCE(SUM(dp.amount_paid), 0),
+               NOW()
+        FROM dues_periods p
+        LEFT JOIN dues_payments dp
+               ON dp.period_id = p.id AND dp.deleted_at IS NULL
+        GROUP BY p.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('dues_period_summaries')
@@ -0,0 +1,58 @@
+"""Add member search vector
+
+Revision ID: c4d8e2f1a7b9
+Revises: 9b2e4d6a1c35
+Create Date: 2026-10-16 16:00:00.000000
+
+Generated tsvector column over member number, names and email with a GIN
+index, so member search is an index lookup with relevance ranking instead
+of ILIKE '%term%' scans. The (last_name, first_name, id) index serves
+keyset pagination of the unfiltered member list.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8e2f1a7b9'
+down_revision: Union[str, Sequence[str], None] = '9b2e4d6a1c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(member_number, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'B') || "
+    "setweight(to_tsvector('simple', regexp_replace(coalesce(email, ''), '[@._+-]+', ' ', 'g')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'members',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_members_search_vector', 'members', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_members_name_keyset', 'members', ['last_name', 'first_name', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_members_name_keyset', table_name='members')
+    op.drop_index('ix_members_search_vector', table_name='members', postgresql_using='gin')
+    op.drop_column('members', 'search_vector')
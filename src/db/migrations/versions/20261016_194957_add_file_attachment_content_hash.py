@@ -0,0 +1,31 @@
+"""Add file attachment content hash
+
+Revision ID: d5a7c3e9f2b4
+Revises: c4d8e2f1a7b9
+Create Date: 2026-10-16 20:00:00.000000
+
+SHA-256 of each attachment's content, recorded at upload so the resilience
+scan can detect corrupted or truncated files. Existing rows stay NULL until
+they are re-uploaded or backfilled.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a7c3e9f2b4'
+down_revision: Union[str, Sequence[str], None] = 'c4d8e2f1a7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('file_attachments', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('file_attachments', 'content_hash')
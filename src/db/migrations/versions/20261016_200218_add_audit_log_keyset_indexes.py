@@ -0,0 +1,50 @@
+"""Add audit log keyset indexes
+
+Revision ID: e6b8d4f0a3c5
+Revises: d5a7c3e9f2b4
+Create Date: 2026-10-16 20:30:00.000000
+
+Composite indexes ending in (changed_at, id) for keyset pagination of the
+audit log API: the full log, per table, per record trail and per user.
+Each page is a backward index range scan from the cursor, so deep pages
+cost the same as the first. The indexes are built CONCURRENTLY so writes
+to audit_logs are not blocked while they build on a large table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b8d4f0a3c5'
+down_revision: Union[str, Sequence[str], None] = 'd5a7c3e9f2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    'ix_audit_logs_changed_at_id': ['changed_at', 'id'],
+    'ix_audit_logs_table_changed_at': ['table_name', 'changed_at', 'id'],
+    'ix_audit_logs_table_record_changed_at': ['table_name', 'record_id', 'changed_at', 'id'],
+    'ix_audit_logs_changed_by_changed_at': ['changed_by', 'changed_at', 'id'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name, 'audit_logs', columns,
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name, table_name='audit_logs',
+                postgresql_concurrently=True, if_exists=True,
+            )
@@ -0,0 +1,58 @@
+"""Add file blobs
+
+Revision ID: f7c9e1a3b5d6
+Revises: e6b8d4f0a3c5
+Create Date: 2026-10-16 21:30:00.000000
+
+Content-addressed storage for attachments: file_blobs holds one row per
+unique content (SHA-256) and storage backend, with a reference count.
+file_attachments gains blob_id and logical_path (the organized owner path,
+now a name only); file_path keeps pointing at the stored content. Existing
+attachments keep their own files and have no blob.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c9e1a3b5d6'
+down_revision: Union[str, Sequence[str], None] = 'e6b8d4f0a3c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'file_blobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('storage', sa.String(length=10), nullable=False),
+        sa.Column('storage_key', sa.String(length=500), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('content_hash', 'storage', name='uq_file_blobs_content_hash_storage'),
+    )
+    op.create_index(op.f('ix_file_blobs_id'), 'file_blobs', ['id'], unique=False)
+
+    op.add_column('file_attachments', sa.Column('logical_path', sa.String(length=500), nullable=True))
+    op.add_column('file_attachments', sa.Column('blob_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'file_attachments_blob_id_fkey', 'file_attachments', 'file_blobs', ['blob_id'], ['id']
+    )
+    op.create_index(op.f('ix_file_attachments_blob_id'), 'file_attachments', ['blob_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_file_attachments_blob_id'), table_name='file_attachments')
+    op.drop_constraint('file_attachments_blob_id_fkey', 'file_attachments', type_='foreignkey')
+    op.drop_column('file_attachments', 'blob_id')
+    op.drop_column('file_attachments', 'logical_path')
+    op.drop_index(op.f('ix_file_blobs_id'), table_name='file_blobs')
+    op.drop_table('file_blobs')
@@ -0,0 +1,31 @@
+"""Add file blob previews
+
+Revision ID: a8d0f2b4c6e7
+Revises: f7c9e1a3b5d6
+Create Date: 2026-10-16 23:10:00.000000
+
+file_blobs.preview_key records the thumbnail generated in the background
+for a blob's content (image thumbnails and first-page PDF previews), stored
+next to the content. Rows without one fall back to a file-type icon.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d0f2b4c6e7'
+down_revision: Union[str, Sequence[str], None] = 'f7c9e1a3b5d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('file_blobs', sa.Column('preview_key', sa.String(length=500), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('file_blobs', 'preview_key')
@@ -0,0 +1,141 @@
+"""
+Connection pool instrumentation.
+
+Pool event listeners track checkouts, connections currently checked out and
+overflow use; InstrumentedQueuePool times how long callers wait for a
+connection (pool events fire only after a connection is handed out, so the
+wait has to be measured around the pool's own checkout). The sync and async
+engines each get their own PoolMetrics. Snapshots are served on
+/admin/metrics/db-pool and printed in `ip2adb load` reports.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe counters for one connection pool."""
+
+    def __init__(self, wait_sample_size: int = 1000):
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=wait_sample_size)
+        self.pool: Optional[Pool] = None
+        self.checked_out = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear counters; the checked-out count is live state and is kept."""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.peak_checked_out = self.checked_out
+            self.peak_overflow = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self._waits.clear()
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """Record how long one checkout waited for a connection."""
+        with self._lock:
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self._waits.append(seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Current pool state plus counters since the last reset."""
+        with self._lock:
+            waits = sorted(self._waits)
+            wait_count = len(waits)
+            data = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "wait_ms": {
+                    "avg": round(self.total_wait / wait_count * 1000, 3) if wait_count else 0.0,
+                    "p95": round(waits[min(int(wait_count * 0.95), wait_count - 1)] * 1000, 3) if wait_count else 0.0,
+                    "max": round(self.max_wait * 1000, 3),
+                    "samples": wait_count,
+                },
+            }
+
+        if isinstance(self.pool, QueuePool):
+            data["pool"] = {
+                "size": self.pool.size(),
+                "max_overflow": self.pool._max_overflow,
+                "timeout": self.pool.timeout(),
+                "checked_in": self.pool.checkedin(),
+                "checked_out": self.pool.checkedout(),
+                "overflow_in_use": max(self.pool.overflow(), 0),
+            }
+        return data
+
+    def attach(self, pool: Pool) -> None:
+        """Register the event listeners on a pool."""
+        self.pool = pool
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        overflow = self.pool.overflow() if isinstance(self.pool, QueuePool) else 0
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that reports checkout wait time to pool_metrics."""
+
+    metrics = pool_metrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports checkout wait time to async_pool_metrics."""
+
+    metrics = async_pool_metrics
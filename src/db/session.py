@@ -1,18 +1,31 @@
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from src.config.settings import settings
+from src.db.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    async_pool_metrics,
+    pool_metrics,
+)
 
 # Database URL from settings (uses property that handles Railway's postgres:// format)
 DATABASE_URL = settings.database_url
 
-# SQLAlchemy engine with production-ready pool settings
+# SQLAlchemy engine; pool sizing comes from settings (DB_POOL_*)
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before use
-    pool_size=5,
-    max_overflow=10,
+    poolclass=InstrumentedQueuePool,  # QueuePool that records checkout wait time
+    pool_pre_ping=settings.DB_POOL_PRE_PING,  # Verify connections before use
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
+pool_metrics.attach(engine.pool)
 
 # Session factory
 SessionLocal = sessionmaker(
@@ -22,6 +35,28 @@ SessionLocal = sessionmaker(
 )
 
 
+# Async engine (asyncpg) for read-heavy frontend pages, so page queries do not
+# tie up the threadpool; it keeps its own pool with the same DB_POOL_* sizing
+async_engine = create_async_engine(
+    settings.async_database_url,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
+async_pool_metrics.attach(async_engine.sync_engine.pool)
+
+# Async session factory. Objects stay loaded after commit: lazy loads are not
+# possible on an AsyncSession, so relationships must be eager-loaded.
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
 # FastAPI dependency
 def get_db() -> Session:
     """
@@ -34,6 +69,15 @@ def get_db() -> Session:
         db.close()
 
 
+# FastAPI dependency for async routes
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency: yields an AsyncSession and ensures proper cleanup.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # Optional helper for scripts (seeders, maintenance)
 def get_db_session() -> Session:
     """
@@ -11,6 +11,11 @@ from src.config.auth_config import check_jwt_secret_configuration
 
 # Middleware
 from src.middleware import AuditContextMiddleware
+from src.services.audit_writer import audit_writer
+from src.services.preview_jobs import preview_jobs
+from src.core.security import password_hash_pool
+from src.services.report_jobs import report_jobs
+from src.db.session import async_engine
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +76,9 @@ from src.routers.reports import router as reports_router
 from src.routers.documents_frontend import router as documents_frontend_router
 from src.routers.dues_frontend import router as dues_frontend_router
 
+# Admin metrics router
+from src.routers.admin_metrics import router as admin_metrics_router
+
 # ------------------------------------------------------------
 # Initialize FastAPI
 # ------------------------------------------------------------
@@ -114,6 +122,16 @@ async def startup_event():
     logger.info("IP2A Database API started successfully")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Drain queued audit log rows, stop report, preview and password hashing workers and close async connections before the worker exits."""
+    audit_writer.shutdown()
+    report_jobs.shutdown()
+    preview_jobs.shutdown()
+    password_hash_pool.shutdown()
+    await async_engine.dispose()
+
+
 # ------------------------------------------------------------
 # Health check (root handled by frontend router)
 # ------------------------------------------------------------
@@ -191,6 +209,9 @@ app.include_router(documents_frontend_router)
 # Phase 6 Dues Frontend router
 app.include_router(dues_frontend_router)
 
+# Admin metrics router
+app.include_router(admin_metrics_router)
+
 # Frontend routes (HTML pages) - include LAST to not interfere with API routes
 app.include_router(frontend.router)
 
@@ -26,6 +26,7 @@ from src.models.member import Member
 from src.models.member_employment import MemberEmployment
 from src.models.audit_log import AuditLog
 from src.models.file_attachment import FileAttachment
+from src.models.file_blob import FileBlob
 from src.models.salting_activity import SALTingActivity
 from src.models.benevolence_application import BenevolenceApplication
 from src.models.benevolence_review import BenevolenceReview
@@ -34,6 +35,7 @@ from src.models.dues_rate import DuesRate
 from src.models.dues_period import DuesPeriod
 from src.models.dues_payment import DuesPayment
 from src.models.dues_adjustment import DuesAdjustment
+from src.models.dues_period_summary import DuesPeriodSummary
 
 __all__ = [
     "User",
@@ -64,6 +66,7 @@ __all__ = [
     "MemberEmployment",
     "AuditLog",
     "FileAttachment",
+    "FileBlob",
     "SALTingActivity",
     "BenevolenceApplication",
     "BenevolenceReview",
@@ -73,4 +76,5 @@ __all__ = [
     "DuesPeriod",
     "DuesPayment",
     "DuesAdjustment",
+    "DuesPeriodSummary",
 ]
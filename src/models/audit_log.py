@@ -1,6 +1,6 @@
 """AuditLog model - immutable audit trail for legal compliance."""
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, func
+from sqlalchemy import Column, Index, Integer, String, DateTime, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 
 from src.db.base import Base
@@ -15,6 +15,13 @@ class AuditLog(Base):
     """
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Keyset pagination over (changed_at, id), see audit_log_service
+        Index("ix_audit_logs_changed_at_id", "changed_at", "id"),
+        Index("ix_audit_logs_table_changed_at", "table_name", "changed_at", "id"),
+        Index("ix_audit_logs_table_record_changed_at", "table_name", "record_id", "changed_at", "id"),
+        Index("ix_audit_logs_changed_by_changed_at", "changed_by", "changed_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
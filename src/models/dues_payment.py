@@ -1,7 +1,7 @@
 """DuesPayment model for individual dues payment records."""
 
 from decimal import Decimal
-from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric, Text, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric, Text, ForeignKey, Index, Enum as SAEnum, text
 from sqlalchemy.orm import relationship
 
 from src.db.base import Base
@@ -43,6 +43,17 @@ class DuesPayment(Base, TimestampMixin, SoftDeleteMixin):
     processed_by = relationship("User", foreign_keys=[processed_by_id])
     adjustments = relationship("DuesAdjustment", back_populates="payment")
 
+    __table_args__ = (
+        # One live bill per member per period; lets bulk generation use ON CONFLICT DO NOTHING
+        Index(
+            "uq_dues_payments_member_period_active",
+            "member_id",
+            "period_id",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
     @property
     def balance_due(self) -> Decimal:
         """Calculate remaining balance."""
@@ -0,0 +1,33 @@
+"""DuesPeriodSummary model - per-period dues rollup for reporting."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, Numeric, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+
+from src.db.base import Base
+
+
+class DuesPeriodSummary(Base):
+    """
+    Precomputed totals for one dues period.
+
+    Maintained by src/services/dues_summary_service.py whenever dues payments
+    are written, so period and year-over-year summaries read one row per
+    period instead of aggregating every payment.
+    """
+
+    __tablename__ = "dues_period_summaries"
+
+    period_id = Column(Integer, ForeignKey("dues_periods.id", ondelete="CASCADE"), primary_key=True)
+    member_count = Column(Integer, nullable=False, default=0)
+    paid_count = Column(Integer, nullable=False, default=0)
+    total_due = Column(Numeric(12, 2), nullable=False, default=0)
+    total_paid = Column(Numeric(12, 2), nullable=False, default=0)
+    refreshed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Relationships
+    period = relationship("DuesPeriod")
+
+    def __repr__(self):
+        return f"<DuesPeriodSummary(period_id={self.period_id}, members={self.member_count})>"
@@ -1,14 +1,18 @@
 """
 Generic file attachment model for storing files linked to any record.
 
-File storage follows an organized path structure:
+Attachments are named with an organized logical path:
     uploads/{entity_type}s/{Owner_Name_ID}/{category}/{year}/{MM-Month}/{filename}
 
 Example:
     uploads/members/Smith_John_M7464416/grievances/2026/01-January/safety_report.pdf
+
+The content itself is stored once per unique file in a FileBlob; file_path
+is the blob's storage location, shared by every attachment with the same
+content.
 """
 
-from sqlalchemy import Column, Integer, String, Index
+from sqlalchemy import Column, ForeignKey, Integer, String, Index
 
 from src.db.base import Base
 from src.db.mixins import TimestampMixin, SoftDeleteMixin
@@ -43,9 +47,12 @@ class FileAttachment(TimestampMixin, SoftDeleteMixin, Base):
     # File metadata
     file_name = Column(String(255), nullable=False)
     original_name = Column(String(255), nullable=True)  # Original upload name
-    file_path = Column(String(500), nullable=False)  # Path on disk/storage
+    file_path = Column(String(500), nullable=False)  # Path on disk/storage (the blob's location)
+    logical_path = Column(String(500), nullable=True)  # Organized owner path, a name only
     file_type = Column(String(100), nullable=False)  # MIME type
     file_size = Column(Integer, nullable=True)  # Size in bytes
+    content_hash = Column(String(64), nullable=True)  # SHA-256 hex digest, recorded at upload
+    blob_id = Column(Integer, ForeignKey("file_blobs.id"), nullable=True, index=True)  # Shared content
 
     # User-provided description
     description = Column(String(500), nullable=True)
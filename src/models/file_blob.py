@@ -0,0 +1,45 @@
+"""
+Content-addressed file storage shared by file attachments.
+
+Each unique file content is stored once per storage backend, under a key
+derived from its SHA-256, and every FileAttachment with that content points
+at the same blob. ref_count tracks how many attachments do; the content is
+deleted when the last one is hard-deleted (see src/services/blob_store.py).
+
+preview_key points at a small JPEG thumbnail derived from the content and
+stored alongside it (see src/services/preview_jobs.py); it is empty until
+the preview has been generated, and stays empty for content that has none.
+"""
+
+from sqlalchemy import Column, Integer, String, UniqueConstraint
+
+from src.db.base import Base
+from src.db.mixins import TimestampMixin
+
+
+class FileBlob(TimestampMixin, Base):
+    """One stored copy of a file's content."""
+
+    __tablename__ = "file_blobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    content_hash = Column(String(64), nullable=False)  # SHA-256 hex digest
+    storage = Column(String(10), nullable=False)  # 'local' or 's3'
+    storage_key = Column(String(500), nullable=False)  # Path on disk or S3 object key
+    size = Column(Integer, nullable=False)  # Size in bytes
+    ref_count = Column(
+        Integer, nullable=False, server_default="0"
+    )  # Attachments using this blob
+    preview_key = Column(
+        String(500), nullable=True
+    )  # Thumbnail next to the content, once generated
+
+    __table_args__ = (
+        UniqueConstraint(
+            "content_hash", "storage", name="uq_file_blobs_content_hash_storage"
+        ),
+    )
+
+    def __repr__(self):
+        return f"<FileBlob(id={self.id}, storage='{self.storage}', refs={self.ref_count}, hash='{self.content_hash[:12]}')>"
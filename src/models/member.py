@@ -2,8 +2,18 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, Integer, String, Date, Text, Enum as SAEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column,
+    Computed,
+    Index,
+    Integer,
+    String,
+    Date,
+    Text,
+    Enum as SAEnum,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from src.db.base import Base
 from src.db.mixins import TimestampMixin, SoftDeleteMixin
@@ -13,6 +23,15 @@ if TYPE_CHECKING:
     pass
 
 
+# Full-text document for member search: member number (weight A), names (B)
+# and email split into words (C). 'simple' config: no stemming of names.
+MEMBER_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(member_number, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'B') || "
+    "setweight(to_tsvector('simple', regexp_replace(coalesce(email, ''), '[@._+-]+', ' ', 'g')), 'C')"
+)
+
+
 class Member(Base, TimestampMixin, SoftDeleteMixin):
     """Union member entity."""
 
@@ -47,6 +66,11 @@ class Member(Base, TimestampMixin, SoftDeleteMixin):
     # Notes
     notes = Column(Text)
 
+    # Search document, maintained by Postgres (generated column, GIN indexed)
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(MEMBER_SEARCH_VECTOR_SQL, persisted=True))
+    )
+
     # Relationships
     student = relationship("Student", back_populates="member", uselist=False)
     employments = relationship("MemberEmployment", back_populates="member")
@@ -54,5 +78,10 @@ class Member(Base, TimestampMixin, SoftDeleteMixin):
     dues_payments = relationship("DuesPayment", back_populates="member")
     dues_adjustments = relationship("DuesAdjustment", back_populates="member")
 
+    __table_args__ = (
+        Index("ix_members_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_members_name_keyset", "last_name", "first_name", "id"),
+    )
+
     def __repr__(self):
         return f"<Member(id={self.id}, number='{self.member_number}', name='{self.first_name} {self.last_name}')>"
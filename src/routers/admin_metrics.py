@@ -0,0 +1,56 @@
+"""Admin metrics router - runtime instrumentation for capacity planning."""
+
+from fastapi import APIRouter
+
+from src.config.auth_config import auth_settings
+from src.config.settings import settings
+from src.core.security import password_hash_pool
+from src.db.pool_metrics import async_pool_metrics, pool_metrics
+from src.routers.dependencies.auth import AdminUser
+
+router = APIRouter(prefix="/admin/metrics", tags=["Admin Metrics"])
+
+
+@router.get("/db-pool")
+def db_pool_metrics(user: AdminUser, reset: bool = False):
+    """
+    Connection pool metrics for this app process.
+
+    Counters accumulate since process start or the last ``?reset=true``.
+    Pool size + max overflow is the most connections one process opens, so
+    multiply by the worker count when sizing against Postgres max_connections.
+    The async engine (frontend pages) has its own pool, reported under "async".
+    """
+    snapshot = pool_metrics.snapshot()
+    snapshot["async"] = async_pool_metrics.snapshot()
+    snapshot["config"] = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if reset:
+        pool_metrics.reset()
+        async_pool_metrics.reset()
+    return snapshot
+
+
+@router.get("/password-hashing")
+def password_hashing_metrics(user: AdminUser, reset: bool = False):
+    """
+    bcrypt pool metrics for this app process.
+
+    "queued" is the number of hashes waiting for a worker right now and
+    wait_ms how long they waited; sustained queueing at login peaks means
+    AUTH_PASSWORD_HASH_WORKERS is too low for the load (or the cost factor
+    too high for the CPUs).
+    """
+    snapshot = password_hash_pool.snapshot()
+    snapshot["config"] = {
+        "workers": auth_settings.password_hash_workers,
+        "bcrypt_rounds": auth_settings.bcrypt_rounds,
+    }
+    if reset:
+        password_hash_pool.reset()
+    return snapshot
@@ -1,8 +1,13 @@
-"""AuditLogs router for API endpoints (read-only)."""
+"""AuditLogs router for API endpoints (read-only).
 
-from fastapi import APIRouter, Depends, HTTPException
+List endpoints return one page, newest first. When there are more rows the
+X-Next-Cursor response header holds the cursor for the next page; pass it
+back as ?cursor=.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from src.db.session import get_db
 from src.schemas.audit_log import AuditLogRead
@@ -11,10 +16,25 @@ from src.services.audit_log_service import (
     list_audit_logs,
     list_audit_logs_by_table,
     list_audit_logs_by_record,
+    list_audit_logs_by_user,
 )
 
 router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
 
+CURSOR_QUERY = Query(None, description="X-Next-Cursor value from the previous page")
+LIMIT_QUERY = Query(100, ge=1, le=500)
+
+
+def _page(response: Response, list_page, *args) -> List:
+    """Run a keyset list function and expose its next cursor as a header."""
+    try:
+        logs, next_cursor = list_page(*args)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return logs
+
 
 @router.get("/{log_id}", response_model=AuditLogRead)
 def read(log_id: int, db: Session = Depends(get_db)):
@@ -26,20 +46,48 @@ def read(log_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=List[AuditLogRead])
-def list_all(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def list_all(
+    response: Response,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: int = LIMIT_QUERY,
+    db: Session = Depends(get_db),
+):
     """List all audit logs."""
-    return list_audit_logs(db, skip, limit)
+    return _page(response, list_audit_logs, db, cursor, limit)
 
 
 @router.get("/by-table/{table_name}", response_model=List[AuditLogRead])
 def list_by_table(
-    table_name: str, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    table_name: str,
+    response: Response,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: int = LIMIT_QUERY,
+    db: Session = Depends(get_db),
 ):
     """List audit logs for a specific table."""
-    return list_audit_logs_by_table(db, table_name, skip, limit)
+    return _page(response, list_audit_logs_by_table, db, table_name, cursor, limit)
 
 
 @router.get("/by-record/{table_name}/{record_id}", response_model=List[AuditLogRead])
-def list_by_record(table_name: str, record_id: str, db: Session = Depends(get_db)):
-    """List all audit logs for a specific record."""
-    return list_audit_logs_by_record(db, table_name, record_id)
+def list_by_record(
+    table_name: str,
+    record_id: str,
+    response: Response,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: int = LIMIT_QUERY,
+    db: Session = Depends(get_db),
+):
+    """List the audit trail of a specific record."""
+    return _page(response, list_audit_logs_by_record, db, table_name, record_id, cursor, limit)
+
+
+@router.get("/by-user/{changed_by}", response_model=List[AuditLogRead])
+def list_by_user(
+    changed_by: str,
+    response: Response,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: int = LIMIT_QUERY,
+    db: Session = Depends(get_db),
+):
+    """List audit logs written by a specific user."""
+    return _page(response, list_audit_logs_by_user, db, changed_by, cursor, limit)
@@ -1,21 +1,30 @@
-"""Authentication dependencies for FastAPI routes."""
+"""Authentication dependencies for FastAPI routes.
+
+Token signatures are checked once per token (see core.jwt.token_cache), and
+the user is loaded as a single row: relationships such as roles and refresh
+tokens load only when a route touches them.
+"""
 
 from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, lazyload
 
 from src.db.session import get_db
 from src.models.user import User
 from src.core.jwt import verify_access_token, TokenExpiredError, TokenInvalidError
-from src.services.user_service import get_user
 
 
 # HTTP Bearer scheme for token extraction
 security = HTTPBearer(auto_error=False)
 
 
+def _load_user(db: Session, user_id: int) -> Optional[User]:
+    """Load the user row alone, without its eager relationships."""
+    return db.get(User, user_id, options=[lazyload("*")])
+
+
 async def get_current_user(
     credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
     db: Session = Depends(get_db),
@@ -57,7 +66,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = get_user(db, user_id)
+    user = _load_user(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -96,7 +105,7 @@ async def get_current_user_optional(
     try:
         payload = verify_access_token(credentials.credentials)
         user_id = int(payload.get("sub"))
-        user = get_user(db, user_id)
+        user = _load_user(db, user_id)
         if user and user.is_active:
             return user
     except (TokenExpiredError, TokenInvalidError, ValueError, TypeError):
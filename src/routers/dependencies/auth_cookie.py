@@ -1,14 +1,20 @@
 """
 Cookie-based authentication for frontend routes.
 Uses HTTP-only cookies to store JWT tokens securely.
+
+Token signatures are verified once per token (core.jwt.token_cache). The
+user's current state - active, locked, roles - comes from principal_cache,
+so a locked or deactivated account loses access without a users query on
+every request.
 """
 
 from typing import Optional
 import logging
 
-from fastapi import Cookie, HTTPException, Request, Response, status
+from fastapi import Cookie, Depends, HTTPException, Request, Response, status
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from src.core.jwt import (
     verify_access_token,
@@ -17,6 +23,7 @@ from src.core.jwt import (
     create_access_token,
 )
 from src.db.session import get_db
+from src.services.principal_cache import principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +41,10 @@ class AuthenticationRequired:
         self,
         request: Request,
         access_token: Optional[str] = Cookie(default=None),
+        db: Session = Depends(get_db),
     ):
         """
-        Validate the access_token cookie.
+        Validate the access_token cookie and the account behind it.
 
         Returns:
             User dict if valid token
@@ -58,6 +66,13 @@ class AuthenticationRequired:
             if not user_id:
                 return self._handle_unauthorized(request)
 
+            # Locked, deactivated or deleted accounts lose access before their token expires
+            principal = principal_cache.get(int(user_id))
+            if principal is None:
+                principal = await run_in_threadpool(principal_cache.load, db, int(user_id))
+            if principal is None or not principal.is_active or principal.is_locked:
+                return self._handle_unauthorized(request)
+
             # Check if user must change password
             must_change_password = payload.get("must_change_password", False)
             current_path = str(request.url.path)
@@ -69,11 +84,11 @@ class AuthenticationRequired:
                     status_code=status.HTTP_302_FOUND,
                 )
 
-            # Return user info from token (avoid DB call on every request)
+            # User info from the token, with current roles
             return {
                 "id": int(user_id),
                 "email": payload.get("email"),
-                "roles": payload.get("roles", []),
+                "roles": list(principal.roles),
                 "must_change_password": must_change_password,
             }
 
@@ -1,8 +1,9 @@
 """Documents router for file upload and management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Header, Query
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from typing import Optional, List
 
 from src.db.session import get_db
@@ -24,6 +25,22 @@ def get_document_service(db: Session = Depends(get_db)) -> DocumentService:
     return DocumentService(db)
 
 
+def download_response(download: dict) -> Response:
+    """HTTP response for a DocumentService.download_document result."""
+    if download["body"] is None:  # 304 Not Modified or 416 Range Not Satisfiable
+        return Response(status_code=download["status"], headers=download["headers"])
+
+    return StreamingResponse(
+        download["body"],
+        status_code=download["status"],
+        media_type=download["content_type"],
+        headers={
+            **download["headers"],
+            "Content-Disposition": f'attachment; filename="{download["filename"]}"',
+        },
+    )
+
+
 @router.post("/upload", response_model=DocumentUploadResponse, status_code=201)
 async def upload_document(
     file: UploadFile = File(...),
@@ -38,20 +55,13 @@ async def upload_document(
     The file will be stored in S3 and a database record will be created.
     """
     try:
-        # Read file content
-        content = await file.read()
-        size = len(content)
-
-        # Reset file position for upload
-        from io import BytesIO
-        file_obj = BytesIO(content)
-
-        # Upload document
-        attachment = service.upload_document(
-            file_data=file_obj,
+        # Stream the spooled upload to S3 in parts, off the event loop
+        attachment = await run_in_threadpool(
+            service.upload_document,
+            file_data=file.file,
             filename=file.filename or "unnamed",
             content_type=file.content_type or "application/octet-stream",
-            size=size,
+            size=file.size,
             record_type=record_type,
             record_id=record_id,
             category=category,
@@ -61,7 +71,7 @@ async def upload_document(
             raise HTTPException(status_code=500, detail="Failed to upload document")
 
         # Get download URL
-        download_url = service.get_download_url(attachment.id)
+        download_url = await run_in_threadpool(service.get_download_url, attachment.id)
 
         return DocumentUploadResponse(
             id=attachment.id,
@@ -73,6 +83,7 @@ async def upload_document(
             record_type=attachment.record_type,
             record_id=attachment.record_id,
             category=attachment.file_category,
+            content_hash=attachment.content_hash,
             uploaded_at=attachment.created_at,
             download_url=download_url,
         )
@@ -154,6 +165,7 @@ def confirm_upload(
             record_type=attachment.record_type,
             record_id=attachment.record_id,
             category=attachment.file_category,
+            content_hash=attachment.content_hash,
             uploaded_at=attachment.created_at,
         )
 
@@ -161,7 +173,39 @@ def confirm_upload(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get("/{document_id}", response_model=DocumentRead)
+@router.get("/export")
+def export_documents(
+    record_type: Optional[str] = Query(None, description="Type of record (member, grievance, etc.)"),
+    record_id: Optional[int] = Query(None, description="ID of the related record"),
+    category: Optional[str] = Query(None, description="Document category"),
+    service: DocumentService = Depends(get_document_service),
+):
+    """
+    Download every document of a record (or category) as one zip archive.
+
+    The archive is streamed as it is built from the S3 objects.
+    """
+    if not ((record_type and record_id) or category):
+        raise HTTPException(status_code=400, detail="Specify record_type and record_id, or category")
+
+    result = service.export_documents(record_type=record_type, record_id=record_id, category=category)
+    if not result:
+        raise HTTPException(status_code=404, detail="No documents found")
+
+    count, archive = result
+    name = "_".join(str(part) for part in (record_type, record_id, category) if part)
+    return StreamingResponse(
+        archive,
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}_documents.zip"',
+            "X-Document-Count": str(count),
+        },
+    )
+
+
+# Integer-only, so frontend pages under /documents (e.g. /documents/browse) are not captured
+@router.get("/{document_id:int}", response_model=DocumentRead)
 def get_document(
     document_id: int,
     service: DocumentService = Depends(get_document_service),
@@ -181,6 +225,7 @@ def get_document(
         record_type=doc.record_type,
         record_id=doc.record_id,
         category=doc.file_category,
+        content_hash=doc.content_hash,
         uploaded_at=doc.created_at,
         is_deleted=doc.is_deleted,
     )
@@ -214,22 +259,21 @@ def get_download_url(
 @router.get("/{document_id}/download")
 def download_document(
     document_id: int,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None),
     service: DocumentService = Depends(get_document_service),
 ):
-    """Download document content directly (streaming)."""
-    result = service.download_document(document_id)
+    """
+    Download document content directly (streaming).
+
+    Supports single byte ranges (206 Partial Content) and ETag revalidation
+    with If-None-Match (304 Not Modified).
+    """
+    result = service.download_document(document_id, range_header=range_header, if_none_match=if_none_match)
     if not result:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    content, filename, content_type = result
-
-    return StreamingResponse(
-        content,
-        media_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
-    )
+    return download_response(result)
 
 
 @router.delete("/{document_id}")
@@ -272,6 +316,8 @@ def list_documents(
         category=category,
     )
 
+    download_urls = service.get_download_urls(documents)
+
     return DocumentListResponse(
         documents=[
             DocumentRead(
@@ -284,8 +330,10 @@ def list_documents(
                 record_type=doc.record_type,
                 record_id=doc.record_id,
                 category=doc.file_category,
+                content_hash=doc.content_hash,
                 uploaded_at=doc.created_at,
                 is_deleted=doc.is_deleted,
+                download_url=download_urls.get(doc.id),
             )
             for doc in documents
         ],
@@ -7,6 +7,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
 
 from src.db.session import get_db
@@ -17,6 +18,8 @@ from src.services.document_service import DocumentService
 router = APIRouter(prefix="/documents", tags=["documents-frontend"])
 templates = Jinja2Templates(directory="src/templates")
 
+BROWSE_PAGE_SIZE = 25
+
 
 # Entity type configurations
 ENTITY_TYPES = {
@@ -121,20 +124,14 @@ async def handle_upload(
         return current_user
 
     try:
-        # Read file content
-        content = await file.read()
-        size = len(content)
-
-        # Create file attachment
-        from io import BytesIO
-        file_obj = BytesIO(content)
-
+        # Stream the spooled upload to S3 in parts, off the event loop
         service = DocumentService(db)
-        attachment = service.upload_document(
-            file_data=file_obj,
+        attachment = await run_in_threadpool(
+            service.upload_document,
+            file_data=file.file,
             filename=file.filename or "unnamed",
             content_type=file.content_type or "application/octet-stream",
-            size=size,
+            size=file.size,
             record_type=entity_type,
             record_id=entity_id,
             category=category,
@@ -177,23 +174,48 @@ async def handle_upload(
 async def browse_page(
     request: Request,
     entity_type: Optional[str] = Query("all"),
-    entity_id: Optional[int] = Query(None),
+    entity_id: Optional[str] = Query(None),  # The filter input sends "" when empty
     page: int = Query(1, ge=1),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_auth),
 ):
-    """Browse documents - currently shows feature not implemented."""
+    """Browse documents, with thumbnails for images and PDFs whose preview is ready."""
     if isinstance(current_user, RedirectResponse):
         return current_user
 
-    # Feature not implemented - show placeholder page
-    return templates.TemplateResponse(
-        "documents/not_implemented.html",
-        {
-            "request": request,
-            "user": current_user,
-        },
-    )
+    record_type = None if entity_type in (None, "", "all") else entity_type
+    record_id = int(entity_id) if entity_id and entity_id.isdigit() else None
+    service = DocumentService(db)
+
+    def load_page():
+        total = service.count_documents(record_type=record_type, record_id=record_id)
+        documents = service.list_documents(
+            record_type=record_type,
+            record_id=record_id,
+            skip=(page - 1) * BROWSE_PAGE_SIZE,
+            limit=BROWSE_PAGE_SIZE,
+        )
+        # Rows link the small preview, never the original
+        return total, documents, service.get_preview_urls(documents)
+
+    total, documents, preview_urls = await run_in_threadpool(load_page)
+
+    context = {
+        "request": request,
+        "user": current_user,
+        "documents": documents,
+        "preview_urls": preview_urls,
+        "total": total,
+        "page": page,
+        "total_pages": (total + BROWSE_PAGE_SIZE - 1) // BROWSE_PAGE_SIZE,
+        "entity_type": entity_type or "all",
+        "entity_id": record_id,
+        "entity_types": ENTITY_TYPES,
+        "format_file_size": format_file_size,
+    }
+    if request.headers.get("HX-Request") == "true":
+        return templates.TemplateResponse("documents/partials/_file_list.html", context)
+    return templates.TemplateResponse("documents/browse.html", context)
 
 
 # ============================================================
@@ -218,15 +240,10 @@ async def download_redirect(
         return RedirectResponse(url=url)
 
     # Fall back to direct download
-    from fastapi.responses import StreamingResponse
-    result = service.download_document(document_id)
+    from src.routers.documents import download_response
+    result = await run_in_threadpool(service.download_document, document_id)
     if result:
-        content, filename, content_type = result
-        return StreamingResponse(
-            content,
-            media_type=content_type,
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-        )
+        return download_response(result)
 
     return RedirectResponse(url="/documents/browse?error=not_found")
 
@@ -231,15 +231,23 @@ async def generate_periods(
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_auth),
 ):
-    """Generate 12 periods for a year."""
+    """Generate 12 periods for a year and bill members for periods already under way."""
     if isinstance(current_user, RedirectResponse):
         return current_user
 
-    from src.services.dues_period_service import DuesPeriodService
+    from src.services.dues_payment_service import generate_period_dues
+    from src.services.dues_period_service import generate_periods_for_year
 
     try:
-        periods = DuesPeriodService.generate_year_periods(db, year)
-        db.commit()
+        periods = generate_periods_for_year(db, year)
+
+        # Same set-based path as /dues-payments/generate; future periods are
+        # billed later so rate changes before then are picked up
+        today = date.today()
+        bills_created = 0
+        for period in periods:
+            if period.due_date <= today and not period.is_closed:
+                bills_created += generate_period_dues(db, period.id).created
 
         # Return updated table via HTMX
         all_periods, total = DuesFrontendService.get_all_periods(db, year=year)
@@ -254,7 +262,10 @@ async def generate_periods(
                 "format_period_name": DuesFrontendService.format_period_name,
                 "get_status_badge": DuesFrontendService.get_period_status_badge_class,
                 "get_status_text": DuesFrontendService.get_period_status_text,
-                "success_message": f"Generated {len(periods)} periods for {year}",
+                "success_message": (
+                    f"Generated {len(periods)} periods for {year}"
+                    f" ({bills_created:,} dues records created)"
+                ),
             },
         )
     except Exception as e:
@@ -7,6 +7,7 @@ from typing import List, Optional
 from src.db.session import get_db
 from src.db.enums import DuesPaymentStatus
 from src.schemas.dues_payment import (
+    DuesGenerationResult,
     DuesPaymentCreate,
     DuesPaymentRecord,
     DuesPaymentUpdate,
@@ -37,20 +38,21 @@ def create(data: DuesPaymentCreate, db: Session = Depends(get_db)):
     return create_payment_record(db, data)
 
 
-@router.post("/generate/{period_id}", response_model=List[DuesPaymentRead], status_code=201)
+@router.post("/generate/{period_id}", response_model=DuesGenerationResult, status_code=201)
 def generate_for_period(period_id: int, db: Session = Depends(get_db)):
     """Generate dues payment records for all active members for a period."""
     try:
-        payments = generate_period_dues(db, period_id)
-        if not payments:
-            raise HTTPException(
-                status_code=400,
-                detail="No payments generated. Period may not exist or no active members."
-            )
-        return payments
+        result = generate_period_dues(db, period_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    if result.created == 0 and result.already_existing == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="No payments generated. No active members or no dues rate for this period."
+        )
+    return result
+
 
 @router.post("/{payment_id}/record", response_model=DuesPaymentRead)
 def record(
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, UploadFile, File
 import os
 from datetime import datetime
+from starlette.concurrency import run_in_threadpool
+
+from src.services.file_attachment_service import save_uploaded_file
 
 router = APIRouter(prefix="/files", tags=["files"])
 
@@ -15,8 +18,8 @@ async def upload_file(file: UploadFile = File(...)):
     file_name = f"{timestamp}_{file.filename}"
     file_path = os.path.join(UPLOAD_DIR, file_name)
 
-    with open(file_path, "wb") as f:
-        f.write(await file.read())
+    # Chunked copy off the event loop, renamed into place when complete
+    await run_in_threadpool(save_uploaded_file, file_path, file)
 
     return {
         "file_name": file_name,
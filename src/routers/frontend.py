@@ -11,9 +11,11 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from src.db.session import get_db
+from src.db.session import get_async_db, get_db
 from src.routers.dependencies.auth_cookie import (
     require_auth,
     require_auth_api,
@@ -140,7 +142,7 @@ async def login_form_submit(
     bypassing the need for the HTMX json-enc extension which can be unreliable.
     """
     from src.services.auth_service import (
-        authenticate_user,
+        authenticate_user_async,
         create_tokens,
         InvalidCredentialsError,
         AccountLockedError,
@@ -149,7 +151,7 @@ async def login_form_submit(
     from fastapi.responses import JSONResponse
 
     try:
-        user = authenticate_user(db, email, password)
+        user = await authenticate_user_async(db, email, password)
     except InvalidCredentialsError:
         return JSONResponse(
             status_code=401,
@@ -340,7 +342,9 @@ async def setup_submit(
 
     # Create the user account
     try:
-        create_setup_user(
+        # bcrypt runs on its pool; keep the wait off the event loop
+        await run_in_threadpool(
+            create_setup_user,
             db=db,
             email=email,
             password=password,
@@ -403,7 +407,7 @@ async def change_password_submit(
 ):
     """Handle password change submission."""
     from src.models.user import User
-    from src.core.security import hash_password, verify_password
+    from src.core.security import hash_password_async, verify_password_async
     from src.services.auth_service import create_tokens
 
     if not current_user:
@@ -440,7 +444,7 @@ async def change_password_submit(
         return RedirectResponse(url="/login", status_code=302)
 
     # Verify current password
-    if not verify_password(current_password, user.password_hash):
+    if not await verify_password_async(current_password, user.password_hash):
         return templates.TemplateResponse(
             "auth/change_password.html",
             get_template_context(
@@ -449,7 +453,7 @@ async def change_password_submit(
         )
 
     # Update password and clear the flag
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await hash_password_async(new_password)
     user.must_change_password = False
     db.commit()
 
@@ -482,7 +486,7 @@ async def change_password_submit(
 @router.get("/dashboard", response_class=HTMLResponse)
 async def dashboard_page(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render main dashboard with real data."""
@@ -517,7 +521,7 @@ async def dashboard_page(
 @router.get("/api/dashboard/refresh", response_class=HTMLResponse)
 async def dashboard_stats_partial(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth_api),
 ):
     """Return just the stats cards for HTMX refresh."""
@@ -583,7 +587,7 @@ async def dashboard_stats_partial(
 @router.get("/api/dashboard/recent-activity", response_class=HTMLResponse)
 async def recent_activity_partial(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Return recent activity from audit log."""
     from src.services.dashboard_service import DashboardService
@@ -8,8 +8,8 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from src.db.session import get_db
-from src.services.member_frontend_service import MemberFrontendService
+from src.db.session import get_async_db
+from src.services.member_frontend_service import MemberFrontendService, SEARCH_COUNT_CAP
 from src.routers.dependencies.auth_cookie import require_auth
 from src.db.enums import MemberStatus, MemberClassification
 
@@ -25,7 +25,7 @@ templates = Jinja2Templates(directory="src/templates")
 @router.get("", response_class=HTMLResponse)
 async def members_landing_page(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render the members landing page with overview stats."""
@@ -66,7 +66,7 @@ async def members_landing_page(
 @router.get("/stats", response_class=HTMLResponse)
 async def members_stats_partial(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """HTMX partial: Return just the stats cards."""
@@ -97,12 +97,14 @@ async def members_stats_partial(
 @router.get("/search", response_class=HTMLResponse)
 async def members_search_partial(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
     q: Optional[str] = Query(None, description="Search query"),
     status: Optional[str] = Query(None, description="Filter by status"),
     classification: Optional[str] = Query(None, description="Filter by classification"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from the previous page"
+    ),
 ):
     """
     HTMX partial: Return member table body for search results.
@@ -117,11 +119,11 @@ async def members_search_partial(
 
     service = MemberFrontendService(db)
 
-    members, total, total_pages = await service.search_members(
+    members, total, next_cursor = await service.search_members(
         query=q,
         status=status,
         classification=classification,
-        page=page,
+        cursor=cursor,
         per_page=20,
     )
 
@@ -142,8 +144,10 @@ async def members_search_partial(
             "request": request,
             "members_data": members_with_employer,
             "total": total,
-            "total_pages": total_pages,
-            "current_page": page,
+            "total_capped": total > SEARCH_COUNT_CAP,
+            "count_cap": SEARCH_COUNT_CAP,
+            "next_cursor": next_cursor,
+            "is_first_page": not cursor,
             "query": q or "",
             "status_filter": status or "all",
             "classification_filter": classification or "all",
@@ -163,7 +167,7 @@ async def members_search_partial(
 async def member_detail_page(
     request: Request,
     member_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render the full member detail page."""
@@ -220,7 +224,7 @@ async def member_detail_page(
 async def member_edit_modal(
     request: Request,
     member_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """HTMX partial: Return the edit modal content for a member."""
@@ -256,7 +260,7 @@ async def member_edit_modal(
 async def member_employment_partial(
     request: Request,
     member_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """HTMX partial: Return employment history section."""
@@ -284,7 +288,7 @@ async def member_employment_partial(
 async def member_dues_partial(
     request: Request,
     member_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """HTMX partial: Return dues summary section."""
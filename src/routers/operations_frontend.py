@@ -23,7 +23,7 @@ from src.db.enums import (
     SALTingActivityType,
     SALTingOutcome,
 )
-from src.db.session import get_db
+from src.db.session import get_async_db
 from src.routers.dependencies.auth_cookie import require_auth
 from src.services.operations_frontend_service import OperationsFrontendService
 
@@ -40,7 +40,7 @@ templates = Jinja2Templates(directory="src/templates")
 @router.get("", response_class=HTMLResponse)
 async def operations_landing_page(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render operations landing page with overview stats."""
@@ -68,7 +68,7 @@ async def operations_landing_page(
 @router.get("/salting", response_class=HTMLResponse)
 async def salting_list_page(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render SALTing activities list page."""
@@ -97,7 +97,7 @@ async def salting_list_page(
 @router.get("/salting/search", response_class=HTMLResponse)
 async def salting_search_partial(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
     q: Optional[str] = Query(None),
     activity_type: Optional[str] = Query(None),
@@ -141,7 +141,7 @@ async def salting_search_partial(
 async def salting_detail_page(
     request: Request,
     activity_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render SALTing activity detail page."""
@@ -183,7 +183,7 @@ async def salting_detail_page(
 @router.get("/benevolence", response_class=HTMLResponse)
 async def benevolence_list_page(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render benevolence applications list page."""
@@ -212,7 +212,7 @@ async def benevolence_list_page(
 @router.get("/benevolence/search", response_class=HTMLResponse)
 async def benevolence_search_partial(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
     q: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -256,7 +256,7 @@ async def benevolence_search_partial(
 async def benevolence_detail_page(
     request: Request,
     application_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render benevolence application detail page."""
@@ -296,7 +296,7 @@ async def benevolence_detail_page(
 @router.get("/grievances", response_class=HTMLResponse)
 async def grievances_list_page(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render grievances list page."""
@@ -325,7 +325,7 @@ async def grievances_list_page(
 @router.get("/grievances/search", response_class=HTMLResponse)
 async def grievances_search_partial(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
     q: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -370,7 +370,7 @@ async def grievances_search_partial(
 async def grievance_detail_page(
     request: Request,
     grievance_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render grievance detail page."""
@@ -4,18 +4,20 @@ Reports Router - PDF and Excel report generation.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Callable, Optional
 
-from fastapi import APIRouter, Depends, Request, Query
-from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import select, func
 from sqlalchemy.orm import Session, selectinload
 
-from src.db.session import get_db
+from src.db.session import SessionLocal, get_db
 from src.routers.dependencies.auth_cookie import require_auth
 from src.services.report_service import ReportService
-from src.models import Member, DuesPeriod, DuesPayment, Student, Course, Enrollment
+from src.services.dues_summary_service import get_period_summaries
+from src.services.report_jobs import ReportJob, ReportJobStatus, report_cache_key, report_jobs
+from src.models import Member, DuesPayment, Student, Course, Enrollment
 from src.models import SALTingActivity, Grievance
 from src.db.enums import MemberStatus, DuesPaymentStatus, StudentStatus, GrievanceStatus
 
@@ -41,6 +43,17 @@ def get_file_extension(format: str) -> str:
     return ""
 
 
+def _stream_rows(stmt, batch_size: int = 1000):
+    """
+    Yield result rows in batches from a server-side cursor.
+
+    Runs on its own session: the request-scoped session from get_db is
+    closed before a StreamingResponse body is sent.
+    """
+    with SessionLocal() as session:
+        yield from session.execute(stmt.execution_options(yield_per=batch_size))
+
+
 # ============================================================
 # Reports Landing Page
 # ============================================================
@@ -95,6 +108,98 @@ async def reports_landing(
     )
 
 
+# ============================================================
+# Report Jobs (PDF rendering)
+# ============================================================
+
+
+def _pdf_job_response(
+    request: Request,
+    current_user: dict,
+    report_type: str,
+    params: dict,
+    data_version: Any,
+    filename: str,
+    render_html: Callable[[], str],
+):
+    """
+    Serve a PDF report from the cache, or queue it and return the job status.
+
+    render_html is only called on a cache miss, so cached reports skip the
+    report query as well as the render. Plain navigation to a cached report
+    downloads it directly; everything else gets the polling job page.
+
+    Rendered reports are stamped with the user who generated them, so each
+    user's copy is cached separately.
+    """
+    params = {**params, "generated_by": current_user.get("email")}
+    job_id = report_cache_key(report_type, params, data_version)
+    is_htmx = request.headers.get("HX-Request") == "true"
+
+    cached_path = report_jobs.cached_path(job_id)
+    if cached_path and not is_htmx:
+        return FileResponse(cached_path, media_type=get_content_type("pdf"), filename=filename)
+
+    job = report_jobs.get(job_id)
+    if job is None or job.status == ReportJobStatus.FAILED:
+        job = report_jobs.submit(job_id, report_type, filename, render_html())
+
+    return _job_status_response(request, current_user, job)
+
+
+def _job_status_response(request: Request, current_user: dict, job: ReportJob):
+    """Job status partial for HTMX polling, or the full job page."""
+    template = (
+        "reports/partials/_job_status.html"
+        if request.headers.get("HX-Request") == "true"
+        else "reports/job.html"
+    )
+    return templates.TemplateResponse(
+        template, {"request": request, "current_user": current_user, "job": job}
+    )
+
+
+@router.get("/jobs/{job_id}", response_class=HTMLResponse)
+async def report_job_status(
+    request: Request,
+    job_id: str,
+    current_user: dict = Depends(require_auth),
+):
+    """Report job status (polled by HTMX until the PDF is ready)."""
+    if isinstance(current_user, RedirectResponse):
+        return HTMLResponse(
+            "Session expired",
+            status_code=401,
+            headers={"HX-Redirect": "/auth/login?next=/reports"},
+        )
+
+    job = report_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found")
+
+    return _job_status_response(request, current_user, job)
+
+
+@router.get("/jobs/{job_id}/download")
+async def report_job_download(
+    job_id: str,
+    current_user: dict = Depends(require_auth),
+):
+    """Download a finished report."""
+    if isinstance(current_user, RedirectResponse):
+        return current_user
+
+    job = report_jobs.get(job_id)
+    if job is None or job.status != ReportJobStatus.DONE:
+        raise HTTPException(status_code=404, detail="Report not ready")
+
+    return FileResponse(
+        report_jobs.cached_path(job_id),
+        media_type=get_content_type("pdf"),
+        filename=job.filename,
+    )
+
+
 # ============================================================
 # Member Reports
 # ============================================================
@@ -123,64 +228,77 @@ async def member_roster_report(
             pass
 
     stmt = stmt.order_by(Member.last_name, Member.first_name)
-    result = db.execute(stmt)
-    members = result.scalars().all()
 
     if format == "excel":
-        # Excel format
-        data = []
-        for m in members:
-            data.append({
-                "member_number": m.member_number or "",
-                "last_name": m.last_name,
-                "first_name": m.first_name,
-                "email": m.email or "",
-                "phone": m.phone or "",
-                "classification": m.classification.value if m.classification else "",
-                "status": m.status.value if m.status else "",
-                "hire_date": m.hire_date.strftime("%Y-%m-%d") if m.hire_date else "",
-            })
-
+        # Excel format - streamed row by row from a server-side cursor
         columns = [
-            {"key": "member_number", "header": "Member #"},
-            {"key": "last_name", "header": "Last Name"},
-            {"key": "first_name", "header": "First Name"},
-            {"key": "email", "header": "Email"},
-            {"key": "phone", "header": "Phone"},
-            {"key": "classification", "header": "Classification"},
-            {"key": "status", "header": "Status"},
-            {"key": "hire_date", "header": "Hire Date"},
+            {"key": "member_number", "header": "Member #", "width": 14},
+            {"key": "last_name", "header": "Last Name", "width": 20},
+            {"key": "first_name", "header": "First Name", "width": 20},
+            {"key": "email", "header": "Email", "width": 32},
+            {"key": "phone", "header": "Phone", "width": 16},
+            {"key": "classification", "header": "Classification", "width": 18},
+            {"key": "status", "header": "Status", "width": 12},
+            {"key": "hire_date", "header": "Hire Date", "width": 12},
         ]
-
-        excel_bytes = ReportService.generate_excel(
-            data, columns, sheet_name="Members", title="Member Roster"
+        roster_stmt = stmt.with_only_columns(
+            Member.member_number,
+            Member.last_name,
+            Member.first_name,
+            Member.email,
+            Member.phone,
+            Member.classification,
+            Member.status,
+            Member.hire_date,
         )
 
+        def roster_rows():
+            for m in _stream_rows(roster_stmt):
+                yield {
+                    "member_number": m.member_number or "",
+                    "last_name": m.last_name,
+                    "first_name": m.first_name,
+                    "email": m.email or "",
+                    "phone": m.phone or "",
+                    "classification": m.classification.value if m.classification else "",
+                    "status": m.status.value if m.status else "",
+                    "hire_date": m.hire_date.strftime("%Y-%m-%d") if m.hire_date else "",
+                }
+
         filename = f"member_roster_{datetime.now().strftime('%Y%m%d')}.xlsx"
-        return Response(
-            content=excel_bytes,
+        return StreamingResponse(
+            ReportService.stream_excel(
+                roster_rows(), columns, sheet_name="Members", title="Member Roster"
+            ),
             media_type=get_content_type("excel"),
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
     else:
-        # PDF format
-        html_content = templates.get_template("reports/member_roster.html").render(
-            title="Member Roster",
-            subtitle=f"{len(members)} members",
-            generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
-            generated_by=current_user.get("email"),
-            members=members,
-            format_phone=ReportService.format_phone,
-        )
-
-        pdf_bytes = ReportService.generate_pdf(html_content)
-
-        filename = f"member_roster_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return Response(
-            content=pdf_bytes,
-            media_type=get_content_type("pdf"),
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        # PDF format - rendered off the event loop by the report job queue
+        version_stmt = stmt.with_only_columns(
+            func.count(Member.id), func.max(Member.updated_at)
+        ).order_by(None)
+
+        def render_html() -> str:
+            members = db.execute(stmt).scalars().all()
+            return templates.get_template("reports/member_roster.html").render(
+                title="Member Roster",
+                subtitle=f"{len(members)} members",
+                generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+                generated_by=current_user.get("email"),
+                members=members,
+                format_phone=ReportService.format_phone,
+            )
+
+        return _pdf_job_response(
+            request,
+            current_user,
+            report_type="member_roster",
+            params={"status": status},
+            data_version=list(db.execute(version_stmt).one()),
+            filename=f"member_roster_{datetime.now().strftime('%Y%m%d')}.pdf",
+            render_html=render_html,
         )
 
 
@@ -205,41 +323,8 @@ async def dues_summary_report(
     if not year:
         year = datetime.now().year
 
-    # Get periods for the year
-    stmt = (
-        select(DuesPeriod)
-        .where(DuesPeriod.period_year == year)
-        .order_by(DuesPeriod.period_month)
-    )
-    result = db.execute(stmt)
-    periods = result.scalars().all()
-
-    # Calculate stats for each period
-    period_stats = []
-    month_names = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                   'July', 'August', 'September', 'October', 'November', 'December']
-
-    for period in periods:
-        # Get payments for this period
-        payments_stmt = select(DuesPayment).where(DuesPayment.period_id == period.id)
-        payments_result = db.execute(payments_stmt)
-        payments = payments_result.scalars().all()
-
-        total_due = sum(p.amount_due for p in payments) if payments else Decimal("0")
-        total_paid = sum(p.amount_paid or Decimal("0") for p in payments) if payments else Decimal("0")
-        member_count = len(payments)
-        paid_count = sum(1 for p in payments if p.status == DuesPaymentStatus.PAID)
-
-        period_stats.append({
-            "period_name": f"{month_names[period.period_month]} {period.period_year}",
-            "month": period.period_month,
-            "is_closed": period.is_closed,
-            "total_due": total_due,
-            "total_paid": total_paid,
-            "collection_rate": (total_paid / total_due * 100) if total_due > 0 else Decimal("0"),
-            "member_count": member_count,
-            "paid_count": paid_count,
-        })
+    # One row per period from the dues rollup
+    period_stats = get_period_summaries(db, year)
 
     # Calculate totals
     grand_total_due = sum(p["total_due"] for p in period_stats)
@@ -280,26 +365,29 @@ async def dues_summary_report(
         )
 
     else:
-        html_content = templates.get_template("reports/dues_summary.html").render(
-            title=f"Dues Summary - {year}",
-            subtitle=f"{len(periods)} periods",
-            generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
-            generated_by=current_user.get("email"),
-            year=year,
-            period_stats=period_stats,
-            grand_total_due=grand_total_due,
-            grand_total_paid=grand_total_paid,
-            grand_collection_rate=(grand_total_paid / grand_total_due * 100) if grand_total_due > 0 else Decimal("0"),
-            format_currency=ReportService.format_currency,
-        )
-
-        pdf_bytes = ReportService.generate_pdf(html_content)
-
-        filename = f"dues_summary_{year}.pdf"
-        return Response(
-            content=pdf_bytes,
-            media_type=get_content_type("pdf"),
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        def render_html() -> str:
+            return templates.get_template("reports/dues_summary.html").render(
+                title=f"Dues Summary - {year}",
+                subtitle=f"{len(period_stats)} periods",
+                generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+                generated_by=current_user.get("email"),
+                year=year,
+                period_stats=period_stats,
+                grand_total_due=grand_total_due,
+                grand_total_paid=grand_total_paid,
+                grand_collection_rate=(grand_total_paid / grand_total_due * 100) if grand_total_due > 0 else Decimal("0"),
+                format_currency=ReportService.format_currency,
+            )
+
+        # The rollup rows are small, so they are the data version themselves
+        return _pdf_job_response(
+            request,
+            current_user,
+            report_type="dues_summary",
+            params={"year": year},
+            data_version=period_stats,
+            filename=f"dues_summary_{year}.pdf",
+            render_html=render_html,
         )
 
 
@@ -314,22 +402,8 @@ async def overdue_report(
     if isinstance(current_user, RedirectResponse):
         return current_user
 
-    # Get overdue payments with member info
-    stmt = (
-        select(DuesPayment)
-        .options(selectinload(DuesPayment.member), selectinload(DuesPayment.period))
-        .where(DuesPayment.status == DuesPaymentStatus.OVERDUE)
-    )
-    result = db.execute(stmt)
-    overdue_payments = result.scalars().all()
-
-    # Sort by member name
-    overdue_payments = sorted(
-        overdue_payments,
-        key=lambda p: (p.member.last_name if p.member else "", p.member.first_name if p.member else "")
-    )
-
     if format == "excel":
+        overdue_payments = _load_overdue_payments(db)
         data = []
         for payment in overdue_payments:
             member = payment.member
@@ -368,31 +442,53 @@ async def overdue_report(
         )
 
     else:
-        # Calculate totals
-        total_overdue = sum(
-            p.amount_due - (p.amount_paid or Decimal("0"))
-            for p in overdue_payments
+        version_stmt = (
+            select(func.count(DuesPayment.id), func.max(DuesPayment.updated_at), func.max(Member.updated_at))
+            .outerjoin(Member, Member.id == DuesPayment.member_id)
+            .where(DuesPayment.status == DuesPaymentStatus.OVERDUE)
         )
 
-        html_content = templates.get_template("reports/overdue_report.html").render(
-            title="Overdue Members Report",
-            subtitle=f"{len(overdue_payments)} overdue payments",
-            generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
-            generated_by=current_user.get("email"),
-            overdue_payments=overdue_payments,
-            total_overdue=total_overdue,
-            format_currency=ReportService.format_currency,
-            format_phone=ReportService.format_phone,
+        def render_html() -> str:
+            overdue_payments = _load_overdue_payments(db)
+            total_overdue = sum(
+                p.amount_due - (p.amount_paid or Decimal("0"))
+                for p in overdue_payments
+            )
+            return templates.get_template("reports/overdue_report.html").render(
+                title="Overdue Members Report",
+                subtitle=f"{len(overdue_payments)} overdue payments",
+                generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+                generated_by=current_user.get("email"),
+                overdue_payments=overdue_payments,
+                total_overdue=total_overdue,
+                format_currency=ReportService.format_currency,
+                format_phone=ReportService.format_phone,
+            )
+
+        return _pdf_job_response(
+            request,
+            current_user,
+            report_type="overdue_report",
+            params={},
+            data_version=list(db.execute(version_stmt).one()),
+            filename=f"overdue_report_{datetime.now().strftime('%Y%m%d')}.pdf",
+            render_html=render_html,
         )
 
-        pdf_bytes = ReportService.generate_pdf(html_content)
 
-        filename = f"overdue_report_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return Response(
-            content=pdf_bytes,
-            media_type=get_content_type("pdf"),
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
+def _load_overdue_payments(db: Session) -> list:
+    """Overdue payments with member and period loaded, sorted by member name."""
+    stmt = (
+        select(DuesPayment)
+        .options(selectinload(DuesPayment.member), selectinload(DuesPayment.period))
+        .where(DuesPayment.status == DuesPaymentStatus.OVERDUE)
+    )
+    overdue_payments = db.execute(stmt).scalars().all()
+
+    return sorted(
+        overdue_payments,
+        key=lambda p: (p.member.last_name if p.member else "", p.member.first_name if p.member else "")
+    )
 
 
 # ============================================================
@@ -469,34 +565,36 @@ async def grievance_report(
     if isinstance(current_user, RedirectResponse):
         return current_user
 
-    # Get all grievances
-    stmt = select(Grievance).options(selectinload(Grievance.member)).order_by(Grievance.filed_date.desc())
-    result = db.execute(stmt)
-    grievances = result.scalars().all()
-
-    # Count by status
-    status_counts = {}
-    for g in grievances:
-        status = g.status.value if g.status else "unknown"
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-    html_content = templates.get_template("reports/grievance_summary.html").render(
-        title="Grievance Summary Report",
-        subtitle=f"{len(grievances)} total grievances",
-        generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
-        generated_by=current_user.get("email"),
-        grievances=grievances,
-        status_counts=status_counts,
-        format_date=ReportService.format_date,
-    )
+    version_stmt = select(func.count(Grievance.id), func.max(Grievance.updated_at))
 
-    pdf_bytes = ReportService.generate_pdf(html_content)
+    def render_html() -> str:
+        stmt = select(Grievance).options(selectinload(Grievance.member)).order_by(Grievance.filed_date.desc())
+        grievances = db.execute(stmt).scalars().all()
 
-    filename = f"grievance_report_{datetime.now().strftime('%Y%m%d')}.pdf"
-    return Response(
-        content=pdf_bytes,
-        media_type=get_content_type("pdf"),
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        # Count by status
+        status_counts = {}
+        for g in grievances:
+            status = g.status.value if g.status else "unknown"
+            status_counts[status] = status_counts.get(status, 0) + 1
+
+        return templates.get_template("reports/grievance_summary.html").render(
+            title="Grievance Summary Report",
+            subtitle=f"{len(grievances)} total grievances",
+            generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+            generated_by=current_user.get("email"),
+            grievances=grievances,
+            status_counts=status_counts,
+            format_date=ReportService.format_date,
+        )
+
+    return _pdf_job_response(
+        request,
+        current_user,
+        report_type="grievance_summary",
+        params={},
+        data_version=list(db.execute(version_stmt).one()),
+        filename=f"grievance_report_{datetime.now().strftime('%Y%m%d')}.pdf",
+        render_html=render_html,
     )
 
 
@@ -8,7 +8,7 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from src.db.session import get_db
+from src.db.session import get_async_db
 from src.services.training_frontend_service import TrainingFrontendService
 from src.routers.dependencies.auth_cookie import require_auth
 from src.db.enums import StudentStatus
@@ -25,7 +25,7 @@ templates = Jinja2Templates(directory="src/templates")
 @router.get("", response_class=HTMLResponse)
 async def training_landing(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render the training landing/overview page."""
@@ -60,7 +60,7 @@ async def training_landing(
 @router.get("/students", response_class=HTMLResponse)
 async def student_list_page(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
     q: Optional[str] = Query(None),
     status: Optional[str] = Query("all"),
@@ -110,7 +110,7 @@ async def student_list_page(
 @router.get("/students/search", response_class=HTMLResponse)
 async def student_search_partial(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
     q: Optional[str] = Query(None),
     status: Optional[str] = Query("all"),
@@ -158,7 +158,7 @@ async def student_search_partial(
 async def student_detail_page(
     request: Request,
     student_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render the student detail page."""
@@ -195,7 +195,7 @@ async def student_detail_page(
 @router.get("/courses", response_class=HTMLResponse)
 async def course_list_page(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render the course list page."""
@@ -226,7 +226,7 @@ async def course_list_page(
 async def course_detail_page(
     request: Request,
     course_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(require_auth),
 ):
     """Render the course detail page."""
@@ -17,6 +17,7 @@ class DocumentUploadResponse(BaseModel):
     record_type: str
     record_id: int
     category: Optional[str] = None
+    content_hash: Optional[str] = Field(None, description="SHA-256 of the file content")
     uploaded_at: datetime
     download_url: Optional[str] = None
 
@@ -33,9 +34,11 @@ class DocumentRead(BaseModel):
     record_type: str
     record_id: int
     category: Optional[str] = None
+    content_hash: Optional[str] = None
     uploaded_by: Optional[str] = None
     uploaded_at: datetime
     is_deleted: bool = False
+    download_url: Optional[str] = None
 
     class Config:
         from_attributes = True
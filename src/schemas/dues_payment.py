@@ -76,3 +76,21 @@ class MemberDuesSummary(BaseModel):
     balance: Decimal
     periods_overdue: int
     last_payment_date: Optional[date]
+
+
+class DuesGenerationResult(BaseModel):
+    """Counts returned by bulk dues generation for a period."""
+    period_id: int
+    active_members: int
+    created: int
+    already_existing: int
+    skipped_no_rate: int
+
+
+class OverdueSweepResult(BaseModel):
+    """Metrics from one overdue status sweep."""
+    as_of: date
+    updated: int
+    batches: int
+    duration_seconds: float
+    dry_run: bool = False
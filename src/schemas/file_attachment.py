@@ -18,6 +18,7 @@ class FileAttachmentResponse(FileAttachmentBase):
     file_name: str
     original_name: str | None = None
     file_path: str
+    logical_path: str | None = None
     file_type: str
     file_size: int | None
     created_at: datetime
@@ -1,5 +1,9 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import Table, func, select, text
+from typing import Iterable, Iterator, Optional, Sequence
+import hashlib
+import io
+import itertools
 import random
 from faker import Faker
 
@@ -13,6 +17,30 @@ def init_seed(seed: int | None = None):
     if seed is not None:
         random.seed(seed)
         faker.seed_instance(seed)
+        Faker.seed(seed)  # Shared generator behind the per-module Faker() instances
+
+
+def derive_seed(seed: int, *parts) -> int:
+    """
+    Stable seed for one piece of generated data, e.g. derive_seed(42, "members", 3).
+
+    Shards seeded this way produce the same rows whichever process (or how
+    many processes) generate them.
+    """
+    key = ":".join(str(part) for part in (seed, *parts))
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+
+
+def shard_random(seed: int, *parts) -> random.Random:
+    """Independent random generator for one shard."""
+    return random.Random(derive_seed(seed, *parts))
+
+
+def shard_faker(seed: int, *parts) -> Faker:
+    """Independent Faker instance for one shard."""
+    shard_fake = Faker()
+    shard_fake.seed_instance(derive_seed(seed, *parts))
+    return shard_fake
 
 
 def clear_table(db: Session, table_name: str, cascade: bool = False):
@@ -39,14 +67,170 @@ def add_records(db: Session, records: list, batch_size: int = None):
     """
     if batch_size is None or len(records) <= batch_size:
         # Add all at once for small datasets
-        for record in records:
-            db.add(record)
+        db.add_all(records)
         db.commit()
     else:
         # Add in batches for large datasets
         for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            for record in batch:
-                db.add(record)
+            db.add_all(records[i:i + batch_size])
             db.commit()
-            db.flush()  # Clear session between batches
+
+
+# ------------------------------------------------------------
+# Bulk loading (stress seeds)
+# ------------------------------------------------------------
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value) -> str:
+    """Format one value for COPY ... FROM STDIN (text format)."""
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class _CopyStream(io.RawIOBase):
+    """File-like view of COPY lines, generated as the driver reads them."""
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = "".join(itertools.islice(self._lines, 1000))
+            if not chunk:
+                break
+            self._buffer += chunk.encode("utf-8")
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def copy_records(
+    db: Session,
+    table: Table,
+    columns: Sequence[str],
+    rows: Iterable[tuple],
+    batch_size: int = 5000,
+) -> int:
+    """
+    Bulk load rows (tuples in `columns` order) into a table and commit.
+
+    On PostgreSQL the rows are streamed through COPY FROM STDIN as they are
+    generated, so memory stays flat however many rows the generator yields.
+    Other databases (SQLite in tests) get batched executemany INSERTs.
+    Python-side column defaults (created_at, is_deleted, ...) are filled in
+    once per call; ORM events do not fire.
+
+    Args:
+        db: Database session
+        table: Target table (e.g. Member.__table__)
+        columns: Column names, in tuple order
+        rows: Iterable of row tuples; a generator is consumed lazily
+        batch_size: Rows per executemany batch (fallback path only)
+
+    Returns:
+        Number of rows loaded
+    """
+    # Python-side defaults are not applied by COPY; use one value per load
+    defaults = {}
+    for column in table.columns:
+        if column.name in columns or column.default is None or column.primary_key:
+            continue
+        default = column.default
+        defaults[column.name] = default.arg(None) if default.is_callable else default.arg
+    all_columns = list(columns) + list(defaults)
+    default_values = tuple(defaults.values())
+
+    connection = db.connection()
+    dbapi_connection = connection.connection.dbapi_connection
+    cursor = dbapi_connection.cursor()
+
+    if connection.dialect.name != "postgresql" or not hasattr(cursor, "copy_expert"):
+        cursor.close()
+        return _insert_records(db, table, all_columns, rows, default_values, batch_size)
+
+    dialect = connection.dialect
+    processors = [table.c[name].type.bind_processor(dialect) for name in all_columns]
+    count = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal count
+        for row in rows:
+            values = row + default_values
+            count += 1
+            yield "\t".join(
+                _copy_value(process(value) if process and value is not None else value)
+                for process, value in zip(processors, values)
+            ) + "\n"
+
+    column_list = ", ".join(f'"{name}"' for name in all_columns)
+    try:
+        cursor.copy_expert(
+            f"COPY {table.name} ({column_list}) FROM STDIN", _CopyStream(lines()), size=65536
+        )
+    finally:
+        cursor.close()
+    db.commit()
+    return count
+
+
+def _insert_records(
+    db: Session,
+    table: Table,
+    columns: Sequence[str],
+    rows: Iterable[tuple],
+    default_values: tuple,
+    batch_size: int,
+) -> int:
+    """executemany fallback for copy_records."""
+    count = 0
+    rows = iter(rows)
+    while True:
+        batch = [dict(zip(columns, row + default_values)) for row in itertools.islice(rows, batch_size)]
+        if not batch:
+            break
+        db.execute(table.insert(), batch)
+        count += len(batch)
+    db.commit()
+    return count
+
+
+def new_ids(db: Session, table: Table, after_id: Optional[int]) -> list:
+    """Ids of rows inserted after after_id (a max(id) taken before the load), in order."""
+    stmt = select(table.c.id).order_by(table.c.id)
+    if after_id is not None:
+        stmt = stmt.where(table.c.id > after_id)
+    return list(db.execute(stmt).scalars())
+
+
+def max_id(db: Session, table: Table) -> Optional[int]:
+    """Current max(id) of a table, or None if empty."""
+    return db.execute(select(func.max(table.c.id))).scalar()
+
+
+def sync_id_sequence(db: Session, table: Table) -> None:
+    """
+    Move a table's id sequence past rows loaded with explicit ids and commit.
+
+    No-op on databases without sequences.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    db.execute(
+        text(
+            f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+            f"COALESCE((SELECT max(id) FROM {table.name}), 0) + 1, false)"
+        )
+    )
+    db.commit()
@@ -19,6 +19,7 @@ from src.models.dues_payment import DuesPayment
 from src.models.dues_adjustment import DuesAdjustment
 from src.models.member import Member
 from src.models.user import User
+from src.services.dues_summary_service import refresh_period_summaries
 from .base_seed import add_records
 
 fake = Faker()
@@ -261,6 +262,10 @@ def run_dues_seed(db: Session, verbose: bool = False):
     payments = seed_dues_payments(db, periods)
     adjustments = seed_dues_adjustments(db, payments)
 
+    # Payments are already rolled up on flush; this also covers empty periods
+    refresh_period_summaries(db)
+    db.commit()
+
     if verbose:
         print(f"✅ Dues seeding complete: {len(rates)} rates, {len(periods)} periods, {len(payments)} payments, {len(adjustments)} adjustments")
 
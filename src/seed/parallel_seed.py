@@ -0,0 +1,144 @@
+"""
+Dependency-aware phase scheduler for the stress seed.
+
+A phase either runs in the parent process (small, ORM-based phases such as
+locations or students) or plans a list of shards. Shards are top-level
+functions called as func(db, **kwargs) on their own session, in a spawn
+process pool when workers > 1 and inline otherwise.
+
+Shard sizes and seeds never depend on the worker count (see
+base_seed.derive_seed), so a seed loads the same rows with any number of
+workers; only the wall-clock time changes.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+Shard = Tuple[Callable[..., int], dict]
+
+
+class SeedPhase:
+    """One step of a seed run and the phases it waits for."""
+
+    def __init__(
+        self,
+        name: str,
+        depends_on: Sequence[str] = (),
+        run: Optional[Callable[[Session], None]] = None,
+        plan: Optional[Callable[[Session], List[Shard]]] = None,
+        finish: Optional[Callable[[Session], None]] = None,
+    ):
+        """
+        Initialize the phase.
+
+        Args:
+            name: Phase name, referenced by depends_on
+            depends_on: Phases that must finish first
+            run: Runs the whole phase in the parent process
+            plan: Returns the phase's shards (used instead of run)
+            finish: Runs in the parent once every shard has been loaded
+        """
+        if (run is None) == (plan is None):
+            raise ValueError(f"Phase {name} needs exactly one of run or plan")
+        self.name = name
+        self.depends_on = tuple(depends_on)
+        self.run = run
+        self.plan = plan
+        self.finish = finish
+
+
+def _run_shard(func: Callable[..., int], kwargs: dict) -> int:
+    """Load one shard on its own session. Runs in a worker process."""
+    from src.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return func(db, **kwargs)
+    finally:
+        db.close()
+
+
+def run_phases(db: Session, phases: Sequence[SeedPhase], workers: int = 1) -> Dict[str, float]:
+    """
+    Run phases in dependency order, loading shards on up to `workers` processes.
+
+    Sharded phases are started as soon as their dependencies finish, so
+    parent-side phases run while workers load shards.
+
+    Returns:
+        Seconds from the start of the run until each phase finished
+    """
+    by_name = {phase.name: phase for phase in phases}
+    for phase in phases:
+        unknown = set(phase.depends_on) - set(by_name)
+        if unknown:
+            raise ValueError(f"Phase {phase.name} depends on unknown phases: {sorted(unknown)}")
+
+    started = time.perf_counter()
+    finished: Dict[str, float] = {}
+    remaining: Dict[str, int] = {}  # Shards still loading, per phase
+    futures: Dict[Future, str] = {}
+    executor = None
+    if workers > 1:
+        # spawn: each worker gets a fresh engine instead of copies of the parent's connections
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def complete(phase: SeedPhase) -> None:
+        if phase.finish is not None:
+            phase.finish(db)
+        finished[phase.name] = time.perf_counter() - started
+        print(f"   ⏱️  {phase.name} done at {finished[phase.name]:.1f}s")
+
+    try:
+        while len(finished) < len(phases):
+            ready = [
+                phase
+                for phase in phases
+                if phase.name not in finished
+                and phase.name not in remaining
+                and all(dep in finished for dep in phase.depends_on)
+            ]
+
+            # Start every ready sharded phase before blocking on a parent-side one
+            for phase in (p for p in ready if p.plan is not None):
+                shards = phase.plan(db)
+                if executor is None:
+                    for func, kwargs in shards:
+                        func(db, **kwargs)
+                    complete(phase)
+                    continue
+                remaining[phase.name] = len(shards)
+                for func, kwargs in shards:
+                    futures[executor.submit(_run_shard, func, kwargs)] = phase.name
+                if not shards:
+                    del remaining[phase.name]
+                    complete(phase)
+
+            serial = [p for p in ready if p.run is not None]
+            if serial:
+                serial[0].run(db)
+                complete(serial[0])
+                continue
+
+            if not futures:
+                if any(p.plan is not None for p in ready):
+                    continue  # Finishing an inline phase may have unblocked others
+                raise RuntimeError("Seed phases have a dependency cycle")
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures.pop(future)
+                future.result()  # Re-raise a failed shard
+                remaining[name] -= 1
+                if remaining[name] == 0:
+                    del remaining[name]
+                    complete(by_name[name])
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return finished
@@ -34,6 +34,7 @@ def seed_students(db: Session, count: int = 500):
             MemberClassification.APPRENTICE_4TH_YEAR,
             MemberClassification.APPRENTICE_5TH_YEAR,
         ]))
+        .order_by(Member.id)
         .limit(count)
         .all()
     )
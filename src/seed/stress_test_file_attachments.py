@@ -1,16 +1,34 @@
 """Stress test seed for file attachments - realistic file sizes and types."""
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from faker import Faker
+from typing import List, Sequence
 import random
 
 from src.models.file_attachment import FileAttachment
 from src.models.member import Member
 from src.models.student import Student
 from src.models.organization import Organization
-from .base_seed import add_records
+from .base_seed import copy_records, max_id, shard_random, sync_id_sequence
 
-fake = Faker()
+# Word pool for original file names (Faker calls per row are slow). Faker's
+# default word list, so it is the same in every process.
+NAME_WORDS = sorted(set(Faker().get_words_list()))
+
+# Records per attachment shard
+ATTACHMENT_SHARD_SIZE = 1000
+
+ATTACHMENT_COLUMNS = (
+    "record_type",
+    "record_id",
+    "file_name",
+    "original_name",
+    "file_path",
+    "file_type",
+    "file_size",
+    "description",
+)
 
 
 # File type configurations with realistic size ranges (in bytes)
@@ -158,195 +176,211 @@ GRIEVANCE_FILE_TYPES = {
 
 
 def generate_file_attachment(
-    record_type: str, record_id: int, file_category: str = None
-):
-    """Generate a single realistic file attachment."""
+    record_type: str, record_id: int, file_category: str, rng: random.Random
+) -> tuple:
+    """Generate a single realistic file attachment row (ATTACHMENT_COLUMNS order)."""
 
     # Choose file type category
-    if file_category:
-        file_config = FILE_TYPES.get(file_category) or GRIEVANCE_FILE_TYPES.get(
-            file_category
-        )
-    else:
-        file_config = random.choice(list(FILE_TYPES.values()))
+    file_config = FILE_TYPES.get(file_category) or GRIEVANCE_FILE_TYPES.get(file_category)
 
     # Generate file metadata
-    extension = random.choice(file_config["extensions"])
-    file_size = random.randint(*file_config["size_range"])
-    description = random.choice(file_config["descriptions"])
+    extension = rng.choice(file_config["extensions"])
+    file_size = rng.randint(*file_config["size_range"])
+    description = rng.choice(file_config["descriptions"])
 
     # Generate realistic file path
-    year = random.randint(2015, 2026)
-    month = random.randint(1, 12)
-    file_hash = fake.uuid4()[:16]
-    original_name = f"{fake.word()}_{fake.word()}{extension}"
+    year = rng.randint(2015, 2026)
+    month = rng.randint(1, 12)
+    file_hash = f"{rng.getrandbits(64):016x}"
+    original_name = f"{rng.choice(NAME_WORDS)}_{rng.choice(NAME_WORDS)}{extension}"
     file_path = f"uploads/{record_type}/{year}/{month:02d}/{file_hash}{extension}"
 
-    return FileAttachment(
-        record_type=record_type,
-        record_id=record_id,
-        file_name=f"{file_hash}{extension}",
-        original_name=original_name,
-        file_path=file_path,
-        file_type=file_config["mime"],
-        file_size=file_size,
-        description=description,
+    return (
+        record_type,
+        record_id,
+        f"{file_hash}{extension}",
+        original_name,
+        file_path,
+        file_config["mime"],
+        file_size,
+        description,
     )
 
 
-def stress_test_file_attachments(db: Session):
+# Common file types for members: the first files each member gets
+MEMBER_COMMON_TYPES = [
+    "photo_id",  # ID photo
+    "pdf_scan",  # Scanned license
+    "pdf_form",  # Membership form
+    "pdf_report",  # Training certificate
+    "doc_word",  # Resume or application
+]
+
+# Students get mostly forms, photos, and reports
+STUDENT_TYPES = ["photo_id", "pdf_form", "pdf_scan", "pdf_report", "doc_word", "image_small"]
+
+# Organizations get contracts, licenses, reports
+ORGANIZATION_TYPES = ["pdf_scan", "pdf_report", "doc_word", "doc_excel", "image_small"]
+
+
+def _file_count(record_type: str, rng: random.Random) -> int:
+    """How many files one record gets."""
+    if record_type == "member":
+        return rng.randint(1, 20)  # Minimum 1 file, maximum 20 per member (user requirement)
+    if record_type == "student":
+        return rng.randint(5, 15)
+    if record_type == "organization":
+        return rng.randint(2, 10)
+    # Grievances: most have 1-20 files, but 10% have 20-50
+    return rng.randint(20, 50) if rng.random() < 0.1 else rng.randint(1, 20)
+
+
+def _file_category(record_type: str, file_idx: int, rng: random.Random) -> str:
+    """File type for the file_idx-th attachment of a record."""
+    if record_type == "member":
+        # First few files are common required types; additional files are random
+        if file_idx < len(MEMBER_COMMON_TYPES):
+            return MEMBER_COMMON_TYPES[file_idx]
+        return rng.choice(list(FILE_TYPES.keys()))
+    if record_type == "student":
+        return rng.choice(STUDENT_TYPES)
+    if record_type == "organization":
+        return rng.choice(ORGANIZATION_TYPES)
+    return rng.choice(list(GRIEVANCE_FILE_TYPES.keys()))
+
+
+def generate_attachment_rows(
+    record_type: str,
+    record_ids: Sequence[int],
+    file_counts: Sequence[int],
+    rng: random.Random,
+):
+    """Yield attachment rows (ATTACHMENT_COLUMNS order) for one kind of record."""
+    for record_id, num_files in zip(record_ids, file_counts):
+        for file_idx in range(num_files):
+            yield generate_file_attachment(
+                record_type, record_id, _file_category(record_type, file_idx, rng), rng
+            )
+
+
+def seed_attachment_shard(
+    db: Session,
+    seed: int,
+    record_type: str,
+    shard: int,
+    record_ids: Sequence[int],
+    file_counts: Sequence[int],
+    id_start: int,
+) -> int:
     """
-    Generate file attachments for all entities.
+    Generate and load one shard of attachments, ids from id_start.
 
-    - Members: 1-20 documents each (certifications, IDs, forms, photos) - per user requirement
-    - Students: 5-15 documents each (applications, photos, forms)
-    - Organizations: 2-10 documents each (contracts, licenses)
-    - Grievances: 1-50 files each (statements, evidence, correspondence)
+    Returns:
+        Number of attachments loaded
     """
+    rng = shard_random(seed, "attachments", record_type, shard)
+    rows = (
+        (attachment_id, *row)
+        for attachment_id, row in enumerate(
+            generate_attachment_rows(record_type, record_ids, file_counts, rng), id_start
+        )
+    )
+    return copy_records(db, FileAttachment.__table__, ("id", *ATTACHMENT_COLUMNS), rows)
 
-    # Get all entities
-    members = db.query(Member).all()
-    students = db.query(Student).all()
-    organizations = db.query(Organization).all()
 
-    if not members and not students and not organizations:
-        print("   ⚠️  No entities found for file attachments")
-        return []
-
-    attachments = []
-    total_size_bytes = 0
-    member_file_count = 0
-    student_file_count = 0
-    org_file_count = 0
-
-    print("   Generating file attachments for entities...")
-    print("   This will take several minutes...")
-
-    # === MEMBERS: 1-20 documents each ===
-    if members:
-        print(f"   Processing {len(members)} members (1-20 files each)...")
-
-        for idx, member in enumerate(members):
-            # Minimum 1 file, maximum 20 per member (user requirement)
-            num_files = random.randint(1, 20)
-
-            member_files = []
-
-            # Common file types for members (weighted selection)
-            common_types = [
-                "photo_id",  # ID photo
-                "pdf_scan",  # Scanned license
-                "pdf_form",  # Membership form
-                "pdf_report",  # Training certificate
-                "doc_word",  # Resume or application
-            ]
-
-            # For members with fewer files, prioritize common types
-            # For members with more files, add variety
-            for file_idx in range(num_files):
-                if file_idx < len(common_types) and file_idx < 5:
-                    # First few files are common required types
-                    file_type = common_types[file_idx]
-                else:
-                    # Additional files are random
-                    file_type = random.choice(list(FILE_TYPES.keys()))
-                attachment = generate_file_attachment("member", member.id, file_type)
-                member_files.append(attachment)
-                total_size_bytes += attachment.file_size
-
-            attachments.extend(member_files)
-            member_file_count += len(member_files)
-
-            # Progress indicator
-            if (idx + 1) % 1000 == 0:
-                print(f"      {idx + 1}/{len(members)} members processed...")
-
-        print(
-            f"   ✅ Generated {member_file_count:,} files for members (avg {member_file_count / len(members):.1f} per member)"
-        )
+def plan_attachment_shards(
+    seed: int,
+    member_ids: Sequence[int],
+    student_ids: Sequence[int],
+    organization_ids: Sequence[int],
+    id_offset: int = 0,
+) -> List[dict]:
+    """
+    Keyword arguments for seed_attachment_shard, one dict per shard.
 
-    # === STUDENTS: 5-15 documents each ===
-    if students:
-        print(f"   Processing {len(students)} students (5-15 files each)...")
-
-        for student in students:
-            num_files = random.randint(5, 15)
-
-            for _ in range(num_files):
-                # Students get mostly forms, photos, and reports
-                file_type = random.choice(
-                    [
-                        "photo_id",
-                        "pdf_form",
-                        "pdf_scan",
-                        "pdf_report",
-                        "doc_word",
-                        "image_small",
-                    ]
-                )
-                attachment = generate_file_attachment("student", student.id, file_type)
-                attachments.append(attachment)
-                student_file_count += 1
-                total_size_bytes += attachment.file_size
-
-        print(
-            f"   ✅ Generated {student_file_count:,} files for students (avg {student_file_count / len(students):.1f} per student)"
-        )
+    - Members: 1-20 documents each (certifications, IDs, forms, photos)
+    - Students: 5-15 documents each (applications, photos, forms)
+    - Organizations: 2-10 documents each (contracts, licenses)
+    - Grievances: 1-50 files each, for 50-200 simulated grievance ids
 
-    # === ORGANIZATIONS: 2-10 documents each ===
-    if organizations:
-        print(f"   Processing {len(organizations)} organizations (2-10 files each)...")
-
-        for org in organizations:
-            num_files = random.randint(2, 10)
-
-            for _ in range(num_files):
-                # Organizations get contracts, licenses, reports
-                file_type = random.choice(
-                    ["pdf_scan", "pdf_report", "doc_word", "doc_excel", "image_small"]
-                )
-                attachment = generate_file_attachment("organization", org.id, file_type)
-                attachments.append(attachment)
-                org_file_count += 1
-                total_size_bytes += attachment.file_size
-
-        print(
-            f"   ✅ Generated {org_file_count:,} files for organizations (avg {org_file_count / len(organizations):.1f} per org)"
-        )
+    File counts come from their own per-shard stream, so every shard's id
+    range is known up front.
+    """
+    # Note: grievance files are linked by simulated ids, not real grievances
+    num_grievances = shard_random(seed, "grievances").randint(50, 200)
+    record_sets = [
+        ("member", list(member_ids)),
+        ("student", list(student_ids)),
+        ("organization", list(organization_ids)),
+        ("grievance", list(range(1, num_grievances + 1))),
+    ]
+
+    shards = []
+    id_start = id_offset + 1
+    for record_type, record_ids in record_sets:
+        for shard, start in enumerate(range(0, len(record_ids), ATTACHMENT_SHARD_SIZE)):
+            shard_ids = record_ids[start:start + ATTACHMENT_SHARD_SIZE]
+            rng = shard_random(seed, "attachment_counts", record_type, shard)
+            file_counts = [_file_count(record_type, rng) for _ in shard_ids]
+            shards.append({
+                "seed": seed,
+                "record_type": record_type,
+                "shard": shard,
+                "record_ids": shard_ids,
+                "file_counts": file_counts,
+                "id_start": id_start,
+            })
+            id_start += sum(file_counts)
+    return shards
+
+
+def stress_test_file_attachments(db: Session, seed: int = 42) -> int:
+    """
+    Generate file attachments for all entities, one shard at a time.
 
-    # === GRIEVANCES: 1-50 files each (simulate some grievances) ===
-    # Note: We'll create grievance files even without a grievance table yet
-    # This simulates future grievance functionality
-    num_grievances = random.randint(50, 200)
-    print(f"   Generating {num_grievances} simulated grievances (1-50 files each)...")
-
-    for grievance_id in range(1, num_grievances + 1):
-        # Most grievances have 5-15 files, but some have up to 50
-        if random.random() < 0.1:  # 10% chance
-            num_files = random.randint(20, 50)
-        else:
-            num_files = random.randint(1, 20)
-
-        for _ in range(num_files):
-            file_type = random.choice(list(GRIEVANCE_FILE_TYPES.keys()))
-            attachment = generate_file_attachment("grievance", grievance_id, file_type)
-            attachments.append(attachment)
-            total_size_bytes += attachment.file_size
-
-    print("   ✅ Generated grievance files")
-
-    # Add all attachments to database
-    print(f"   Adding {len(attachments):,} file attachments to database...")
-    print(f"   Total simulated file size: {total_size_bytes / (1024**3):.2f} GB")
-
-    add_records(db, attachments, batch_size=1000)
-
-    print(f"   ✅ Seeded {len(attachments):,} file attachments")
-    print("   📊 Storage breakdown:")
-    print(f"      • Members: {member_file_count:,} files (1-20 per member)")
-    print(f"      • Students: {student_file_count:,} files")
-    print(f"      • Organizations: {org_file_count:,} files")
-    print("      • Grievances: varies (1-50 per grievance)")
-    print(f"      • Total size: {total_size_bytes / (1024**3):.2f} GB")
-
-    return attachments
+    Rows are streamed into the database as they are generated.
+
+    Returns:
+        Number of attachments created
+    """
+    # Only ids are needed to link attachments
+    member_ids = list(db.execute(select(Member.id).order_by(Member.id)).scalars())
+    student_ids = list(db.execute(select(Student.id).order_by(Student.id)).scalars())
+    organization_ids = list(db.execute(select(Organization.id).order_by(Organization.id)).scalars())
+
+    if not member_ids and not student_ids and not organization_ids:
+        print("   ⚠️  No entities found for file attachments")
+        return 0
+
+    print("   Generating and loading file attachments for entities...")
+    shards = plan_attachment_shards(
+        seed,
+        member_ids,
+        student_ids,
+        organization_ids,
+        id_offset=max_id(db, FileAttachment.__table__) or 0,
+    )
+    loaded = sum(seed_attachment_shard(db, **shard) for shard in shards)
+    sync_id_sequence(db, FileAttachment.__table__)
+
+    print_attachment_summary(shards)
+    return loaded
+
+
+def print_attachment_summary(shards: List[dict]) -> None:
+    """Print files per record type for a set of planned (and loaded) shards."""
+    files = {}
+    records = {}
+    for shard in shards:
+        record_type = shard["record_type"]
+        files[record_type] = files.get(record_type, 0) + sum(shard["file_counts"])
+        records[record_type] = records.get(record_type, 0) + len(shard["record_ids"])
+
+    print(f"   ✅ Seeded {sum(files.values()):,} file attachments")
+    print("   📊 Breakdown:")
+    for record_type in ("member", "student", "organization", "grievance"):
+        if records.get(record_type):
+            print(
+                f"      • {record_type.title()}s: {files[record_type]:,} files "
+                f"(avg {files[record_type] / records[record_type]:.1f} per {record_type})"
+            )
@@ -1,140 +1,210 @@
 """Stress test seed for member employments - massive scale."""
 
 from sqlalchemy.orm import Session
-from faker import Faker
-from datetime import timedelta
+from datetime import date, timedelta
 from decimal import Decimal
+from typing import List, Sequence
 import random
 
 from src.models.member_employment import MemberEmployment
-from .base_seed import add_records
-
-fake = Faker()
-
-
-def stress_test_member_employments(
-    db: Session,
-    members: list,
-    employers: list,
-    min_jobs: int = 1,
-    max_jobs: int = 100,
-    employer_repeat_rate: float = 0.20,
-):
+from .base_seed import copy_records, max_id, shard_random, sync_id_sequence
+from .stress_test_members import MEMBER_SHARD_SIZE
+
+EMPLOYMENT_COLUMNS = (
+    "member_id",
+    "organization_id",
+    "start_date",
+    "end_date",
+    "job_title",
+    "hourly_rate",
+    "is_current",
+)
+
+JOB_TITLES = [
+    "Electrician",
+    "Apprentice Electrician",
+    "Journeyman Electrician",
+    "Foreman",
+    "General Foreman",
+    "Lead Electrician",
+    "Senior Electrician",
+    "Field Electrician",
+    "Maintenance Electrician",
+    "Construction Electrician",
+    "Industrial Electrician",
+]
+
+
+def employment_job_counts(
+    seed: int, shard: int, shard_members: int, min_jobs: int, max_jobs: int
+) -> List[int]:
     """
-    Generate employment records for members.
+    Jobs per member for one shard of members.
 
-    Args:
-        members: List of Member objects
-        employers: List of Organization objects (employers only)
-        min_jobs: Minimum jobs per member (default: 1)
-        max_jobs: Maximum jobs per member (default: 100)
-        employer_repeat_rate: Chance of returning to previous employer (default: 0.20 = 20%)
+    Drawn from their own stream so the scheduler can size every shard (and
+    reserve its id range) before any rows are generated.
     """
-    if not members or not employers:
-        print("   ⚠️  No members or employers found")
-        return []
-
-    employments = []
-    job_titles = [
-        "Electrician",
-        "Apprentice Electrician",
-        "Journeyman Electrician",
-        "Foreman",
-        "General Foreman",
-        "Lead Electrician",
-        "Senior Electrician",
-        "Field Electrician",
-        "Maintenance Electrician",
-        "Construction Electrician",
-        "Industrial Electrician",
-    ]
-
-    total_members = len(members)
-    estimated_records = (
-        sum([random.randint(min_jobs, max_jobs) for _ in range(100)])
-        * total_members
-        // 100
-    )
-
-    print(f"   Generating employment records for {total_members} members...")
-    print(f"   Estimated ~{estimated_records:,} employment records...")
-    print("   This will take several minutes. Progress updates every 1000 members...")
-
-    records_generated = 0
-
-    for member_idx, member in enumerate(members):
-        # Each member gets 1-100 jobs (weighted towards fewer jobs)
-        # Use triangular distribution weighted towards lower numbers
-        num_jobs = int(
-            random.triangular(
-                min_jobs, max_jobs, min_jobs + (max_jobs - min_jobs) * 0.3
-            )
-        )
+    rng = shard_random(seed, "employment_counts", shard)
+    # Each member gets 1-100 jobs (weighted towards fewer jobs)
+    # Use triangular distribution weighted towards lower numbers
+    mode = min_jobs + (max_jobs - min_jobs) * 0.3
+    return [int(rng.triangular(min_jobs, max_jobs, mode)) for _ in range(shard_members)]
+
+
+def generate_employment_rows(
+    member_ids: Sequence[int],
+    job_counts: Sequence[int],
+    employer_ids: Sequence[int],
+    employer_repeat_rate: float,
+    rng: random.Random,
+):
+    """Yield employment rows (EMPLOYMENT_COLUMNS order) member by member."""
+    # Plain random calls: Faker's per-call overhead dominates at this volume
+    today = date.today()
+    earliest_start = today - timedelta(days=365 * 20)
+    start_span = (today - earliest_start).days  # start dates: last 20 years, up to yesterday
 
+    for member_id, num_jobs in zip(member_ids, job_counts):
         member_employers = []  # Track employers for this member for repeat rate
-        member_job_history = []
 
         for job_idx in range(num_jobs):
             # 20% chance to work for a previous employer again (if they have history)
-            if member_employers and fake.boolean(
-                chance_of_getting_true=int(employer_repeat_rate * 100)
-            ):
-                employer = random.choice(member_employers)
+            if member_employers and rng.random() < employer_repeat_rate:
+                employer_id = rng.choice(member_employers)
             else:
-                employer = random.choice(employers)
-                if employer not in member_employers:
-                    member_employers.append(employer)
+                employer_id = rng.choice(employer_ids)
+                if employer_id not in member_employers:
+                    member_employers.append(employer_id)
 
             # Most recent job is current for active members
-            is_current = (job_idx == num_jobs - 1) and fake.boolean(
-                chance_of_getting_true=65
-            )
+            is_current = (job_idx == num_jobs - 1) and rng.random() < 0.65
 
             # Start date - spread over last 20 years
-            start_date = fake.date_between(start_date="-20y", end_date="-1d")
+            start_date = earliest_start + timedelta(days=rng.randrange(start_span))
 
             # End date (if not current)
             end_date = None
             if not is_current:
                 # Employment duration: 1 month to 5 years
-                days_employed = fake.random_int(min=30, max=1825)
-                end_date = start_date + timedelta(days=days_employed)
+                end_date = start_date + timedelta(days=rng.randint(30, 1825))
 
             # Hourly rate ($18-$75/hr range for electricians at all levels)
             hourly_rate = None
-            if fake.boolean(chance_of_getting_true=75):
-                base_rate = fake.random_int(min=18, max=75)
-                cents = fake.random_int(min=0, max=99)
-                hourly_rate = Decimal(f"{base_rate}.{cents:02d}")
-
-            employment = MemberEmployment(
-                member_id=member.id,
-                organization_id=employer.id,
-                start_date=start_date,
-                end_date=end_date,
-                job_title=fake.random_element(job_titles)
-                if fake.boolean(chance_of_getting_true=90)
-                else None,
-                hourly_rate=hourly_rate,
-                is_current=is_current,
-            )
-            member_job_history.append(employment)
-
-        employments.extend(member_job_history)
-        records_generated += len(member_job_history)
-
-        # Progress indicator every 1000 members
-        if (member_idx + 1) % 1000 == 0:
-            print(
-                f"      {member_idx + 1}/{total_members} members processed ({records_generated:,} records generated)..."
-            )
-
-    print(f"   Adding {len(employments):,} employment records to database...")
-    print("   This will take several minutes. Please wait...")
-
-    # Add in large batches for performance
-    add_records(db, employments, batch_size=1000)
-
-    print(f"   ✅ Seeded {len(employments):,} member employment records")
-    print(f"   Average jobs per member: {len(employments) / len(members):.1f}")
-    return employments
+            if rng.random() < 0.75:
+                hourly_rate = Decimal(f"{rng.randint(18, 75)}.{rng.randint(0, 99):02d}")
+
+            job_title = rng.choice(JOB_TITLES) if rng.random() < 0.90 else None
+
+            yield (member_id, employer_id, start_date, end_date, job_title, hourly_rate, is_current)
+
+
+def seed_employment_shard(
+    db: Session,
+    seed: int,
+    shard: int,
+    member_ids: Sequence[int],
+    job_counts: Sequence[int],
+    employer_ids: Sequence[int],
+    employer_repeat_rate: float,
+    id_start: int,
+) -> int:
+    """
+    Generate and load one shard's employment records, ids from id_start.
+
+    Returns:
+        Number of employment records loaded
+    """
+    rng = shard_random(seed, "employments", shard)
+    rows = (
+        (employment_id, *row)
+        for employment_id, row in enumerate(
+            generate_employment_rows(member_ids, job_counts, employer_ids, employer_repeat_rate, rng),
+            id_start,
+        )
+    )
+    return copy_records(db, MemberEmployment.__table__, ("id", *EMPLOYMENT_COLUMNS), rows)
+
+
+def plan_employment_shards(
+    seed: int,
+    member_ids: Sequence[int],
+    employer_ids: Sequence[int],
+    min_jobs: int,
+    max_jobs: int,
+    employer_repeat_rate: float,
+    id_offset: int = 0,
+) -> List[dict]:
+    """
+    Keyword arguments for seed_employment_shard, one dict per shard of members.
+
+    Shards follow MEMBER_SHARD_SIZE and get consecutive id ranges.
+    """
+    shards = []
+    id_start = id_offset + 1
+    for shard, start in enumerate(range(0, len(member_ids), MEMBER_SHARD_SIZE)):
+        shard_member_ids = list(member_ids[start:start + MEMBER_SHARD_SIZE])
+        job_counts = employment_job_counts(seed, shard, len(shard_member_ids), min_jobs, max_jobs)
+        shards.append({
+            "seed": seed,
+            "shard": shard,
+            "member_ids": shard_member_ids,
+            "job_counts": job_counts,
+            "employer_ids": list(employer_ids),
+            "employer_repeat_rate": employer_repeat_rate,
+            "id_start": id_start,
+        })
+        id_start += sum(job_counts)
+    return shards
+
+
+def stress_test_member_employments(
+    db: Session,
+    member_ids: Sequence[int],
+    employer_ids: Sequence[int],
+    min_jobs: int = 1,
+    max_jobs: int = 100,
+    employer_repeat_rate: float = 0.20,
+    seed: int = 42,
+) -> int:
+    """
+    Generate employment records for members, one shard at a time.
+
+    Rows are streamed into the database as they are generated; foreign keys
+    come straight from the id lists.
+
+    Args:
+        member_ids: Ids of members to give employment history
+        employer_ids: Ids of employer organizations
+        min_jobs: Minimum jobs per member (default: 1)
+        max_jobs: Maximum jobs per member (default: 100)
+        employer_repeat_rate: Chance of returning to previous employer (default: 0.20 = 20%)
+        seed: Base seed for the shards
+
+    Returns:
+        Number of employment records created
+    """
+    if not member_ids or not employer_ids:
+        print("   ⚠️  No members or employers found")
+        return 0
+
+    total_members = len(member_ids)
+    print(f"   Generating and loading employment records for {total_members} members...")
+
+    shards = plan_employment_shards(
+        seed,
+        member_ids,
+        employer_ids,
+        min_jobs,
+        max_jobs,
+        employer_repeat_rate,
+        id_offset=max_id(db, MemberEmployment.__table__) or 0,
+    )
+    loaded = 0
+    for shard in shards:
+        loaded += seed_employment_shard(db, **shard)
+        print(f"      shard {shard['shard'] + 1}/{len(shards)} loaded ({loaded:,} records)...")
+    sync_id_sequence(db, MemberEmployment.__table__)
+
+    print(f"   ✅ Seeded {loaded:,} member employment records")
+    print(f"   Average jobs per member: {loaded / total_members:.1f}")
+    return loaded
@@ -6,21 +6,50 @@ from collections import OrderedDict
 
 from src.models.member import Member
 from src.db.enums import MemberStatus, MemberClassification
-from .base_seed import add_records
-
-fake = Faker()
-
-
-def stress_test_members(db: Session, count: int = 10000):
-    """Generate 10,000 union members with complete data."""
-    members = []
-
-    classifications = list(MemberClassification)
+from .base_seed import copy_records, max_id, shard_faker, sync_id_sequence
+
+# Members per shard; fixed so generated data does not depend on the worker count
+MEMBER_SHARD_SIZE = 1000
+
+MEMBER_COLUMNS = (
+    "member_number",
+    "first_name",
+    "last_name",
+    "middle_name",
+    "address",
+    "city",
+    "state",
+    "zip_code",
+    "phone",
+    "email",
+    "date_of_birth",
+    "hire_date",
+    "status",
+    "classification",
+    "notes",
+)
+
+# Weight classification towards journeyman and apprentices
+CLASSIFICATION_WEIGHTS = OrderedDict(
+    [
+        (MemberClassification.APPRENTICE_1ST_YEAR, 0.10),
+        (MemberClassification.APPRENTICE_2ND_YEAR, 0.10),
+        (MemberClassification.APPRENTICE_3RD_YEAR, 0.08),
+        (MemberClassification.APPRENTICE_4TH_YEAR, 0.07),
+        (MemberClassification.APPRENTICE_5TH_YEAR, 0.05),
+        (MemberClassification.JOURNEYMAN, 0.40),
+        (MemberClassification.FOREMAN, 0.12),
+        (MemberClassification.RETIREE, 0.05),
+        (MemberClassification.HONORARY, 0.03),
+    ]
+)
+
+
+def generate_member_rows(start: int, stop: int, fake: Faker):
+    """Yield member rows (MEMBER_COLUMNS order) for member indexes start..stop-1."""
     statuses = list(MemberStatus)
 
-    print(f"   Generating {count} members (this may take a minute)...")
-
-    for i in range(count):
+    for i in range(start, stop):
         # Generate diverse member numbers (using i to ensure uniqueness)
         if i < 1000:
             # Pure numeric - use i + base to ensure uniqueness
@@ -35,23 +64,7 @@ def stress_test_members(db: Session, count: int = 10000):
             # 10 million range for remaining 7000 members
             member_number = str(10000000 + (i - 3000))
 
-        # Weight classification towards journeyman and apprentices
-        classification_weights = OrderedDict(
-            [
-                (MemberClassification.APPRENTICE_1ST_YEAR, 0.10),
-                (MemberClassification.APPRENTICE_2ND_YEAR, 0.10),
-                (MemberClassification.APPRENTICE_3RD_YEAR, 0.08),
-                (MemberClassification.APPRENTICE_4TH_YEAR, 0.07),
-                (MemberClassification.APPRENTICE_5TH_YEAR, 0.05),
-                (MemberClassification.JOURNEYMAN, 0.40),
-                (MemberClassification.FOREMAN, 0.12),
-                (MemberClassification.RETIREE, 0.05),
-                (MemberClassification.HONORARY, 0.03),
-            ]
-        )
-        classification = fake.random_choices(elements=classification_weights, length=1)[
-            0
-        ]
+        classification = fake.random_choices(elements=CLASSIFICATION_WEIGHTS, length=1)[0]
 
         # Most members are active
         if fake.boolean(chance_of_getting_true=88):
@@ -71,43 +84,66 @@ def stress_test_members(db: Session, count: int = 10000):
         if fake.boolean(chance_of_getting_true=75):
             date_of_birth = fake.date_of_birth(minimum_age=18, maximum_age=75)
 
-        member_data = {
-            "member_number": member_number,
-            "first_name": fake.first_name(),
-            "last_name": fake.last_name(),
-            "middle_name": fake.first_name()
-            if fake.boolean(chance_of_getting_true=45)
-            else None,
-            "address": fake.street_address()
-            if fake.boolean(chance_of_getting_true=80)
-            else None,
-            "city": fake.city() if fake.boolean(chance_of_getting_true=82) else None,
-            "state": fake.state_abbr()
-            if fake.boolean(chance_of_getting_true=82)
-            else None,
-            "zip_code": fake.zipcode()
-            if fake.boolean(chance_of_getting_true=78)
-            else None,
-            "phone": fake.phone_number()[:50]
-            if fake.boolean(chance_of_getting_true=85)
-            else None,
-            "email": fake.email() if fake.boolean(chance_of_getting_true=65) else None,
-            "date_of_birth": date_of_birth,
-            "hire_date": hire_date,
-            "status": status,
-            "classification": classification,
-            "notes": fake.sentence()
-            if fake.boolean(chance_of_getting_true=15)
-            else None,
-        }
-
-        members.append(Member(**member_data))
-
-        # Progress indicator every 1000 members
-        if (i + 1) % 1000 == 0:
-            print(f"      {i + 1}/{count} members generated...")
-
-    print("   Adding members to database (this will take a moment)...")
-    add_records(db, members, batch_size=500)
-    print(f"   ✅ Seeded {len(members)} members")
-    return members
+        yield (
+            member_number,
+            fake.first_name(),
+            fake.last_name(),
+            fake.first_name() if fake.boolean(chance_of_getting_true=45) else None,
+            fake.street_address() if fake.boolean(chance_of_getting_true=80) else None,
+            fake.city() if fake.boolean(chance_of_getting_true=82) else None,
+            fake.state_abbr() if fake.boolean(chance_of_getting_true=82) else None,
+            fake.zipcode() if fake.boolean(chance_of_getting_true=78) else None,
+            fake.phone_number()[:50] if fake.boolean(chance_of_getting_true=85) else None,
+            fake.email() if fake.boolean(chance_of_getting_true=65) else None,
+            date_of_birth,
+            hire_date,
+            status,
+            classification,
+            fake.sentence() if fake.boolean(chance_of_getting_true=15) else None,
+        )
+
+
+def member_shard_count(count: int) -> int:
+    """Number of member shards for a member count."""
+    return -(-count // MEMBER_SHARD_SIZE)
+
+
+def seed_member_shard(db: Session, seed: int, shard: int, count: int, id_offset: int = 0) -> int:
+    """
+    Generate and load one shard of members with pre-assigned ids.
+
+    Member index i gets id id_offset + i + 1, so ids (and the foreign keys
+    that point at them) are the same whichever worker loads the shard.
+    Call sync_id_sequence once every shard is loaded.
+
+    Returns:
+        Number of members loaded
+    """
+    start = shard * MEMBER_SHARD_SIZE
+    stop = min(count, start + MEMBER_SHARD_SIZE)
+    fake = shard_faker(seed, "members", shard)
+    rows = (
+        (id_offset + index + 1, *row)
+        for index, row in enumerate(generate_member_rows(start, stop, fake), start)
+    )
+    return copy_records(db, Member.__table__, ("id", *MEMBER_COLUMNS), rows)
+
+
+def stress_test_members(db: Session, count: int = 10000, seed: int = 42) -> list:
+    """
+    Generate 10,000 union members with complete data, one shard at a time.
+
+    Rows are streamed into the database as they are generated.
+
+    Returns:
+        Ids of the new members
+    """
+    print(f"   Generating and loading {count} members...")
+    id_offset = max_id(db, Member.__table__) or 0
+    loaded = 0
+    for shard in range(member_shard_count(count)):
+        loaded += seed_member_shard(db, seed, shard, count, id_offset)
+        print(f"      {min(count, (shard + 1) * MEMBER_SHARD_SIZE)}/{count} members loaded...")
+    sync_id_sequence(db, Member.__table__)
+    print(f"   ✅ Seeded {loaded} members")
+    return list(range(id_offset + 1, id_offset + count + 1))
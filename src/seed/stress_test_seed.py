@@ -1,21 +1,36 @@
 """Stress test seed - Large scale data for database performance testing."""
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from src.db.session import get_db_session
 from src.config.settings import settings
 
+from src.models.file_attachment import FileAttachment
+from src.models.member import Member
+from src.models.member_employment import MemberEmployment
+from src.models.organization import Organization
+from src.models.student import Student
+
 from .truncate_all import truncate_all_tables
 from .stress_test_instructors import stress_test_instructors
 from .stress_test_locations import stress_test_locations
 from .stress_test_students import stress_test_students
-from .stress_test_members import stress_test_members
+from .stress_test_members import member_shard_count, seed_member_shard
 from .stress_test_organizations import stress_test_organizations
 from .stress_test_organization_contacts import stress_test_organization_contacts
-from .stress_test_member_employments import stress_test_member_employments
-from .base_seed import init_seed
+from .stress_test_member_employments import plan_employment_shards, seed_employment_shard
+from .stress_test_file_attachments import (
+    plan_attachment_shards,
+    print_attachment_summary,
+    seed_attachment_shard,
+)
+from .base_seed import init_seed, max_id, sync_id_sequence
+from .parallel_seed import SeedPhase, run_phases
+
+STRESS_MEMBERS = 10000
 
 
-def run_stress_test(force: bool = False, truncate: bool = True):
+def run_stress_test(force: bool = False, truncate: bool = True, workers: int = 1, seed: int = 42):
     """
     Stress test seed with large data volumes:
     - 10,000 members
@@ -25,6 +40,11 @@ def run_stress_test(force: bool = False, truncate: bool = True):
     - 750 organizations (700 employers)
     - ~250,000 employment records
     - ~150,000 file attachments (12MP photos, PDFs, documents) - ~30 GB
+
+    Members, employments and attachments are split into fixed-size shards
+    with their own derived seeds and loaded on `workers` processes; the
+    other phases run in this process. The same seed loads the same data
+    with any number of workers.
     """
     env = settings.IP2A_ENV.lower()
 
@@ -39,7 +59,7 @@ def run_stress_test(force: bool = False, truncate: bool = True):
             "If you REALLY intend to do this, run with force=True."
         )
 
-    init_seed(42)  # Consistent seed for reproducibility
+    init_seed(seed)  # Consistent seed for reproducibility
     db: Session = get_db_session()
 
     if truncate and env in ("dev", "test"):
@@ -47,46 +67,93 @@ def run_stress_test(force: bool = False, truncate: bool = True):
         truncate_all_tables(db)
 
     print("\n🔄 Starting STRESS TEST seed...")
-    print("   This will take several minutes...\n")
-
-    # Phase 1: Base data
-    print("📍 Phase 1: Locations and Instructors")
-    stress_test_locations(db, count=250)  # 250 locations
-    stress_test_instructors(db, count=500)  # 500 instructors
-
-    # Phase 2: Organizations
-    print("\n🏢 Phase 2: Organizations")
-    employers = stress_test_organizations(
-        db, employers=700, others=50
-    )  # 750 total orgs
-
-    # Phase 3: Contacts for organizations
-    print("\n👤 Phase 3: Organization Contacts")
-    stress_test_organization_contacts(db, contacts_per_org=3)
-
-    # Phase 4: Students
-    print("\n🎓 Phase 4: Students")
-    stress_test_students(db, count=1000)  # 1,000 students
-
-    # Phase 5: Members
-    print("\n👷 Phase 5: Members (This will take a while...)")
-    members = stress_test_members(db, count=10000)  # 10,000 members
-
-    # Phase 6: Member Employments (1-100 per member, 20% employer repeat)
-    print("\n💼 Phase 6: Member Employments (This will take even longer...)")
-    stress_test_member_employments(
-        db,
-        members=members,
-        employers=employers,
-        min_jobs=1,
-        max_jobs=100,
-        employer_repeat_rate=0.20,
-    )
-
-    # Phase 7: File Attachments (DISABLED - table not in current schema)
-    print("\n📎 Phase 7: File Attachments (SKIPPED - table schema pending)")
-    print("   ⚠️  file_attachments table not in current migration - skipping for now")
-    # stress_test_file_attachments(db)
+    print(f"   Members, employments and attachments are bulk loaded with COPY on {workers} worker(s)\n")
+
+    state = {}
+
+    def base(db):
+        print("📍 Locations and Instructors")
+        stress_test_locations(db, count=250)  # 250 locations
+        stress_test_instructors(db, count=500)  # 500 instructors
+
+    def organizations(db):
+        print("\n🏢 Organizations")
+        employers = stress_test_organizations(db, employers=700, others=50)  # 750 total orgs
+        state["employer_ids"] = [employer.id for employer in employers]
+
+    def contacts(db):
+        print("\n👤 Organization Contacts")
+        stress_test_organization_contacts(db, contacts_per_org=3)
+
+    def plan_members(db):
+        print(f"\n👷 Members: {STRESS_MEMBERS} in {member_shard_count(STRESS_MEMBERS)} shards")
+        id_offset = max_id(db, Member.__table__) or 0
+        state["member_ids"] = list(range(id_offset + 1, id_offset + STRESS_MEMBERS + 1))
+        return [
+            (seed_member_shard, {"seed": seed, "shard": shard, "count": STRESS_MEMBERS, "id_offset": id_offset})
+            for shard in range(member_shard_count(STRESS_MEMBERS))
+        ]
+
+    def students(db):
+        # Linked to apprentice members
+        print("\n🎓 Students")
+        stress_test_students(db, count=1000)  # 1,000 students
+
+    def plan_employments(db):
+        # 1-100 per member, 20% employer repeat
+        shards = plan_employment_shards(
+            seed,
+            state["member_ids"],
+            state["employer_ids"],
+            min_jobs=1,
+            max_jobs=100,
+            employer_repeat_rate=0.20,
+            id_offset=max_id(db, MemberEmployment.__table__) or 0,
+        )
+        total = sum(sum(shard["job_counts"]) for shard in shards)
+        print(f"\n💼 Member Employments: {total:,} in {len(shards)} shards")
+        return [(seed_employment_shard, shard) for shard in shards]
+
+    def plan_attachments(db):
+        # Metadata only, no files written
+        shards = plan_attachment_shards(
+            seed,
+            db.execute(select(Member.id).order_by(Member.id)).scalars().all(),
+            db.execute(select(Student.id).order_by(Student.id)).scalars().all(),
+            db.execute(select(Organization.id).order_by(Organization.id)).scalars().all(),
+            id_offset=max_id(db, FileAttachment.__table__) or 0,
+        )
+        print(f"\n📎 File Attachments: {len(shards)} shards")
+        state["attachment_shards"] = shards
+        return [(seed_attachment_shard, shard) for shard in shards]
+
+    def finish_attachments(db):
+        sync_id_sequence(db, FileAttachment.__table__)
+        print_attachment_summary(state["attachment_shards"])
+
+    # Parent-side phases form a chain so they draw from the global seed in a fixed order
+    phases = [
+        SeedPhase("base", run=base),
+        SeedPhase("organizations", depends_on=["base"], run=organizations),
+        SeedPhase("contacts", depends_on=["organizations"], run=contacts),
+        # The sequence must be past the loaded ids before students add members through the ORM
+        SeedPhase("members", plan=plan_members, finish=lambda db: sync_id_sequence(db, Member.__table__)),
+        SeedPhase("students", depends_on=["contacts", "members"], run=students),
+        SeedPhase(
+            "employments",
+            depends_on=["members", "organizations"],
+            plan=plan_employments,
+            finish=lambda db: sync_id_sequence(db, MemberEmployment.__table__),
+        ),
+        SeedPhase(
+            "attachments",
+            depends_on=["members", "students", "organizations"],
+            plan=plan_attachments,
+            finish=finish_attachments,
+        ),
+    ]
+    run_phases(db, phases, workers=workers)
+    db.close()
 
     print("\n" + "=" * 60)
     print("✅ STRESS TEST database seeding complete!")
@@ -98,7 +165,7 @@ def run_stress_test(force: bool = False, truncate: bool = True):
     print("   • 1,000 students")
     print("   • 10,000 members")
     print("   • ~432,000+ employment records")
-    print("   • File attachments skipped (table pending migration)")
+    print("   • ~150,000 file attachments")
     print("=" * 60)
 
 
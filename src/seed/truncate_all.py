@@ -14,6 +14,7 @@ def truncate_all_tables(db: Session):
         # Dues system
         "dues_adjustments",
         "dues_payments",
+        "dues_period_summaries",
         "dues_periods",
         "dues_rates",
         # Training system
@@ -37,6 +38,9 @@ def truncate_all_tables(db: Session):
         "students",
         "cohorts",
         "instructors",
+        # Attachments (polymorphic record links, no foreign keys)
+        "file_attachments",
+        "file_blobs",
         # Members and organizations
         "member_employments",
         "members",
@@ -1,45 +1,95 @@
-"""AuditLog service for business logic (read-only)."""
+"""AuditLog service for business logic (read-only).
 
+Lists are paged with a keyset cursor over (changed_at, id), newest first,
+instead of OFFSET: every page is an index range scan starting after the
+previous page's last row (see the audit_logs composite indexes), so deep
+pages cost the same as the first one.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from src.models.audit_log import AuditLog
 
+AuditLogPage = Tuple[List[AuditLog], Optional[str]]
+
+
+def encode_audit_cursor(log: AuditLog) -> str:
+    """Opaque keyset cursor for the last row on a page."""
+    values = [log.changed_at.isoformat(), log.id]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_audit_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """
+    Decode a keyset cursor.
+
+    Raises:
+        ValueError: The cursor was not produced by encode_audit_cursor
+    """
+    if not cursor:
+        return None
+    try:
+        changed_at, log_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(changed_at), int(log_id)
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+
+
+def _keyset_page(db: Session, filters: list, cursor: Optional[str], limit: int) -> AuditLogPage:
+    """One page of audit logs matching filters, newest first, after the cursor."""
+    after = decode_audit_cursor(cursor)
+    if after:
+        filters = [*filters, tuple_(AuditLog.changed_at, AuditLog.id) < tuple_(*after)]
+
+    # One extra row tells us whether there is a next page
+    logs = (
+        db.query(AuditLog)
+        .filter(*filters)
+        .order_by(AuditLog.changed_at.desc(), AuditLog.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    next_cursor = encode_audit_cursor(logs[limit - 1]) if len(logs) > limit else None
+    return logs[:limit], next_cursor
+
 
 def get_audit_log(db: Session, log_id: int) -> Optional[AuditLog]:
     """Get audit log by ID."""
     return db.query(AuditLog).filter(AuditLog.id == log_id).first()
 
 
-def list_audit_logs(db: Session, skip: int = 0, limit: int = 100) -> List[AuditLog]:
-    """List audit logs with pagination."""
-    return db.query(AuditLog).order_by(AuditLog.changed_at.desc()).offset(skip).limit(limit).all()
+def list_audit_logs(db: Session, cursor: Optional[str] = None, limit: int = 100) -> AuditLogPage:
+    """List audit logs, newest first. Returns (logs, next_cursor)."""
+    return _keyset_page(db, [], cursor, limit)
 
 
 def list_audit_logs_by_table(
-    db: Session, table_name: str, skip: int = 0, limit: int = 100
-) -> List[AuditLog]:
-    """List audit logs for a specific table."""
-    return (
-        db.query(AuditLog)
-        .filter(AuditLog.table_name == table_name)
-        .order_by(AuditLog.changed_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    db: Session, table_name: str, cursor: Optional[str] = None, limit: int = 100
+) -> AuditLogPage:
+    """List audit logs for a specific table. Returns (logs, next_cursor)."""
+    return _keyset_page(db, [AuditLog.table_name == table_name], cursor, limit)
 
 
 def list_audit_logs_by_record(
-    db: Session, table_name: str, record_id: str
-) -> List[AuditLog]:
-    """List all audit logs for a specific record."""
-    return (
-        db.query(AuditLog)
-        .filter(
-            AuditLog.table_name == table_name,
-            AuditLog.record_id == record_id
-        )
-        .order_by(AuditLog.changed_at.desc())
-        .all()
+    db: Session, table_name: str, record_id: str, cursor: Optional[str] = None, limit: int = 100
+) -> AuditLogPage:
+    """List the audit trail of a specific record. Returns (logs, next_cursor)."""
+    return _keyset_page(
+        db,
+        [AuditLog.table_name == table_name, AuditLog.record_id == record_id],
+        cursor,
+        limit,
     )
+
+
+def list_audit_logs_by_user(
+    db: Session, changed_by: str, cursor: Optional[str] = None, limit: int = 100
+) -> AuditLogPage:
+    """List audit logs written by a specific user. Returns (logs, next_cursor)."""
+    return _keyset_page(db, [AuditLog.changed_by == changed_by], cursor, limit)
@@ -5,7 +5,9 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 import json
 
+from src.config.settings import settings
 from src.models.audit_log import AuditLog
+from src.services.audit_writer import AuditWriteMode, audit_writer
 
 
 class AuditAction:
@@ -78,11 +80,7 @@ def log_read(
         notes=notes or f"Viewed {table_name} record {record_id}",
     )
 
-    db.add(audit_log)
-    db.commit()
-    db.refresh(audit_log)
-
-    return audit_log
+    return _persist(db, audit_log)
 
 
 def log_bulk_read(
@@ -129,11 +127,7 @@ def log_bulk_read(
         notes=notes,
     )
 
-    db.add(audit_log)
-    db.commit()
-    db.refresh(audit_log)
-
-    return audit_log
+    return _persist(db, audit_log)
 
 
 def log_create(
@@ -178,11 +172,7 @@ def log_create(
         notes=notes or f"Created {table_name} record {record_id}",
     )
 
-    db.add(audit_log)
-    db.commit()
-    db.refresh(audit_log)
-
-    return audit_log
+    return _persist(db, audit_log)
 
 
 def log_update(
@@ -236,11 +226,7 @@ def log_update(
         notes=notes or f"Updated {table_name} record {record_id}: {', '.join(changed_fields)}",
     )
 
-    db.add(audit_log)
-    db.commit()
-    db.refresh(audit_log)
-
-    return audit_log
+    return _persist(db, audit_log)
 
 
 def log_delete(
@@ -285,10 +271,27 @@ def log_delete(
         notes=notes or f"Deleted {table_name} record {record_id}",
     )
 
-    db.add(audit_log)
-    db.commit()
-    db.refresh(audit_log)
+    return _persist(db, audit_log)
+
 
+def _persist(db: Session, audit_log: AuditLog) -> AuditLog:
+    """
+    Persist an audit row according to AUDIT_WRITE_MODE.
+
+    In ``sync`` mode the row is committed on the caller's session. Otherwise it
+    is handed to the background audit writer and the returned AuditLog is
+    transient (no id) - callers only use it to know something was logged.
+    """
+    mode = settings.AUDIT_WRITE_MODE
+    if mode == AuditWriteMode.SYNC:
+        db.add(audit_log)
+        db.commit()
+        db.refresh(audit_log)
+        return audit_log
+
+    # Stamp the event time now; the batch may be written a little later
+    audit_log.changed_at = datetime.utcnow()
+    audit_writer.submit(audit_log, wait=(mode == AuditWriteMode.FLUSH))
     return audit_log
 
 
@@ -0,0 +1,283 @@
+"""Batched, background writer for audit log rows.
+
+Audit calls used to add + commit + refresh an AuditLog on the request's own
+session, so every audited read paid for an extra transaction. The writer
+queues rows in-process and a daemon thread flushes them with a multi-row
+INSERT once a batch fills up or the flush interval elapses.
+
+Durability is controlled by ``settings.AUDIT_WRITE_MODE``:
+
+- ``sync``:  legacy behaviour, write on the request session (no queue)
+- ``async``: fire-and-forget; the request never waits for the audit commit
+- ``flush``: the caller blocks until the batch holding its row is committed
+  (group commit - concurrent requests share one transaction)
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.config.settings import settings
+from src.db.session import SessionLocal
+from src.models.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class AuditWriteMode:
+    """Audit write durability modes."""
+
+    SYNC = "sync"
+    ASYNC = "async"
+    FLUSH = "flush"
+
+
+# Columns copied from an AuditLog instance into the INSERT payload
+_AUDIT_COLUMNS = [c.key for c in AuditLog.__table__.columns if c.key != "id"]
+
+
+class _FlushRequest:
+    """Queue marker asking the worker to write everything queued before it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class AuditWriter:
+    """
+    In-process queue of audit rows flushed by a background thread.
+
+    The worker is started lazily on the first submit, so scripts that never
+    audit anything don't spawn a thread. Call shutdown() to drain the queue.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+    ):
+        self._session_factory = session_factory or SessionLocal
+        self.batch_size = batch_size or settings.AUDIT_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.AUDIT_FLUSH_INTERVAL_MS / 1000
+        )
+        self._queue: queue.Queue = queue.Queue(
+            maxsize=max_queue_size or settings.AUDIT_QUEUE_MAX_SIZE
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stopping = False
+        self.stats = {
+            "submitted": 0,
+            "written": 0,
+            "batches": 0,
+            "failed": 0,
+            "inline_writes": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, audit_log: AuditLog, wait: bool = False) -> None:
+        """
+        Queue an audit row for writing.
+
+        Args:
+            audit_log: Transient AuditLog to persist (it is not added to any session)
+            wait: Block until the row is committed (flush-before-response mode)
+        """
+        row = {key: getattr(audit_log, key) for key in _AUDIT_COLUMNS}
+        done = threading.Event() if wait else None
+
+        self.stats["submitted"] += 1
+
+        if not self._ensure_started():
+            # Writer is draining for shutdown - don't strand the row in the queue
+            self.stats["inline_writes"] += 1
+            self._write_batch([row])
+            return
+
+        try:
+            self._queue.put((row, done), timeout=1.0)
+        except queue.Full:
+            # Back-pressure: never drop an audit row, write it on the caller's thread
+            logger.warning("Audit queue full, writing audit row inline")
+            self.stats["inline_writes"] += 1
+            self._write_batch([row])
+            return
+
+        if done is not None:
+            done.wait()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every row queued before this call has been written.
+
+        Returns:
+            True if the flush completed within the timeout
+        """
+        if not self.is_running:
+            return self._queue.empty()
+
+        marker = _FlushRequest()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Drain the queue and stop the worker (called on app shutdown)."""
+        with self._lock:
+            if not self.is_running:
+                return
+            self._stopping = True
+            thread = self._thread
+
+        self._queue.put(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.error(
+                "Audit writer did not drain within %.1fs (%d rows pending)",
+                timeout,
+                self._queue.qsize(),
+            )
+        else:
+            self._drain_leftovers()
+
+        with self._lock:
+            self._thread = None
+            self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued rows not yet written."""
+        return self._queue.qsize()
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> bool:
+        """Start the worker if needed. Returns False while shutting down."""
+        if self.is_running and not self._stopping:
+            return True
+        with self._lock:
+            if self._stopping:
+                return False
+            if not self.is_running:
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-writer", daemon=True
+                )
+                self._thread.start()
+            return True
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        waiters: List[threading.Event] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            timeout = max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _FlushRequest()  # interval elapsed, flush what we have
+
+            stop = item is None
+            if isinstance(item, tuple):
+                row, done = item
+                batch.append(row)
+                if done is not None:
+                    waiters.append(done)
+
+            # Someone is blocked on this batch: write as soon as the queue goes
+            # idle, grouping whatever arrived while the last write was running
+            flush_now = (
+                stop
+                or isinstance(item, _FlushRequest)
+                or len(batch) >= self.batch_size
+                or (waiters and self._queue.empty())
+            )
+            if flush_now:
+                if batch:
+                    self._write_batch(batch)
+                for done in waiters:
+                    done.set()
+                if isinstance(item, _FlushRequest):
+                    item.done.set()
+                batch, waiters = [], []
+                deadline = time.monotonic() + self.flush_interval
+
+            if stop:
+                return
+
+    def _drain_leftovers(self) -> None:
+        """Write rows that raced into the queue after the stop sentinel."""
+        rows, waiters = [], []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple):
+                rows.append(item[0])
+                if item[1] is not None:
+                    waiters.append(item[1])
+            elif isinstance(item, _FlushRequest):
+                waiters.append(item.done)
+        if rows:
+            self._write_batch(rows)
+        for done in waiters:
+            done.set()
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """Write rows in one multi-row INSERT, falling back to row-by-row."""
+        try:
+            self._insert(rows)
+            self.stats["batches"] += 1
+            self.stats["written"] += len(rows)
+            return
+        except Exception:
+            logger.exception(
+                "Audit batch insert failed (%d rows), retrying per row", len(rows)
+            )
+
+        # Isolate bad rows so one malformed entry doesn't lose the whole batch
+        for row in rows:
+            try:
+                self._insert([row])
+                self.stats["written"] += 1
+            except Exception:
+                self.stats["failed"] += 1
+                logger.exception(
+                    "Dropping audit row for %s/%s",
+                    row.get("table_name"),
+                    row.get("record_id"),
+                )
+
+    def _insert(self, rows: List[Dict[str, Any]]) -> None:
+        session = self._session_factory()
+        try:
+            session.execute(insert(AuditLog), rows)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+# Shared writer used by audit_service
+audit_writer = AuditWriter()
@@ -1,13 +1,19 @@
 """Authentication service for login, logout, and token management."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
 from src.models.user import User
 from src.models.refresh_token import RefreshToken
-from src.core.security import hash_password, verify_password
+from src.core.security import (
+    hash_password,
+    hash_password_async,
+    needs_rehash,
+    verify_password,
+    verify_password_async,
+)
 from src.core.jwt import (
     create_access_token,
     create_refresh_token,
@@ -47,23 +53,8 @@ class TokenRevokedError(AuthenticationError):
     pass
 
 
-def authenticate_user(db: Session, email: str, password: str) -> User:
-    """
-    Authenticate a user by email and password.
-
-    Args:
-        db: Database session
-        email: User's email
-        password: Plain text password
-
-    Returns:
-        Authenticated User object
-
-    Raises:
-        InvalidCredentialsError: If email/password invalid
-        AccountLockedError: If account is locked
-        AccountInactiveError: If account is inactive
-    """
+def _login_candidate(db: Session, email: str) -> User:
+    """Look up the user logging in and reject locked or inactive accounts."""
     user = get_user_by_email(db, email)
 
     if not user:
@@ -80,31 +71,79 @@ def authenticate_user(db: Session, email: str, password: str) -> User:
     if not user.is_active:
         raise AccountInactiveError("Account is inactive")
 
-    # Verify password
-    if not verify_password(password, user.password_hash):
-        # Increment failed attempts
-        user.failed_login_attempts += 1
+    return user
 
-        # Check if should lock
-        if user.failed_login_attempts >= auth_settings.max_login_attempts:
-            from datetime import timedelta
 
-            user.locked_until = datetime.now(timezone.utc) + timedelta(
-                minutes=auth_settings.lockout_duration_minutes
-            )
+def _record_failed_login(db: Session, user: User) -> None:
+    """Count a wrong password, locking the account at the limit, and raise."""
+    user.failed_login_attempts += 1
 
-        db.commit()
-        raise InvalidCredentialsError("Invalid email or password")
+    # Check if should lock
+    if user.failed_login_attempts >= auth_settings.max_login_attempts:
+        user.locked_until = datetime.now(timezone.utc) + timedelta(
+            minutes=auth_settings.lockout_duration_minutes
+        )
+
+    db.commit()
+    raise InvalidCredentialsError("Invalid email or password")
 
-    # Successful login - reset failed attempts
+
+def _record_login(db: Session, user: User, new_hash: Optional[str] = None) -> User:
+    """Reset failed attempts and store a re-hashed password, if any."""
     user.failed_login_attempts = 0
     user.locked_until = None
     user.last_login = datetime.now(timezone.utc)
+    if new_hash:
+        user.password_hash = new_hash
     db.commit()
 
     return user
 
 
+def authenticate_user(db: Session, email: str, password: str) -> User:
+    """
+    Authenticate a user by email and password.
+
+    A password hashed with an outdated bcrypt cost factor is re-hashed at
+    the configured one on successful login.
+
+    Args:
+        db: Database session
+        email: User's email
+        password: Plain text password
+
+    Returns:
+        Authenticated User object
+
+    Raises:
+        InvalidCredentialsError: If email/password invalid
+        AccountLockedError: If account is locked
+        AccountInactiveError: If account is inactive
+    """
+    user = _login_candidate(db, email)
+
+    if not verify_password(password, user.password_hash):
+        _record_failed_login(db, user)
+
+    new_hash = hash_password(password) if needs_rehash(user.password_hash) else None
+    return _record_login(db, user, new_hash)
+
+
+async def authenticate_user_async(db: Session, email: str, password: str) -> User:
+    """authenticate_user for async routes: bcrypt runs without blocking the event loop."""
+    user = _login_candidate(db, email)
+
+    if not await verify_password_async(password, user.password_hash):
+        _record_failed_login(db, user)
+
+    new_hash = (
+        await hash_password_async(password)
+        if needs_rehash(user.password_hash)
+        else None
+    )
+    return _record_login(db, user, new_hash)
+
+
 def create_tokens(
     db: Session,
     user: User,
@@ -0,0 +1,123 @@
+"""
+Content-addressed blob store for file attachments.
+
+Uploads are hashed first; each unique content is stored once per backend
+(local disk or S3) under a key derived from its SHA-256 and shared by every
+FileAttachment with that content. Re-uploading a file that is already
+stored only adds a reference, so no bytes are written. The organized owner
+path from file_path_builder becomes the attachment's logical_path, a name
+only.
+
+Acquiring and releasing a blob lock its row until the transaction ends. A
+blob whose last reference is released is deleted from storage before that
+lock is dropped, so a concurrent upload of the same content waits and then
+stores it again instead of pointing at content that is being deleted.
+"""
+
+import os
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import literal_column, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.file_blob import FileBlob
+from src.services.file_path_builder import UPLOAD_ROOT
+
+LOCAL_BLOB_ROOT = os.path.join(UPLOAD_ROOT, "blobs")
+S3_BLOB_PREFIX = "blobs"
+
+
+def blob_key(content_hash: str, storage: str) -> str:
+    """Storage location for content with this hash: a local path or an S3 key."""
+    if storage == "s3":
+        return f"{S3_BLOB_PREFIX}/{content_hash[:2]}/{content_hash}"
+    return os.path.join(
+        LOCAL_BLOB_ROOT, content_hash[:2], content_hash[2:4], content_hash
+    )
+
+
+def acquire_blob(
+    db: Session,
+    content_hash: str,
+    size: int,
+    storage: str,
+    storage_key: Optional[str] = None,
+) -> Tuple[FileBlob, bool]:
+    """
+    Add a reference to the blob holding this content, creating its row if new.
+
+    Args:
+        db: Database session; the caller commits
+        content_hash: SHA-256 hex digest of the content
+        size: Content size in bytes
+        storage: 'local' or 's3'
+        storage_key: Location for a new blob (default: blob_key)
+
+    Returns:
+        (blob, created). When created, the caller stores the content at
+        blob.storage_key before committing, and rolls back if that fails.
+    """
+    now = datetime.utcnow()
+    stmt = (
+        insert(FileBlob)
+        .values(
+            content_hash=content_hash,
+            storage=storage,
+            storage_key=storage_key or blob_key(content_hash, storage),
+            size=size,
+            ref_count=1,
+            created_at=now,
+            updated_at=now,
+        )
+        .on_conflict_do_update(
+            constraint="uq_file_blobs_content_hash_storage",
+            set_={"ref_count": FileBlob.ref_count + 1, "updated_at": now},
+        )
+        # xmax is 0 only for a freshly inserted row
+        .returning(FileBlob.id, literal_column("xmax = 0").label("created"))
+    )
+    row = db.execute(stmt).one()
+    blob = db.get(FileBlob, row.id, populate_existing=True)
+    return blob, row.created
+
+
+def release_blob(db: Session, blob_id: int) -> Optional[FileBlob]:
+    """
+    Drop one reference to a blob.
+
+    Returns:
+        The blob if that was its last reference. Its row has been deleted;
+        the caller deletes its content (delete_blob_content) and then commits.
+    """
+    ref_count = db.execute(
+        update(FileBlob)
+        .where(FileBlob.id == blob_id)
+        .values(ref_count=FileBlob.ref_count - 1)
+        .returning(FileBlob.ref_count)
+    ).scalar()
+    if ref_count is None or ref_count > 0:
+        return None
+
+    blob = db.get(FileBlob, blob_id, populate_existing=True)
+    db.delete(blob)
+    db.flush()
+    return blob
+
+
+def blob_content_exists(blob: FileBlob, s3=None) -> bool:
+    """Whether the blob's content is in storage (s3: S3Service, for S3 blobs)."""
+    if blob.storage == "s3":
+        return s3.file_exists(blob.storage_key)
+    return os.path.exists(blob.storage_key)
+
+
+def delete_blob_content(blob: FileBlob, s3=None) -> None:
+    """Delete a released blob's content, and its preview, from storage."""
+    keys = [blob.storage_key] + ([blob.preview_key] if blob.preview_key else [])
+    for key in keys:
+        if blob.storage == "s3":
+            s3.delete_file(key)
+        elif os.path.exists(key):
+            os.remove(key)
@@ -0,0 +1,72 @@
+"""
+Content hashes for stored files.
+
+Attachments record the SHA-256 of their content at upload
+(FileAttachment.content_hash), computed by StreamHasher as the upload streams
+to S3. The resilience scan recomputes it to detect
+corrupted or truncated files: local files are hashed through a memory map
+and S3 objects through ranged GETs, so no file is read into memory whole.
+"""
+
+import hashlib
+import mmap
+import os
+from typing import BinaryIO, Iterator, Tuple
+
+HASH_CHUNK_SIZE = 1024 * 1024  # Bytes per read when streaming a file object
+S3_RANGE_SIZE = 8 * 1024 * 1024  # Bytes per ranged GET
+
+
+class StreamHasher:
+    """SHA-256 and size of a stream, computed while it is read for upload."""
+
+    def __init__(self):
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def chunks(self, file_data: BinaryIO, chunk_size: int = HASH_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the file's chunks, hashing each one on the way through."""
+        for chunk in iter(lambda: file_data.read(chunk_size), b""):
+            self._digest.update(chunk)
+            self.size += len(chunk)
+            yield chunk
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def hash_local_file(path: str) -> Tuple[str, int]:
+    """SHA-256 and size of a file on disk, read through a memory map."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return hashlib.sha256().hexdigest(), 0  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # hashlib releases the GIL on large buffers, so threads hash in parallel
+            return hashlib.sha256(mapped).hexdigest(), size
+
+
+def hash_s3_object(s3, object_key: str, range_size: int = S3_RANGE_SIZE) -> Tuple[str, int]:
+    """
+    SHA-256 and size of an S3 object, fetched with ranged GETs.
+
+    Args:
+        s3: S3Service
+        object_key: S3 object key
+        range_size: Bytes per request
+
+    Raises:
+        FileNotFoundError: The object does not exist or a range could not be read
+    """
+    metadata = s3.get_file_metadata(object_key)
+    if not metadata:
+        raise FileNotFoundError(object_key)
+
+    digest = hashlib.sha256()
+    size = metadata["size"]
+    for start in range(0, size, range_size):
+        chunk = s3.read_range(object_key, start, min(start + range_size, size) - 1)
+        if chunk is None:
+            raise FileNotFoundError(object_key)
+        digest.update(chunk)
+    return digest.hexdigest(), size
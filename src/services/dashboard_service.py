@@ -1,14 +1,21 @@
 """
 Dashboard Service - Aggregates stats from multiple modules.
-Optimized for quick dashboard loading.
+Optimized for quick dashboard loading: stats come from one aggregate query
+and are shared between users through a short-lived in-process cache.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+import asyncio
 import logging
+import threading
+import time
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, event, true
+
+from src.config.settings import settings
 
 from src.models.member import Member
 from src.models.student import Student
@@ -25,37 +32,115 @@ from src.db.enums import (
 logger = logging.getLogger(__name__)
 
 
+# Tables whose writes change the dashboard stat cards
+_STATS_TABLES = {
+    Member.__tablename__,
+    Student.__tablename__,
+    Grievance.__tablename__,
+    DuesPayment.__tablename__,
+}
+
+
+class StatsCache:
+    """
+    Process-wide TTL cache for dashboard stat sets.
+
+    Every open dashboard tab polls /api/dashboard/refresh, so the stats are
+    shared across users. Only one request per key recomputes an expired entry;
+    concurrent readers await it instead of issuing the same query.
+    Entries are written from the event loop and cleared from commit hooks
+    (which may run in worker threads), so the entry map keeps a thread lock.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Hashable, asyncio.Lock] = {}
+        self._lock = threading.Lock()
+
+    async def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, computing it once if missing/expired."""
+        value = self._get_fresh(key)
+        if value is not None:
+            return value
+
+        key_lock = self._key_locks.setdefault(key, asyncio.Lock())
+
+        async with key_lock:
+            # Another request may have refreshed it while we waited
+            value = self._get_fresh(key)
+            if value is not None:
+                return value
+            value = await compute()
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            return value
+
+    def invalidate(self) -> None:
+        """Drop every cached stat set."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get_fresh(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+
+dashboard_stats_cache = StatsCache(ttl_seconds=settings.DASHBOARD_STATS_TTL_SECONDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_stats_writes(session: Session, flush_context) -> None:
+    """Remember whether this transaction touched a table behind the stat cards."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) in _STATS_TABLES:
+            session.info["dashboard_stats_dirty"] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stats_on_commit(session: Session) -> None:
+    if session.info.pop("dashboard_stats_dirty", False):
+        dashboard_stats_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_stats_tracking(session: Session) -> None:
+    session.info.pop("dashboard_stats_dirty", None)
+
+
 class DashboardService:
     """Service for dashboard data aggregation."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_stats(self) -> Dict[str, Any]:
         """
         Get all dashboard statistics.
-        Uses efficient COUNT queries instead of loading all records.
+
+        Served from the shared stats cache; on a miss all cards are computed
+        in a single aggregate query.
         """
-        stats = {}
+        first_of_month = datetime.now().replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
 
         try:
-            # Active members count
-            stats["active_members"] = self._count_active_members()
-            stats["members_change"] = self._get_members_change_this_month()
-
-            # Active students count
-            stats["active_students"] = self._count_active_students()
-
-            # Pending grievances
-            stats["pending_grievances"] = self._count_pending_grievances()
-
-            # Dues collected this month
-            stats["dues_mtd"] = self._get_dues_mtd()
-
+            return dict(
+                await dashboard_stats_cache.get_or_compute(
+                    ("overview", first_of_month.date()),
+                    lambda: self._query_stats(first_of_month),
+                )
+            )
         except Exception as e:
             logger.error(f"Error fetching dashboard stats: {e}")
             # Return zeros on error to prevent dashboard crash
-            stats = {
+            return {
                 "active_members": 0,
                 "members_change": "+0",
                 "active_students": 0,
@@ -63,83 +148,77 @@ class DashboardService:
                 "dues_mtd": 0,
             }
 
-        return stats
-
-    def _count_active_members(self) -> int:
-        """Count members with active status."""
-        result = self.db.execute(
-            select(func.count(Member.id)).where(Member.status == MemberStatus.ACTIVE)
-        )
-        return result.scalar() or 0
-
-    def _get_members_change_this_month(self) -> str:
-        """Get net member change this month."""
-        first_of_month = datetime.now().replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-
-        # Count members created this month
-        result = self.db.execute(
-            select(func.count(Member.id)).where(
-                and_(
-                    Member.created_at >= first_of_month,
-                    Member.status == MemberStatus.ACTIVE,
-                )
-            )
-        )
-        new_members = result.scalar() or 0
-
-        # Format with sign
-        if new_members > 0:
-            return f"+{new_members}"
-        return str(new_members)
-
-    def _count_active_students(self) -> int:
-        """Count students with active enrollment."""
-        result = self.db.execute(
-            select(func.count(Student.id)).where(
-                Student.status == StudentStatus.ENROLLED
-            )
-        )
-        return result.scalar() or 0
-
-    def _count_pending_grievances(self) -> int:
-        """Count grievances in open/investigation/hearing status."""
+    async def _query_stats(self, first_of_month: datetime) -> Dict[str, Any]:
+        """Compute every stat card with one round-trip (one CTE per table)."""
         pending_statuses = [
             GrievanceStatus.OPEN,
             GrievanceStatus.INVESTIGATION,
             GrievanceStatus.HEARING,
             GrievanceStatus.ARBITRATION,
         ]
-        result = self.db.execute(
-            select(func.count(Grievance.id)).where(
-                Grievance.status.in_(pending_statuses)
-            )
-        )
-        return result.scalar() or 0
 
-    def _get_dues_mtd(self) -> float:
-        """Get total dues collected this month."""
-        first_of_month = datetime.now().replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-
-        result = self.db.execute(
-            select(func.coalesce(func.sum(DuesPayment.amount_paid), 0)).where(
+        member_stats = select(
+            func.count(Member.id)
+            .filter(Member.status == MemberStatus.ACTIVE)
+            .label("active_members"),
+            func.count(Member.id)
+            .filter(
                 and_(
-                    DuesPayment.payment_date >= first_of_month.date(),
-                    DuesPayment.status == DuesPaymentStatus.PAID,
+                    Member.created_at >= first_of_month,
+                    Member.status == MemberStatus.ACTIVE,
                 )
             )
-        )
-        return float(result.scalar() or 0)
+            .label("new_members"),
+        ).cte("member_stats")
+
+        student_stats = select(
+            func.count(Student.id).label("active_students")
+        ).where(Student.status == StudentStatus.ENROLLED).cte("student_stats")
+
+        grievance_stats = select(
+            func.count(Grievance.id).label("pending_grievances")
+        ).where(Grievance.status.in_(pending_statuses)).cte("grievance_stats")
+
+        dues_stats = select(
+            func.coalesce(func.sum(DuesPayment.amount_paid), 0).label("dues_mtd")
+        ).where(
+            and_(
+                DuesPayment.payment_date >= first_of_month.date(),
+                DuesPayment.status == DuesPaymentStatus.PAID,
+            )
+        ).cte("dues_stats")
+
+        # Each CTE is a single aggregate row, so joining on TRUE is a 1x1 join
+        row = (await self.db.execute(
+            select(
+                member_stats.c.active_members,
+                member_stats.c.new_members,
+                student_stats.c.active_students,
+                grievance_stats.c.pending_grievances,
+                dues_stats.c.dues_mtd,
+            ).select_from(
+                member_stats.join(student_stats, true())
+                .join(grievance_stats, true())
+                .join(dues_stats, true())
+            )
+        )).one()
+
+        new_members = row.new_members or 0
+        return {
+            "active_members": row.active_members or 0,
+            # Format with sign
+            "members_change": f"+{new_members}" if new_members > 0 else str(new_members),
+            "active_students": row.active_students or 0,
+            "pending_grievances": row.pending_grievances or 0,
+            "dues_mtd": float(row.dues_mtd or 0),
+        }
 
     async def get_recent_activity(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get recent activity from audit log.
         Returns formatted activity items for display.
         """
-        result = self.db.execute(
+        result = await self.db.execute(
             select(AuditLog).order_by(AuditLog.changed_at.desc()).limit(limit)
         )
         logs = result.scalars().all()
@@ -187,6 +266,6 @@ class DashboardService:
 
 
 # Convenience function
-async def get_dashboard_service(db: Session) -> DashboardService:
+async def get_dashboard_service(db: AsyncSession) -> DashboardService:
     """Factory function for dependency injection."""
     return DashboardService(db)
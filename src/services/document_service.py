@@ -1,15 +1,37 @@
 """Document service for managing file uploads and records."""
 
+import posixpath
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, BinaryIO, List
+from typing import Dict, Iterator, Optional, BinaryIO, List, Tuple
 from sqlalchemy.orm import Session
 
 from src.models.file_attachment import FileAttachment
+from src.models.file_blob import FileBlob
 from src.services.s3_service import get_s3_service
+from src.services.blob_store import acquire_blob, blob_content_exists, delete_blob_content, release_blob
+from src.services.content_hash import StreamHasher, hash_s3_object
 from src.services.file_path_builder import build_file_path
+from src.services.preview_jobs import can_preview, preview_jobs
+from src.services.zip_stream import iter_zip
 from src.config.s3_config import get_s3_settings
 
+# S3 objects opened ahead of the one being written to a zip export
+EXPORT_PREFETCH = 4
+
+
+def _close_body(body) -> None:
+    """Release an open_download body that may not have been read to the end."""
+    if hasattr(body, "close"):
+        body.close()
+
+
+def _close_download(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        _close_body((future.result() or {}).get("body"))
+
 
 class DocumentService:
     """Service for document management operations."""
@@ -20,9 +42,9 @@ class DocumentService:
         self.s3 = get_s3_service()
         self.settings = get_s3_settings()
 
-    def _validate_file(self, filename: str, size: int) -> tuple[bool, str]:
+    def _validate_file(self, filename: str, size: Optional[int]) -> tuple[bool, str]:
         """
-        Validate file extension and size.
+        Validate file extension and size (skipped if the size is not known yet).
 
         Returns:
             Tuple of (is_valid, error_message)
@@ -34,11 +56,19 @@ class DocumentService:
 
         # Check size
         max_size = self.settings.MAX_FILE_SIZE_MB * 1024 * 1024
-        if size > max_size:
+        if size is not None and size > max_size:
             return False, f"File too large. Maximum size: {self.settings.MAX_FILE_SIZE_MB}MB"
 
         return True, ""
 
+    def _read_limited(self, file_data: BinaryIO, hasher: StreamHasher) -> Iterator[bytes]:
+        """Chunks of an upload, hashed and counted, failing once it passes the size limit."""
+        max_size = self.settings.MAX_FILE_SIZE_MB * 1024 * 1024
+        for chunk in hasher.chunks(file_data):
+            if hasher.size > max_size:
+                raise ValueError(f"File too large. Maximum size: {self.settings.MAX_FILE_SIZE_MB}MB")
+            yield chunk
+
     def _generate_s3_key(
         self,
         record_type: str,
@@ -64,7 +94,7 @@ class DocumentService:
         file_data: BinaryIO,
         filename: str,
         content_type: str,
-        size: int,
+        size: Optional[int],
         record_type: str,
         record_id: int,
         category: Optional[str] = None,
@@ -73,11 +103,18 @@ class DocumentService:
         """
         Upload a document to S3 and create a database record.
 
+        The content is stored once per unique file (see blob_store): the
+        spooled upload is hashed first, and only content that is not stored
+        yet is streamed to S3 in multipart parts, so re-uploads send nothing.
+        The file is never held in memory whole. This blocks on S3; async
+        callers run it in a thread pool. Images and PDFs get a thumbnail
+        rendered in the background afterwards (see preview_jobs).
+
         Args:
-            file_data: File content as file-like object
+            file_data: Seekable file-like object, read from its current position
             filename: Original filename
             content_type: MIME type
-            size: File size in bytes
+            size: Declared file size in bytes, if known (the stored size is what was read)
             record_type: Type of record (member, grievance, etc.)
             record_id: ID of the related record
             category: Optional category (grievances, certifications, etc.)
@@ -95,24 +132,26 @@ class DocumentService:
         if not self.s3.ensure_bucket_exists():
             raise RuntimeError("Failed to ensure S3 bucket exists")
 
-        # Generate S3 key
+        # Logical name; the content goes to its blob's key
         s3_key = self._generate_s3_key(record_type, record_id, filename, category)
 
-        # Upload to S3
-        result = self.s3.upload_file(
-            file_data=file_data,
-            object_key=s3_key,
-            content_type=content_type,
-            metadata={
-                "original_filename": filename,
-                "record_type": record_type,
-                "record_id": str(record_id),
-                "uploaded_by": uploaded_by or "system",
-            },
-        )
-
-        if not result:
-            raise RuntimeError("Failed to upload file to S3")
+        # Hash the spooled upload locally before deciding whether to send it
+        start = file_data.tell()
+        hasher = StreamHasher()
+        for _ in self._read_limited(file_data, hasher):
+            pass
+        file_data.seek(start)
+
+        blob, created = acquire_blob(self.db, hasher.hexdigest(), hasher.size, "s3")
+        if created or not blob_content_exists(blob, self.s3):
+            result = self.s3.upload_stream(
+                self._read_limited(file_data, StreamHasher()),
+                object_key=blob.storage_key,
+                content_type=content_type,
+            )
+            if not result:
+                self.db.rollback()
+                raise RuntimeError("Failed to upload file to S3")
 
         # Create database record
         attachment = FileAttachment(
@@ -121,14 +160,20 @@ class DocumentService:
             file_name=s3_key.split("/")[-1],  # Just the filename part
             original_name=filename,
             file_type=content_type,  # MIME type stored in file_type field
-            file_size=size,
-            file_path=s3_key,  # Full S3 key
+            file_size=hasher.size,
+            file_path=blob.storage_key,  # Shared S3 key of the content
+            logical_path=s3_key,
             file_category=category or "general",
+            content_hash=hasher.hexdigest(),
+            blob_id=blob.id,
         )
+        needs_preview = blob.preview_key is None and can_preview(content_type)
         self.db.add(attachment)
         self.db.commit()
         self.db.refresh(attachment)
 
+        if needs_preview:
+            preview_jobs.submit(blob.id, content_type, self.s3)
         return attachment
 
     def get_document(self, document_id: int) -> Optional[FileAttachment]:
@@ -164,22 +209,84 @@ class DocumentService:
             filename=doc.original_name,
         )
 
-    def download_document(self, document_id: int) -> Optional[tuple]:
+    def get_download_urls(
+        self,
+        documents: List[FileAttachment],
+        expiry: Optional[int] = None,
+    ) -> Dict[int, Optional[str]]:
+        """
+        Get presigned download URLs for a page of documents in one call.
+
+        Args:
+            documents: Document records
+            expiry: URL expiry in seconds
+
+        Returns:
+            Presigned URL (None if signing failed) per document ID
+        """
+        files = [(doc.file_path, doc.original_name) for doc in documents]
+        urls = self.s3.get_presigned_urls(dict.fromkeys(files), expiry=expiry, download=True)
+        return {doc.id: urls[file] for doc, file in zip(documents, files)}
+
+    def get_preview_urls(
+        self,
+        documents: List[FileAttachment],
+        expiry: Optional[int] = None,
+    ) -> Dict[int, str]:
+        """
+        Get presigned thumbnail URLs for a page of documents in one call.
+
+        Args:
+            documents: Document records
+            expiry: URL expiry in seconds
+
+        Returns:
+            Presigned URL per document ID, for documents whose preview is ready
+        """
+        blob_ids = {doc.blob_id for doc in documents if doc.blob_id}
+        if not blob_ids:
+            return {}
+
+        previews = dict(
+            self.db.query(FileBlob.id, FileBlob.preview_key)
+            .filter(FileBlob.id.in_(blob_ids), FileBlob.preview_key.isnot(None))
+            .all()
+        )
+        urls = self.s3.get_presigned_urls([(key, None) for key in set(previews.values())], expiry=expiry)
+        return {
+            doc.id: urls[(previews[doc.blob_id], None)]
+            for doc in documents
+            if urls.get((previews.get(doc.blob_id), None))
+        }
+
+    def download_document(
+        self,
+        document_id: int,
+        range_header: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+    ) -> Optional[dict]:
         """
-        Download document content directly.
+        Open a streaming download of a document.
+
+        Args:
+            document_id: Document ID
+            range_header: Client's Range header, forwarded to S3
+            if_none_match: Client's If-None-Match header, forwarded to S3
 
         Returns:
-            Tuple of (BytesIO content, filename, content_type) if successful
+            S3Service.open_download result plus filename, or None if not found
         """
         doc = self.get_document(document_id)
         if not doc:
             return None
 
-        content = self.s3.download_file(doc.file_path)
-        if not content:
+        download = self.s3.open_download(doc.file_path, range_header=range_header, if_none_match=if_none_match)
+        if not download:
             return None
 
-        return content, doc.original_name, doc.file_type
+        download["filename"] = doc.original_name
+        download["content_type"] = doc.file_type or download["content_type"]  # Blobs are shared
+        return download
 
     def delete_document(self, document_id: int, soft_delete: bool = True) -> bool:
         """
@@ -187,7 +294,8 @@ class DocumentService:
 
         Args:
             document_id: Document ID
-            soft_delete: If True, mark as deleted. If False, delete from S3 too.
+            soft_delete: If True, mark as deleted. If False, delete the record and,
+                unless other documents share its content, the S3 object.
 
         Returns:
             True if successful
@@ -200,12 +308,21 @@ class DocumentService:
             doc.is_deleted = True
             doc.deleted_at = datetime.utcnow()
             self.db.commit()
-        else:
+        elif doc.blob_id is None:
             # Delete from S3
             self.s3.delete_file(doc.file_path)
             # Delete from database
             self.db.delete(doc)
             self.db.commit()
+        else:
+            # Shared content is deleted with its last reference
+            blob_id = doc.blob_id
+            self.db.delete(doc)
+            self.db.flush()
+            blob = release_blob(self.db, blob_id)
+            if blob:
+                delete_blob_content(blob, self.s3)
+            self.db.commit()
 
         return True
 
@@ -263,6 +380,90 @@ class DocumentService:
 
         return query.count()
 
+    def export_documents(
+        self,
+        record_type: Optional[str] = None,
+        record_id: Optional[int] = None,
+        category: Optional[str] = None,
+    ) -> Optional[Tuple[int, Iterator[bytes]]]:
+        """
+        Stream a zip archive of every document matching the filters.
+
+        Files are grouped in folders by category. While one file is written,
+        the next EXPORT_PREFETCH are opened on a thread pool so S3 latency
+        overlaps; bodies are read one chunk at a time, so neither the files
+        nor the archive are held whole. Files missing from S3 are listed in
+        MISSING.txt at the end of the archive.
+
+        Returns:
+            (document count, zip byte iterator), or None if no documents match
+        """
+        query = self.db.query(
+            FileAttachment.file_path,
+            FileAttachment.original_name,
+            FileAttachment.file_name,
+            FileAttachment.file_category,
+            FileAttachment.created_at,
+        ).filter(FileAttachment.is_deleted == False)
+
+        if record_type:
+            query = query.filter(FileAttachment.record_type == record_type)
+        if record_id:
+            query = query.filter(FileAttachment.record_id == record_id)
+        if category:
+            query = query.filter(FileAttachment.file_category == category)
+
+        files = []
+        used = set()
+        for row in query.order_by(FileAttachment.file_category, FileAttachment.id):
+            name = f"{row.file_category or 'general'}/{(row.original_name or row.file_name).replace('/', '_')}"
+            stem, ext = posixpath.splitext(name)
+            n = 1
+            while name in used:  # Same filename twice: "report (2).pdf"
+                n += 1
+                name = f"{stem} ({n}){ext}"
+            used.add(name)
+            files.append((name, row.file_path, row.created_at))
+
+        if not files:
+            return None
+        return len(files), iter_zip(self._export_entries(files))
+
+    def _export_entries(self, files: List[tuple]) -> Iterator[tuple]:
+        """Zip entries for export_documents, opening upcoming objects concurrently."""
+        missing = []
+        remaining = iter(files)
+        pending = deque()
+        body = None
+        pool = ThreadPoolExecutor(max_workers=EXPORT_PREFETCH)
+
+        def open_next() -> None:
+            for name, path, modified in remaining:
+                pending.append((name, modified, pool.submit(self.s3.open_download, path)))
+                return
+
+        try:
+            for _ in range(EXPORT_PREFETCH):
+                open_next()
+            while pending:
+                name, modified, future = pending.popleft()
+                open_next()
+                download = future.result()
+                if not download or download["body"] is None:
+                    missing.append(name)
+                    continue
+                body = download["body"]
+                yield name, body, modified
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            # Stopped early (client went away): release the open and prefetched downloads
+            for _, _, future in pending:
+                future.add_done_callback(_close_download)
+            _close_body(body)
+
+        if missing:
+            yield "MISSING.txt", ["\n".join(missing).encode() + b"\n"], None
+
     def get_presigned_upload_url(
         self,
         filename: str,
@@ -317,13 +518,25 @@ class DocumentService:
         """
         Confirm a direct upload and create database record.
 
-        Called after client completes presigned URL upload.
+        Called after client completes presigned URL upload. As with
+        upload_document, a thumbnail is rendered in the background.
         """
         # Verify file exists in S3
         metadata = self.s3.get_file_metadata(s3_key)
         if not metadata:
             raise RuntimeError("File not found in S3")
 
+        # The client uploaded straight to S3, so hash what actually landed there
+        try:
+            content_hash, _ = hash_s3_object(self.s3, s3_key)
+        except FileNotFoundError:
+            raise RuntimeError("File not found in S3")
+
+        # New content: the uploaded object becomes the blob. Known content: drop the copy
+        blob, created = acquire_blob(self.db, content_hash, metadata["size"], "s3", storage_key=s3_key)
+        if not created and blob.storage_key != s3_key:
+            self.s3.delete_file(s3_key)
+
         # Create database record
         attachment = FileAttachment(
             record_type=record_type,
@@ -332,11 +545,17 @@ class DocumentService:
             original_name=filename,
             file_type=content_type,
             file_size=metadata["size"],
-            file_path=s3_key,
+            file_path=blob.storage_key,
+            logical_path=s3_key,
             file_category=category or "general",
+            content_hash=content_hash,
+            blob_id=blob.id,
         )
+        needs_preview = blob.preview_key is None and can_preview(content_type)
         self.db.add(attachment)
         self.db.commit()
         self.db.refresh(attachment)
 
+        if needs_preview:
+            preview_jobs.submit(blob.id, content_type, self.s3)
         return attachment
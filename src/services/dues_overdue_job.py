@@ -0,0 +1,109 @@
+"""Scheduled overdue dues sweep with run metrics.
+
+Run nightly from cron (or a platform cron job):
+    0 1 * * * cd /app && ./ip2adb dues-overdue --if-due
+
+Each run appends its metrics (rows updated, batches, duration) to a daily
+JSONL file so sweep cost can be tracked as payment history grows.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from src.schemas.dues_payment import OverdueSweepResult
+from src.services.dues_payment_service import run_overdue_sweep
+
+
+class OverdueSweepJob:
+    """Run the overdue sweep on its own session and record metrics."""
+
+    def __init__(
+        self,
+        db_session_factory: Callable[[], Session],
+        log_dir: str = "/app/logs/dues_jobs",
+    ):
+        """
+        Initialize the job.
+
+        Args:
+            db_session_factory: Function that returns a database session
+            log_dir: Directory for run metrics and the last-run marker
+        """
+        self.db_session_factory = db_session_factory
+        self.log_dir = log_dir
+        self.last_run_file = os.path.join(log_dir, ".overdue_last_run")
+        os.makedirs(self.log_dir, exist_ok=True)
+
+    def run(self, batch_size: Optional[int] = 1000, dry_run: bool = False) -> dict:
+        """
+        Run one sweep and log its metrics.
+
+        Returns:
+            Metrics dictionary (also appended to the daily JSONL log)
+        """
+        run_id = f"OD-{int(datetime.now().timestamp())}"
+        timestamp = datetime.now()
+
+        db = self.db_session_factory()
+        try:
+            result: OverdueSweepResult = run_overdue_sweep(
+                db, batch_size=batch_size, dry_run=dry_run
+            )
+            metrics = {
+                "run_id": run_id,
+                "timestamp": timestamp.isoformat(),
+                "batch_size": batch_size,
+                "success": True,
+                "error_message": None,
+                **result.model_dump(mode="json"),
+            }
+        except Exception as e:
+            db.rollback()
+            metrics = {
+                "run_id": run_id,
+                "timestamp": timestamp.isoformat(),
+                "batch_size": batch_size,
+                "success": False,
+                "error_message": str(e),
+                "updated": 0,
+                "batches": 0,
+                "dry_run": dry_run,
+            }
+        finally:
+            db.close()
+
+        self._log_result(metrics)
+        if metrics["success"] and not dry_run:
+            with open(self.last_run_file, "w") as f:
+                f.write(timestamp.isoformat())
+        return metrics
+
+    def should_run(self, interval_hours: int = 24) -> bool:
+        """Check if enough time has passed since the last successful sweep."""
+        if not os.path.exists(self.last_run_file):
+            return True
+
+        with open(self.last_run_file, "r") as f:
+            last_run = datetime.fromisoformat(f.read().strip())
+
+        return (datetime.now() - last_run).total_seconds() >= interval_hours * 3600
+
+    def run_if_due(
+        self, interval_hours: int = 24, batch_size: Optional[int] = 1000
+    ) -> Optional[dict]:
+        """Run the sweep if it is due. Returns metrics, or None if skipped."""
+        if not self.should_run(interval_hours):
+            return None
+        return self.run(batch_size=batch_size)
+
+    def _log_result(self, metrics: dict) -> None:
+        """Append run metrics to the daily JSONL log."""
+        log_file = os.path.join(
+            self.log_dir, f"{datetime.now().strftime('%Y-%m-%d')}_overdue_sweep.jsonl"
+        )
+        with open(log_file, "a") as f:
+            f.write(json.dumps(metrics) + "\n")
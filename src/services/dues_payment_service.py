@@ -2,22 +2,28 @@
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
+import time
 import uuid
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import String, and_, cast, exists, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.db.enums import DuesPaymentStatus, MemberStatus
 from src.models.dues_payment import DuesPayment
 from src.models.dues_period import DuesPeriod
+from src.models.dues_rate import DuesRate
 from src.models.member import Member
 from src.schemas.dues_payment import (
+    DuesGenerationResult,
     DuesPaymentCreate,
     DuesPaymentRecord,
     DuesPaymentUpdate,
     MemberDuesSummary,
+    OverdueSweepResult,
 )
-from src.services import dues_rate_service, dues_period_service
+from src.services import dues_period_service
+from src.services.dues_summary_service import refresh_period_summaries
 
 
 def get_payment(db: Session, payment_id: int) -> Optional[DuesPayment]:
@@ -158,77 +164,196 @@ def generate_period_dues(
     db: Session,
     period_id: int,
     member_ids: Optional[list[int]] = None
-) -> list[DuesPayment]:
-    """Generate dues records for all active members for a period."""
+) -> DuesGenerationResult:
+    """
+    Generate dues records for all active members for a period.
+
+    Set-based: rates are resolved once per classification and every missing
+    bill is created by a single INSERT ... SELECT ... ON CONFLICT DO NOTHING,
+    so the cost no longer grows with one round-trip per member.
+    """
     period = dues_period_service.get_period(db, period_id)
     if not period:
         raise ValueError(f"Period {period_id} not found")
 
-    # Get active members
-    query = db.query(Member).filter(Member.status == MemberStatus.ACTIVE)
-    if member_ids:
-        query = query.filter(Member.id.in_(member_ids))
-
-    members = query.all()
-    payments = []
-
-    for member in members:
-        # Check if payment record already exists
-        existing = db.query(DuesPayment).filter(
-            DuesPayment.member_id == member.id,
-            DuesPayment.period_id == period_id,
-            DuesPayment.deleted_at.is_(None)
-        ).first()
-
-        if existing:
-            payments.append(existing)
-            continue
-
-        # Get rate for this member's classification
-        rate = dues_rate_service.get_rate_for_date(
-            db,
-            member.classification,
-            date(period.period_year, period.period_month, 1)
+    period_start = date(period.period_year, period.period_month, 1)
+    now = datetime.utcnow()
+
+    # Effective rate per classification on the period start date (latest wins)
+    rates = (
+        select(DuesRate.classification, DuesRate.monthly_amount)
+        .where(
+            DuesRate.effective_date <= period_start,
+            or_(DuesRate.end_date.is_(None), DuesRate.end_date >= period_start),
         )
+        .distinct(DuesRate.classification)
+        .order_by(DuesRate.classification, DuesRate.effective_date.desc())
+        .cte("period_rates")
+    )
 
-        if not rate:
-            continue  # Skip if no rate defined
+    already_billed = exists().where(
+        DuesPayment.member_id == Member.id,
+        DuesPayment.period_id == period_id,
+        DuesPayment.deleted_at.is_(None),
+    )
 
-        payment = DuesPayment(
-            member_id=member.id,
-            period_id=period_id,
-            amount_due=rate.monthly_amount,
-            status=DuesPaymentStatus.PENDING,
-            receipt_number=f"RCP-{period.period_year}{period.period_month:02d}-{uuid.uuid4().hex[:8].upper()}"
+    member_filter = [Member.status == MemberStatus.ACTIVE]
+    if member_ids:
+        member_filter.append(Member.id.in_(member_ids))
+
+    # Counts for the result, taken before the insert changes "already billed"
+    counts = db.execute(
+        select(
+            func.count(Member.id).label("active_members"),
+            func.count(Member.id).filter(already_billed).label("existing"),
+            func.count(Member.id)
+            .filter(and_(rates.c.monthly_amount.is_(None), ~already_billed))
+            .label("no_rate"),
         )
-        db.add(payment)
-        payments.append(payment)
+        .select_from(Member)
+        .outerjoin(rates, rates.c.classification == Member.classification)
+        .where(*member_filter)
+    ).one()
+
+    receipt_prefix = f"RCP-{period.period_year}{period.period_month:02d}-"
+    # Full 128-bit digest: receipt_number is unique, and a collision would otherwise fail the whole run
+    receipt_suffix = func.upper(func.md5(func.random().cast(String) + cast(Member.id, String)))
+
+    new_bills = (
+        select(
+            Member.id,
+            literal(period_id),
+            rates.c.monthly_amount,
+            literal(Decimal("0")),
+            literal(DuesPaymentStatus.PENDING, DuesPayment.status.type),
+            literal(receipt_prefix) + receipt_suffix,
+            literal(False),
+            literal(now),
+            literal(now),
+        )
+        .select_from(Member)
+        .join(rates, rates.c.classification == Member.classification)
+        .where(*member_filter, ~already_billed)
+    )
 
+    stmt = (
+        pg_insert(DuesPayment)
+        .from_select(
+            [
+                "member_id",
+                "period_id",
+                "amount_due",
+                "amount_paid",
+                "status",
+                "receipt_number",
+                "is_deleted",
+                "created_at",
+                "updated_at",
+            ],
+            new_bills,
+        )
+        .on_conflict_do_nothing(
+            index_elements=["member_id", "period_id"],
+            index_where=DuesPayment.deleted_at.is_(None),
+        )
+    )
+    created = db.execute(stmt).rowcount
+    if created:
+        # Core INSERT bypasses the ORM flush hook that maintains the rollup
+        refresh_period_summaries(db, [period_id])
     db.commit()
-    return payments
 
+    return DuesGenerationResult(
+        period_id=period_id,
+        active_members=counts.active_members,
+        created=created,
+        already_existing=counts.existing,
+        skipped_no_rate=counts.no_rate,
+    )
 
-def update_overdue_status(db: Session) -> int:
-    """Update status to OVERDUE for past-grace-period unpaid dues. Returns count updated."""
-    today = date.today()
-
-    # Find payments that should be marked overdue
-    payments = db.query(DuesPayment).join(DuesPayment.period).filter(
-        and_(
-            DuesPayment.status.in_([DuesPaymentStatus.PENDING, DuesPaymentStatus.DUE, DuesPaymentStatus.PARTIAL]),
-            DuesPeriod.grace_period_end < today,
-            DuesPayment.deleted_at.is_(None)
+
+def _overdue_filter(as_of: date) -> list:
+    """Payments past their period's grace end that are still not paid in full."""
+    return [
+        DuesPayment.period_id == DuesPeriod.id,
+        DuesPayment.status.in_([DuesPaymentStatus.PENDING, DuesPaymentStatus.DUE, DuesPaymentStatus.PARTIAL]),
+        DuesPeriod.grace_period_end < as_of,
+        DuesPayment.deleted_at.is_(None),
+        DuesPayment.amount_paid < DuesPayment.amount_due,
+    ]
+
+
+def run_overdue_sweep(
+    db: Session,
+    batch_size: Optional[int] = 1000,
+    as_of: Optional[date] = None,
+    dry_run: bool = False,
+) -> OverdueSweepResult:
+    """
+    Mark past-grace-period unpaid dues OVERDUE with set-based UPDATEs.
+
+    Each batch is one ``UPDATE dues_payments ... FROM dues_periods ...
+    RETURNING id`` limited to ``batch_size`` rows and committed on its own,
+    so Python memory and lock duration stay bounded however large the
+    payment history grows. Updated rows drop out of the filter, so the loop
+    ends when a batch comes back short. ``batch_size=None`` runs one UPDATE.
+    """
+    as_of = as_of or date.today()
+    started = time.monotonic()
+
+    if dry_run:
+        eligible = db.execute(
+            select(func.count(DuesPayment.id)).where(*_overdue_filter(as_of))
+        ).scalar() or 0
+        return OverdueSweepResult(
+            as_of=as_of,
+            updated=eligible,
+            batches=0,
+            duration_seconds=round(time.monotonic() - started, 3),
+            dry_run=True,
         )
-    ).all()
 
-    count = 0
-    for payment in payments:
-        if Decimal(str(payment.amount_paid)) < Decimal(str(payment.amount_due)):
-            payment.status = DuesPaymentStatus.OVERDUE
-            count += 1
+    updated = 0
+    batches = 0
+    while True:
+        stmt = (
+            update(DuesPayment)
+            .where(*_overdue_filter(as_of))
+            .values(status=DuesPaymentStatus.OVERDUE, updated_at=datetime.utcnow())
+            .returning(DuesPayment.id)
+        )
+        if batch_size:
+            batch_ids = (
+                select(DuesPayment.id)
+                .where(*_overdue_filter(as_of))
+                .order_by(DuesPayment.id)
+                .limit(batch_size)
+                .with_for_update(of=DuesPayment, skip_locked=True)
+                .correlate(None)  # standalone subquery, not tied to the UPDATE's tables
+            )
+            stmt = stmt.where(DuesPayment.id.in_(batch_ids.scalar_subquery()))
+
+        count = len(
+            db.execute(stmt, execution_options={"synchronize_session": False}).all()
+        )
+        db.commit()
+
+        batches += 1
+        updated += count
+        if not batch_size or count < batch_size:
+            break
+
+    return OverdueSweepResult(
+        as_of=as_of,
+        updated=updated,
+        batches=batches,
+        duration_seconds=round(time.monotonic() - started, 3),
+    )
 
-    db.commit()
-    return count
+
+def update_overdue_status(db: Session) -> int:
+    """Update status to OVERDUE for past-grace-period unpaid dues. Returns count updated."""
+    return run_overdue_sweep(db).updated
 
 
 def get_member_dues_summary(db: Session, member_id: int) -> Optional[MemberDuesSummary]:
@@ -0,0 +1,150 @@
+"""
+Dues Summary Service - per-period dues totals for reports.
+
+Totals live in the dues_period_summaries rollup table. Rows are recomputed
+with one GROUP BY statement for every period whose payments change in a
+flush, so reports read a single row per period instead of loading payments.
+"""
+
+import calendar
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, event, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, attributes
+
+from src.db.enums import DuesPaymentStatus
+from src.models.dues_payment import DuesPayment
+from src.models.dues_period import DuesPeriod
+from src.models.dues_period_summary import DuesPeriodSummary
+
+
+def period_totals_query(period_ids: Optional[Iterable[int]] = None):
+    """
+    Live totals per period in one GROUP BY (soft-deleted payments excluded).
+
+    Periods without payments are included with zero totals.
+    """
+    stmt = (
+        select(
+            DuesPeriod.id.label("period_id"),
+            func.count(DuesPayment.id).label("member_count"),
+            func.count(DuesPayment.id)
+            .filter(DuesPayment.status == DuesPaymentStatus.PAID)
+            .label("paid_count"),
+            func.coalesce(func.sum(DuesPayment.amount_due), 0).label("total_due"),
+            func.coalesce(func.sum(DuesPayment.amount_paid), 0).label("total_paid"),
+        )
+        .select_from(DuesPeriod)
+        .outerjoin(
+            DuesPayment,
+            and_(
+                DuesPayment.period_id == DuesPeriod.id,
+                DuesPayment.deleted_at.is_(None),
+            ),
+        )
+        .group_by(DuesPeriod.id)
+    )
+    if period_ids is not None:
+        stmt = stmt.where(DuesPeriod.id.in_(list(period_ids)))
+    return stmt
+
+
+def refresh_period_summaries(db: Session, period_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    Recompute rollup rows for the given periods (all periods if None).
+
+    The period rows are locked first (FOR NO KEY UPDATE, which does not block
+    payment inserts) so concurrent writers to the same period serialize and
+    the last committer's recompute sees every committed payment.
+    Does not commit; runs inside the caller's transaction.
+    """
+    if period_ids is not None:
+        period_ids = sorted(set(period_ids))
+        if not period_ids:
+            return
+        db.execute(
+            select(DuesPeriod.id)
+            .where(DuesPeriod.id.in_(period_ids))
+            .order_by(DuesPeriod.id)
+            .with_for_update(key_share=True)
+        )
+
+    totals = period_totals_query(period_ids).subquery()
+    stmt = pg_insert(DuesPeriodSummary).from_select(
+        ["period_id", "member_count", "paid_count", "total_due", "total_paid", "refreshed_at"],
+        select(
+            totals.c.period_id,
+            totals.c.member_count,
+            totals.c.paid_count,
+            totals.c.total_due,
+            totals.c.total_paid,
+            func.now(),
+        ),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DuesPeriodSummary.period_id],
+        set_={
+            "member_count": stmt.excluded.member_count,
+            "paid_count": stmt.excluded.paid_count,
+            "total_due": stmt.excluded.total_due,
+            "total_paid": stmt.excluded.total_paid,
+            "refreshed_at": stmt.excluded.refreshed_at,
+        },
+    )
+    db.execute(stmt)
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_summaries_after_flush(session: Session, flush_context) -> None:
+    """Keep the rollup in step with ORM writes to dues payments."""
+    period_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, DuesPayment):
+            continue
+        # Include the old period when a payment is moved between periods
+        history = attributes.get_history(obj, "period_id")
+        period_ids.update(pid for pid in history.sum() if pid)
+
+    if period_ids:
+        refresh_period_summaries(session, period_ids)
+
+
+def get_period_summaries(db: Session, year: int) -> List[Dict[str, Any]]:
+    """
+    Summary rows for every period in a year, read from the rollup in one query.
+
+    Returns dicts with period_name, month, is_closed, total_due, total_paid,
+    collection_rate, member_count and paid_count.
+    """
+    rows = db.execute(
+        select(
+            DuesPeriod.period_year,
+            DuesPeriod.period_month,
+            DuesPeriod.is_closed,
+            func.coalesce(DuesPeriodSummary.member_count, 0).label("member_count"),
+            func.coalesce(DuesPeriodSummary.paid_count, 0).label("paid_count"),
+            func.coalesce(DuesPeriodSummary.total_due, 0).label("total_due"),
+            func.coalesce(DuesPeriodSummary.total_paid, 0).label("total_paid"),
+        )
+        .outerjoin(DuesPeriodSummary, DuesPeriodSummary.period_id == DuesPeriod.id)
+        .where(DuesPeriod.period_year == year)
+        .order_by(DuesPeriod.period_month)
+    ).all()
+
+    summaries = []
+    for row in rows:
+        total_due = Decimal(row.total_due)
+        total_paid = Decimal(row.total_paid)
+        summaries.append({
+            "period_name": f"{calendar.month_name[row.period_month]} {row.period_year}",
+            "month": row.period_month,
+            "is_closed": row.is_closed,
+            "total_due": total_due,
+            "total_paid": total_paid,
+            "collection_rate": (total_paid / total_due * 100) if total_due > 0 else Decimal("0"),
+            "member_count": row.member_count,
+            "paid_count": row.paid_count,
+        })
+    return summaries
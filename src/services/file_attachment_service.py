@@ -1,10 +1,16 @@
 import os
+import shutil
+import uuid
 from datetime import date
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
 from src.models.file_attachment import FileAttachment
+from src.services.blob_store import acquire_blob, blob_content_exists
+from src.services.content_hash import StreamHasher
 from src.services.file_path_builder import build_file_path, sanitize_filename
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
 
 def resolve_file_path(
     record_type: str,
@@ -35,13 +41,26 @@ def resolve_file_path(
     )
 
 
-def save_uploaded_file(file_path: str, file: UploadFile) -> str:
-    """Save the uploaded file to the organized path on disk."""
+def save_uploaded_file(file_path: str, file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
+    """Save the uploaded file to the organized path on disk.
+
+    The upload is copied chunk by chunk into a temporary file next to the
+    target and renamed into place, so memory stays bounded and the path
+    never holds a partial file. This blocks; async handlers call it through
+    run_in_threadpool.
+    """
     folder = os.path.dirname(file_path)
     os.makedirs(folder, exist_ok=True)
 
-    with open(file_path, "wb") as f:
-        f.write(file.file.read())
+    tmp_path = f"{file_path}.{uuid.uuid4().hex}.part"
+    try:
+        with open(tmp_path, "xb") as f:
+            shutil.copyfileobj(file.file, f, chunk_size)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
     return file_path
 
@@ -55,10 +74,15 @@ def create_file_attachment(
     entity_name: str | None = None,
     entity_id: str | int | None = None,
 ):
-    """Create a file attachment with organized path structure."""
+    """Create a file attachment with organized path structure.
+
+    The organized path is the attachment's logical_path. The content is
+    stored once per unique file (see blob_store), so uploading a file that
+    is already stored writes nothing.
+    """
     file_category = getattr(data, "file_category", "general") or "general"
 
-    file_path = resolve_file_path(
+    logical_path = resolve_file_path(
         record_type=data.record_type,
         record_id=data.record_id,
         filename=file.filename,
@@ -69,7 +93,14 @@ def create_file_attachment(
         entity_id=entity_id,
     )
 
-    save_uploaded_file(file_path, file)
+    hasher = StreamHasher()
+    for _ in hasher.chunks(file.file):
+        pass
+    file.file.seek(0)
+
+    blob, created = acquire_blob(db, hasher.hexdigest(), hasher.size, "local")
+    if created or not blob_content_exists(blob):
+        save_uploaded_file(blob.storage_key, file)
 
     safe_filename = sanitize_filename(file.filename)
     new_file = FileAttachment(
@@ -78,9 +109,12 @@ def create_file_attachment(
         file_category=file_category,
         file_name=safe_filename,
         original_name=file.filename,
-        file_path=file_path,
+        file_path=blob.storage_key,
+        logical_path=logical_path,
         file_type=file.content_type,
-        file_size=file.file._file.tell(),
+        file_size=hasher.size,
+        content_hash=hasher.hexdigest(),
+        blob_id=blob.id,
         description=data.description,
     )
 
@@ -1,5 +1,5 @@
 """
-File path builder for organized file storage.
+File path builder for organized file naming.
 
 Generates human-readable, collision-proof paths like:
     uploads/members/Smith_John_M7464416/grievances/2026/01-January/document.pdf
@@ -13,6 +13,9 @@ Design decisions:
 - Category subfolder groups files by business domain
 - Year/month provides chronological organization
 - Original filename preserved (sanitized) for recognition
+
+These paths are logical names (FileAttachment.logical_path). File content
+is stored once per unique file under UPLOAD_ROOT/blobs by blob_store.
 """
 
 import os
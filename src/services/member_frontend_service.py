@@ -2,13 +2,18 @@
 Member Frontend Service - Stats and queries for member pages.
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, or_, cast, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, REAL, array
 from sqlalchemy.orm import selectinload
-from typing import Optional, List, Tuple
+from typing import Any, Optional, List, Tuple
 from datetime import date
 from decimal import Decimal
+import base64
+import binascii
+import json
 import logging
+import re
 
 from src.models.member import Member
 from src.models.member_employment import MemberEmployment
@@ -17,11 +22,52 @@ from src.db.enums import MemberStatus, MemberClassification, DuesPaymentStatus
 
 logger = logging.getLogger(__name__)
 
+# Search results report an exact total up to this many matches, then "N+"
+SEARCH_COUNT_CAP = 1000
+
+# ts_rank weights, {D, C, B, A}: unused, email, names, member number
+_SEARCH_RANK_WEIGHTS = [0.1, 0.4, 0.7, 1.0]
+
+_SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_member_tsquery(query: Optional[str]) -> Optional[str]:
+    """
+    Turn free text into a prefix tsquery: "jo smi" -> "jo:* & smi:*".
+
+    Every word must match the start of a word in the member number, names or
+    email. Returns None when the text has no searchable words.
+    """
+    if not query:
+        return None
+    tokens = _SEARCH_TOKEN_RE.findall(query.lower())
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def encode_search_cursor(values: List[Any]) -> str:
+    """Opaque keyset cursor for the last row on a page."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_search_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """Decode a keyset cursor; malformed cursors are treated as the first page."""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        return None
+    if not isinstance(values, list) or len(values) != size:
+        return None
+    return values
+
 
 class MemberFrontendService:
     """Service for member frontend operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     # ============================================================
@@ -35,13 +81,13 @@ class MemberFrontendService:
         """
         # Total members (not deleted)
         total_stmt = select(func.count(Member.id)).where(Member.deleted_at.is_(None))
-        total = (self.db.execute(total_stmt)).scalar() or 0
+        total = (await self.db.execute(total_stmt)).scalar() or 0
 
         # Active members
         active_stmt = select(func.count(Member.id)).where(
             and_(Member.deleted_at.is_(None), Member.status == MemberStatus.ACTIVE)
         )
-        active = (self.db.execute(active_stmt)).scalar() or 0
+        active = (await self.db.execute(active_stmt)).scalar() or 0
 
         # New this month
         month_start = date.today().replace(day=1)
@@ -50,25 +96,25 @@ class MemberFrontendService:
                 Member.deleted_at.is_(None), func.date(Member.created_at) >= month_start
             )
         )
-        new_this_month = (self.db.execute(new_stmt)).scalar() or 0
+        new_this_month = (await self.db.execute(new_stmt)).scalar() or 0
 
         # Inactive members
         inactive_stmt = select(func.count(Member.id)).where(
             and_(Member.deleted_at.is_(None), Member.status == MemberStatus.INACTIVE)
         )
-        inactive = (self.db.execute(inactive_stmt)).scalar() or 0
+        inactive = (await self.db.execute(inactive_stmt)).scalar() or 0
 
         # Suspended members
         suspended_stmt = select(func.count(Member.id)).where(
             and_(Member.deleted_at.is_(None), Member.status == MemberStatus.SUSPENDED)
         )
-        suspended = (self.db.execute(suspended_stmt)).scalar() or 0
+        suspended = (await self.db.execute(suspended_stmt)).scalar() or 0
 
         # Retired members
         retired_stmt = select(func.count(Member.id)).where(
             and_(Member.deleted_at.is_(None), Member.status == MemberStatus.RETIRED)
         )
-        retired = (self.db.execute(retired_stmt)).scalar() or 0
+        retired = (await self.db.execute(retired_stmt)).scalar() or 0
 
         # Calculate dues current percentage (simplified - based on active with recent payment)
         # This is a simplified version - adjust based on your actual dues logic
@@ -98,7 +144,7 @@ class MemberFrontendService:
             .order_by(func.count(Member.id).desc())
         )
 
-        result = self.db.execute(stmt)
+        result = await self.db.execute(stmt)
         rows = result.fetchall()
 
         breakdown = []
@@ -126,7 +172,7 @@ class MemberFrontendService:
             .limit(limit)
         )
 
-        result = self.db.execute(stmt)
+        result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
     # ============================================================
@@ -138,44 +184,26 @@ class MemberFrontendService:
         query: Optional[str] = None,
         status: Optional[str] = None,
         classification: Optional[str] = None,
-        page: int = 1,
+        cursor: Optional[str] = None,
         per_page: int = 20,
-    ) -> Tuple[List[Member], int, int]:
-        """
-        Search members with filters and pagination.
-        Returns (members, total_count, total_pages).
+    ) -> Tuple[List[Member], int, Optional[str]]:
         """
-        # Base query with eager loading
-        stmt = (
-            select(Member)
-            .options(
-                selectinload(Member.employments).selectinload(
-                    MemberEmployment.organization
-                )
-            )
-            .where(Member.deleted_at.is_(None))
-        )
+        Search members with filters and keyset pagination.
 
-        # Apply search filter
-        if query and query.strip():
-            search_term = f"%{query.strip()}%"
-            stmt = stmt.where(
-                or_(
-                    Member.member_number.ilike(search_term),
-                    Member.first_name.ilike(search_term),
-                    Member.last_name.ilike(search_term),
-                    Member.email.ilike(search_term),
-                    func.concat(Member.first_name, " ", Member.last_name).ilike(
-                        search_term
-                    ),
-                )
-            )
+        Text queries go through the GIN-indexed search_vector and are ranked
+        by relevance; without a query members are listed by name. The total is
+        capped at SEARCH_COUNT_CAP + 1 so counting never scans every match.
+
+        Returns (members, total_count, next_cursor); next_cursor is None on
+        the last page.
+        """
+        filters = [Member.deleted_at.is_(None)]
 
         # Apply status filter
         if status and status != "all":
             try:
                 status_enum = MemberStatus(status)
-                stmt = stmt.where(Member.status == status_enum)
+                filters.append(Member.status == status_enum)
             except ValueError:
                 pass  # Invalid status, ignore filter
 
@@ -183,24 +211,67 @@ class MemberFrontendService:
         if classification and classification != "all":
             try:
                 class_enum = MemberClassification(classification)
-                stmt = stmt.where(Member.classification == class_enum)
+                filters.append(Member.classification == class_enum)
             except ValueError:
                 pass  # Invalid classification, ignore filter
 
-        # Get total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = (self.db.execute(count_stmt)).scalar() or 0
-
-        # Apply sorting and pagination
-        stmt = stmt.order_by(Member.last_name, Member.first_name)
-        stmt = stmt.offset((page - 1) * per_page).limit(per_page)
+        # Apply search filter
+        tsquery = build_member_tsquery(query)
+        if tsquery:
+            ts = func.to_tsquery("simple", tsquery)
+            filters.append(Member.search_vector.op("@@")(ts))
+            rank = func.ts_rank(
+                cast(array(_SEARCH_RANK_WEIGHTS), ARRAY(REAL)), Member.search_vector, ts
+            )
 
-        result = self.db.execute(stmt)
-        members = list(result.unique().scalars().all())
+        # Capped count: stop counting after SEARCH_COUNT_CAP + 1 matches
+        capped = (
+            select(Member.id).where(*filters).limit(SEARCH_COUNT_CAP + 1).subquery()
+        )
+        total = (
+            await self.db.execute(select(func.count()).select_from(capped))
+        ).scalar() or 0
 
-        total_pages = (total + per_page - 1) // per_page
+        # Base query with eager loading
+        stmt = select(Member).options(
+            selectinload(Member.employments).selectinload(MemberEmployment.organization)
+        )
+        if tsquery:
+            stmt = stmt.add_columns(rank.label("rank")).order_by(rank.desc(), Member.id)
+            after = decode_search_cursor(cursor, 2)
+            if after:
+                filters.append(
+                    or_(
+                        rank < after[0],
+                        and_(rank == after[0], Member.id > after[1]),
+                    )
+                )
+        else:
+            sort_key = (Member.last_name, Member.first_name, Member.id)
+            stmt = stmt.order_by(*sort_key)
+            after = decode_search_cursor(cursor, 3)
+            if after:
+                filters.append(tuple_(*sort_key) > tuple_(*after))
+
+        # One extra row tells us whether there is a next page
+        stmt = stmt.where(*filters).limit(per_page + 1)
+        rows = (await self.db.execute(stmt)).all()
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        members = [row[0] for row in rows]
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            if tsquery:
+                next_cursor = encode_search_cursor([last.rank, last[0].id])
+            else:
+                member = last[0]
+                next_cursor = encode_search_cursor(
+                    [member.last_name, member.first_name, member.id]
+                )
 
-        return members, total, total_pages
+        return members, total, next_cursor
 
     async def get_member_by_id(self, member_id: int) -> Optional[Member]:
         """Get a single member by ID with relationships loaded."""
@@ -213,7 +284,7 @@ class MemberFrontendService:
             )
             .where(and_(Member.id == member_id, Member.deleted_at.is_(None)))
         )
-        result = self.db.execute(stmt)
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_member_current_employer(self, member: Member) -> Optional[dict]:
@@ -242,7 +313,7 @@ class MemberFrontendService:
             .order_by(MemberEmployment.start_date.desc())
         )
 
-        result = self.db.execute(stmt)
+        result = await self.db.execute(stmt)
         employments = result.scalars().all()
 
         history = []
@@ -296,7 +367,7 @@ class MemberFrontendService:
             .limit(6)
         )
 
-        result = self.db.execute(stmt)
+        result = await self.db.execute(stmt)
         payments = list(result.scalars().all())
 
         # Determine overall status
@@ -395,5 +466,5 @@ class MemberFrontendService:
 
 
 # Convenience function
-async def get_member_frontend_service(db: Session) -> MemberFrontendService:
+async def get_member_frontend_service(db: AsyncSession) -> MemberFrontendService:
     return MemberFrontendService(db)
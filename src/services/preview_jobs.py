@@ -0,0 +1,243 @@
+"""
+Preview Jobs - thumbnails for document list views, generated off the request.
+
+Member photos and scanned IDs are often multi-megabyte 12MP images, while a
+list row only needs a small picture. After an upload commits, DocumentService
+queues its blob here; a small thread pool downloads the content, renders a
+JPEG no larger than PREVIEW_MAX_DIMENSION (the first page, for PDFs) and
+stores it next to the content as ``<storage_key>.preview.jpg``. The blob's
+preview_key is set once the thumbnail is stored, so list views only link
+previews that exist.
+
+Previews belong to blobs, so identical uploads share one. PDF previews need
+pypdfium2; without it PDFs keep their file-type icon.
+"""
+
+import io
+import logging
+import tempfile
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Optional, Set
+
+from PIL import Image, ImageOps
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from src.config.settings import settings
+from src.db.session import SessionLocal
+from src.models.file_blob import FileBlob
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_SUFFIX = ".preview.jpg"
+PREVIEW_CONTENT_TYPE = "image/jpeg"
+PREVIEW_JPEG_QUALITY = 80
+
+# Source content larger than this is spooled to disk while it is rendered
+SOURCE_SPOOL_SIZE = 8 * 1024 * 1024
+
+IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp", "image/tiff", "image/bmp"}
+
+# Lazy import for pypdfium2 (optional, PDF previews only)
+_pdfium = None
+
+
+def _get_pdfium():
+    """Lazy load pypdfium2 - only imported when PDF previews are needed."""
+    global _pdfium
+    if _pdfium is None:
+        try:
+            import pypdfium2
+            _pdfium = pypdfium2
+        except ImportError:
+            _pdfium = False
+    return _pdfium
+
+
+def can_preview(content_type: Optional[str]) -> bool:
+    """Whether a preview can be rendered for this MIME type."""
+    if content_type in IMAGE_TYPES:
+        return True
+    return content_type == "application/pdf" and bool(_get_pdfium())
+
+
+def preview_key_for(storage_key: str) -> str:
+    """Key of the preview stored alongside a blob's content."""
+    return f"{storage_key}{PREVIEW_SUFFIX}"
+
+
+def _render_pdf_page(source: BinaryIO, max_dimension: int) -> Image.Image:
+    """Rasterize the first page of a PDF at thumbnail size."""
+    pdf = _get_pdfium().PdfDocument(source)
+    try:
+        page = pdf[0]
+        width, height = page.get_size()
+        bitmap = page.render(scale=max_dimension / max(width, height))
+        return bitmap.to_pil().copy()  # Detach from the document's buffers before closing it
+    finally:
+        pdf.close()
+
+
+def render_thumbnail(source: BinaryIO, content_type: str, max_dimension: int) -> bytes:
+    """
+    Render a JPEG thumbnail of an image, or of the first page of a PDF.
+
+    Args:
+        source: Seekable file with the original content
+        content_type: MIME type of the original
+        max_dimension: Longest side of the thumbnail in pixels
+
+    Returns:
+        JPEG bytes
+    """
+    if content_type == "application/pdf":
+        image = _render_pdf_page(source, max_dimension)
+    else:
+        image = Image.open(source)
+        # JPEG: decode at 1/2, 1/4 or 1/8 scale instead of the full 12MP
+        image.draft("RGB", (max_dimension, max_dimension))
+        image = ImageOps.exif_transpose(image)
+
+    image.thumbnail((max_dimension, max_dimension))
+    if image.mode in ("RGBA", "LA", "P"):
+        # JPEG has no alpha: flatten transparent images onto white
+        image = image.convert("RGBA")
+        flattened = Image.new("RGB", image.size, "white")
+        flattened.paste(image, mask=image.getchannel("A"))
+        image = flattened
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+
+    output = io.BytesIO()
+    image.save(output, "JPEG", quality=PREVIEW_JPEG_QUALITY, optimize=True)
+    return output.getvalue()
+
+
+class PreviewQueue:
+    """
+    Generates blob previews on a thread pool.
+
+    A blob is queued at most once at a time; the worker skips blobs that
+    already have a preview, so re-queuing is harmless.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_dimension: int = 320,
+        session_factory: Optional[Callable[[], Session]] = None,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            max_workers: Worker threads
+            max_dimension: Longest side of a thumbnail in pixels
+            session_factory: Opens database sessions (defaults to SessionLocal)
+            executor_factory: Builds the executor (defaults to a thread pool)
+        """
+        self.max_workers = max_workers
+        self.max_dimension = max_dimension
+        self._session_factory = session_factory or SessionLocal
+        self._executor_factory = executor_factory or self._default_executor
+        self._executor: Optional[Executor] = None
+        self._pending: Set[int] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _default_executor(max_workers: int) -> Executor:
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preview")
+
+    def submit(self, blob_id: int, content_type: str, s3) -> Optional[Future]:
+        """
+        Queue a preview for a committed blob.
+
+        Args:
+            blob_id: FileBlob ID
+            content_type: MIME type of its content
+            s3: S3Service holding the content
+
+        Returns:
+            The job's future, or None if the blob is already queued
+        """
+        with self._lock:
+            if blob_id in self._pending:
+                return None
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+            executor = self._executor
+            self._pending.add(blob_id)
+        future = executor.submit(self.generate, blob_id, content_type, s3)
+        future.add_done_callback(lambda f: self._finish(blob_id, f))
+        return future
+
+    def _finish(self, blob_id: int, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(blob_id)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Preview for blob {blob_id} failed: {future.exception()}")
+
+    def generate(self, blob_id: int, content_type: str, s3) -> Optional[str]:
+        """
+        Render and store a blob's preview.
+
+        No database connection is held while the content is downloaded and
+        rendered.
+
+        Returns:
+            The preview key, or None if the blob is gone or already has one
+        """
+        db = self._session_factory()
+        try:
+            blob = db.get(FileBlob, blob_id)
+            if blob is None or blob.preview_key or blob.storage != "s3":
+                return None
+            storage_key = blob.storage_key
+        finally:
+            db.close()
+
+        download = s3.open_download(storage_key)
+        if not download or download["body"] is None:
+            raise RuntimeError(f"Could not read {storage_key}")
+        with tempfile.SpooledTemporaryFile(max_size=SOURCE_SPOOL_SIZE) as source:
+            for chunk in download["body"]:
+                source.write(chunk)
+            source.seek(0)
+            thumbnail = render_thumbnail(source, content_type, self.max_dimension)
+
+        preview_key = preview_key_for(storage_key)
+        if not s3.upload_file(io.BytesIO(thumbnail), preview_key, content_type=PREVIEW_CONTENT_TYPE):
+            raise RuntimeError(f"Could not store preview {preview_key}")
+
+        db = self._session_factory()
+        try:
+            stored = db.execute(
+                update(FileBlob)
+                .where(FileBlob.id == blob_id)
+                .values(preview_key=preview_key)
+                .returning(FileBlob.id)
+            ).scalar()
+            db.commit()
+        finally:
+            db.close()
+
+        if stored is None:
+            # The blob's last reference was deleted while the preview rendered
+            s3.delete_file(preview_key)
+            return None
+        return preview_key
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+preview_jobs = PreviewQueue(
+    max_workers=settings.PREVIEW_WORKERS,
+    max_dimension=settings.PREVIEW_MAX_DIMENSION,
+)
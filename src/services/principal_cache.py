@@ -0,0 +1,105 @@
+"""
+Principal Cache - a user's access state without a users query per request.
+
+Access tokens carry the roles a user had at login, so authentication
+re-checks the user behind a token on every request: is the account active,
+is it locked, what roles does it have now. HTMX fragments poll several
+times a second, so that state is kept in a short-lived, process-wide cache.
+A change made elsewhere reaches every app worker within
+principal_cache_ttl_seconds. StaffService drops the entry when it updates,
+locks or re-roles a user, so the worker that made the change applies it
+immediately.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.config.auth_config import auth_settings
+from src.models.role import Role
+from src.models.user import User
+from src.models.user_role import UserRole
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Access state of one user."""
+
+    user_id: int
+    is_active: bool
+    locked_until: Optional[datetime]
+    roles: Tuple[str, ...]
+
+    @property
+    def is_locked(self) -> bool:
+        return self.locked_until is not None and self.locked_until >= datetime.utcnow()
+
+
+class PrincipalCache:
+    """TTL cache of user id -> Principal, bounded in size."""
+
+    def __init__(self, ttl_seconds: float, max_size: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[int, Tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """The cached principal, or None if missing or expired. Never queries."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._entries.move_to_end(user_id)
+            return entry[1]
+
+    def load(self, db: Session, user_id: int) -> Optional[Principal]:
+        """
+        The user's principal, read from the database on a cache miss.
+
+        Returns:
+            Principal, or None if the user does not exist
+        """
+        principal = self.get(user_id)
+        if principal is not None:
+            return principal
+
+        row = db.execute(
+            select(User.is_active, User.locked_until).where(User.id == user_id)
+        ).one_or_none()
+        if row is None:
+            return None
+        roles = (
+            db.execute(
+                select(Role.name)
+                .join(UserRole, UserRole.role_id == Role.id)
+                .where(UserRole.user_id == user_id)
+            )
+            .scalars()
+            .all()
+        )
+
+        principal = Principal(user_id, row.is_active, row.locked_until, tuple(roles))
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop one user's entry, or every entry."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+principal_cache = PrincipalCache(ttl_seconds=auth_settings.principal_cache_ttl_seconds)
@@ -12,7 +12,7 @@ from src.models.user import User
 from src.models.email_token import EmailToken
 from src.models.role import Role
 from src.models.user_role import UserRole
-from src.core.security import hash_password
+from src.core.security import hash_password, hash_password_async
 from src.db.enums import TokenType, RoleType
 from src.services.email_service import get_email_service
 
@@ -94,7 +94,7 @@ async def register_user(
     # Create user (unverified)
     user = User(
         email=email.lower(),
-        password_hash=hash_password(password),
+        password_hash=await hash_password_async(password),
         first_name=first_name,
         last_name=last_name,
         is_active=True,
@@ -362,7 +362,7 @@ async def reset_password(
 
     # Update password
     user = email_token.user
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await hash_password_async(new_password)
     user.failed_login_attempts = 0
     user.locked_until = None
 
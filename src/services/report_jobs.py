@@ -0,0 +1,267 @@
+"""
+Report Jobs - PDF rendering off the event loop, with an on-disk result cache.
+
+WeasyPrint rendering is CPU-bound and can take seconds for a large roster.
+Report routes build the HTML, hand it to a process pool through
+ReportJobQueue and return a job page that polls for the result over HTMX.
+
+Finished PDFs are cached on disk under a key derived from the report type,
+its parameters and a data version. The key doubles as the job id, so a
+repeat request for unchanged data is served straight from disk, from any
+app worker that shares the cache directory. Each job's status is kept in a
+JSON file beside the PDF, so every worker can report a job that another
+worker is still rendering.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from src.config.settings import settings
+from src.services.report_service import ReportService
+
+logger = logging.getLogger(__name__)
+
+
+class ReportJobStatus:
+    """Report job states."""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+def report_cache_key(report_type: str, params: Dict[str, Any], data_version: Any) -> str:
+    """Stable cache key (and job id) for a report's type, parameters and data version."""
+    payload = json.dumps(
+        {"type": report_type, "params": params, "version": data_version},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def render_pdf_file(html_content: str, path: str) -> str:
+    """Render HTML to a PDF file. Runs in a worker process."""
+    pdf_bytes = ReportService.generate_pdf(html_content)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(pdf_bytes)
+    os.replace(tmp_path, path)  # Readers never see a partial file
+    return path
+
+
+class ReportJob:
+    """State of one report rendering job."""
+
+    def __init__(self, job_id: str, report_type: str, filename: str, status: str = ReportJobStatus.PENDING):
+        self.job_id = job_id
+        self.report_type = report_type
+        self.filename = filename
+        self.status = status
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReportJob":
+        """Rebuild a job from to_dict output."""
+        job = cls(data["job_id"], data["report_type"], data["filename"], status=data["status"])
+        job.error = data.get("error")
+        job.created_at = datetime.fromisoformat(data["created_at"])
+        if data.get("finished_at"):
+            job.finished_at = datetime.fromisoformat(data["finished_at"])
+        return job
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "job_id": self.job_id,
+            "report_type": self.report_type,
+            "filename": self.filename,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class ReportJobQueue:
+    """
+    Runs report renders in a process pool and caches the results on disk.
+
+    Jobs this process started are tracked in memory until they finish. Every
+    job also has a small JSON status file in the cache directory, next to its
+    PDF, which is how other workers see it. A job pending for longer than
+    job_timeout_seconds is presumed lost (e.g. its worker was restarted) and
+    can be submitted again.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_workers: int = 2,
+        max_age_hours: int = 168,
+        job_timeout_seconds: int = 600,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            cache_dir: Directory for rendered reports
+            max_workers: Render processes
+            max_age_hours: Cached reports older than this are pruned
+            job_timeout_seconds: Pending jobs older than this are presumed lost
+            executor_factory: Builds the executor (defaults to a spawn-based process pool)
+        """
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.max_age_hours = max_age_hours
+        self.job_timeout_seconds = job_timeout_seconds
+        self._executor_factory = executor_factory or self._default_executor
+        self._executor: Optional[Executor] = None
+        self._jobs: Dict[str, ReportJob] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _default_executor(max_workers: int) -> Executor:
+        # spawn: forking a process that runs threads (audit writer, thread pools) is unsafe
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _path(self, job_id: str, suffix: str = ".pdf") -> str:
+        return os.path.join(self.cache_dir, f"{job_id}{suffix}")
+
+    def cached_path(self, job_id: str) -> Optional[str]:
+        """Path of the finished report, or None if it has not been rendered."""
+        path = self._path(job_id)
+        return path if os.path.exists(path) else None
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        """Look up a job, falling back to the cache directory for other workers' jobs."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        return self._job_from_cache(job_id)
+
+    def submit(
+        self,
+        job_id: str,
+        report_type: str,
+        filename: str,
+        html_content: str,
+        render: Callable[[str, str], str] = render_pdf_file,
+    ) -> ReportJob:
+        """
+        Queue a render unless the report is already cached or in progress.
+
+        Returns:
+            The existing or newly queued job
+        """
+        cached = self._job_from_cache(job_id)
+        if cached is not None and cached.status != ReportJobStatus.FAILED:
+            return cached
+
+        with self._lock:
+            existing = self._jobs.get(job_id)
+            if existing is not None and existing.status == ReportJobStatus.PENDING:
+                return existing
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.prune()
+
+            job = ReportJob(job_id, report_type, filename)
+            self._write_status(job)
+
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+            future = self._executor.submit(render, html_content, self._path(job_id))
+            self._jobs[job_id] = job
+
+        future.add_done_callback(lambda f: self._finish(job, f))
+        return job
+
+    def _finish(self, job: ReportJob, future: Future) -> None:
+        job.finished_at = datetime.now()
+        error = future.exception()
+        with self._lock:
+            if error is None:
+                job.status = ReportJobStatus.DONE
+            else:
+                job.status = ReportJobStatus.FAILED
+                job.error = str(error)
+                logger.error(f"Report job {job.job_id} ({job.report_type}) failed: {error}")
+        try:
+            self._write_status(job)
+        except OSError as e:
+            logger.error(f"Could not record status of report job {job.job_id}: {e}")
+        if error is None:
+            with self._lock:
+                self._jobs.pop(job.job_id, None)  # The disk cache is the record from here on
+
+    def _write_status(self, job: ReportJob) -> None:
+        """Write a job's status file atomically."""
+        path = self._path(job.job_id, ".json")
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(job.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    def _job_from_cache(self, job_id: str) -> Optional[ReportJob]:
+        """A job as recorded in the cache directory, or None if unknown or lost."""
+        try:
+            with open(self._path(job_id, ".json")) as f:
+                job = ReportJob.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            job = None
+
+        if self.cached_path(job_id):
+            if job is None:
+                return ReportJob(job_id, "report", f"{job_id}.pdf", status=ReportJobStatus.DONE)
+            job.status = ReportJobStatus.DONE
+            return job
+        if job is None or job.status == ReportJobStatus.DONE:
+            return None  # Rendered, then pruned
+        if job.status == ReportJobStatus.PENDING:
+            age = (datetime.now() - job.created_at).total_seconds()
+            if age > self.job_timeout_seconds:
+                return None
+        return job
+
+    def prune(self) -> int:
+        """Delete cached reports older than max_age_hours. Returns files removed."""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        cutoff = time.time() - self.max_age_hours * 3600
+        removed = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+report_jobs = ReportJobQueue(
+    cache_dir=settings.REPORT_CACHE_DIR,
+    max_workers=settings.REPORT_JOB_WORKERS,
+    max_age_hours=settings.REPORT_CACHE_MAX_AGE_HOURS,
+    job_timeout_seconds=settings.REPORT_JOB_TIMEOUT_SECONDS,
+)
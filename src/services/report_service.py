@@ -1,10 +1,12 @@
 """Report generation service."""
 
 import io
+import tempfile
 from datetime import datetime
-from typing import Optional, Any
+from typing import Optional, Any, Iterable, Iterator
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from openpyxl.utils import get_column_letter
 
@@ -290,6 +292,77 @@ class ReportService:
 
         return excel_buffer.getvalue()
 
+    @staticmethod
+    def stream_excel(
+        rows: Iterable[dict[str, Any]],
+        columns: list[dict[str, Any]],
+        sheet_name: str = "Report",
+        title: Optional[str] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        """
+        Generate an Excel file from an iterable of rows, yielding bytes.
+
+        Uses an openpyxl write-only worksheet: each row is serialized to a
+        temporary file as soon as it is consumed, so memory stays flat however
+        many rows the iterable produces. Nothing runs until iteration starts,
+        which lets a StreamingResponse send headers before the query executes.
+
+        Unlike generate_excel, column widths cannot be measured from the data;
+        pass an optional "width" in each column definition.
+
+        Args:
+            rows: Iterable (typically a generator) of row dictionaries
+            columns: Column definitions [{"key": "field", "header": "Display Name", "width": 20}]
+            sheet_name: Name of the worksheet
+            title: Optional title row
+            chunk_size: Size of the yielded byte chunks
+
+        Yields:
+            Chunks of the .xlsx file
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+
+        for col_num, col_def in enumerate(columns, 1):
+            width = col_def.get("width", max(len(col_def["header"]) + 2, 12))
+            ws.column_dimensions[get_column_letter(col_num)].width = min(width, 50)
+
+        # Title row (optional)
+        if title:
+            title_cell = WriteOnlyCell(ws, value=title)
+            title_cell.font = Font(bold=True, size=14)
+            ws.append([title_cell])
+            ws.append([])
+
+        # Header row
+        header_cells = []
+        for col_def in columns:
+            cell = WriteOnlyCell(ws, value=col_def["header"])
+            cell.font = Font(bold=True, color="FFFFFF")
+            cell.fill = PatternFill(start_color="1A365D", end_color="1A365D", fill_type="solid")
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Data rows
+        keys = [col_def["key"] for col_def in columns]
+        for row_data in rows:
+            ws.append([row_data.get(key, "") for key in keys])
+
+        # Add metadata footer
+        footer = WriteOnlyCell(ws, value=f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        footer.font = Font(italic=True, color="666666")
+        ws.append([])
+        ws.append([footer])
+
+        # The xlsx zip is assembled on save; spool it to disk rather than memory
+        with tempfile.TemporaryFile() as excel_file:
+            wb.save(excel_file)
+            excel_file.seek(0)
+            while chunk := excel_file.read(chunk_size):
+                yield chunk
+
     @staticmethod
     def format_currency(amount) -> str:
         """Format amount as currency string."""
@@ -3,14 +3,50 @@
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from botocore.config import Config
-from typing import Optional, BinaryIO
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Optional, BinaryIO, Tuple
 from io import BytesIO
 import logging
+import re
+import threading
+import time
 
 from src.config.s3_config import get_s3_settings
 
 logger = logging.getLogger(__name__)
 
+# Bytes buffered per multipart part (S3 requires at least 5 MB for all but the last)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+# Bytes per chunk when streaming a download to the client
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Single byte ranges, the only kind forwarded to S3
+_BYTE_RANGE = re.compile(r"^bytes=(\d+-\d*|-\d+)$")
+
+
+class _BodyChunks:
+    """Chunks of a get_object body; close() releases the connection, read or not."""
+
+    def __init__(self, body, chunk_size: int):
+        self._body = body
+        self._chunks = body.iter_chunks(chunk_size)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        self._body.close()
+
+    __del__ = close
+
 
 class S3Service:
     """Service for S3/MinIO operations."""
@@ -19,21 +55,39 @@ class S3Service:
         """Initialize S3 client with settings."""
         self.settings = get_s3_settings()
         self._client = None
+        self._client_lock = threading.Lock()
+        # (object_key, expiry, download filename) -> (url, expires_at)
+        self._url_cache: "OrderedDict[tuple, Tuple[str, float]]" = OrderedDict()
+        self._url_lock = threading.Lock()
 
     @property
     def client(self):
-        """Lazy-loaded S3 client."""
+        """
+        Lazy-loaded S3 client.
+
+        One client is shared by every thread (boto3 clients are thread-safe
+        once created); its connection pool is sized by S3_MAX_POOL_CONNECTIONS.
+        """
         if self._client is None:
-            self._client = boto3.client(
-                "s3",
-                endpoint_url=self.settings.S3_ENDPOINT_URL,
-                aws_access_key_id=self.settings.S3_ACCESS_KEY,
-                aws_secret_access_key=self.settings.S3_SECRET_KEY,
-                region_name=self.settings.S3_REGION,
-                config=Config(signature_version="s3v4"),
-            )
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.client(
+                        "s3",
+                        endpoint_url=self.settings.S3_ENDPOINT_URL,
+                        aws_access_key_id=self.settings.S3_ACCESS_KEY,
+                        aws_secret_access_key=self.settings.S3_SECRET_KEY,
+                        region_name=self.settings.S3_REGION,
+                        config=Config(
+                            signature_version="s3v4",
+                            max_pool_connections=self.settings.S3_MAX_POOL_CONNECTIONS,
+                        ),
+                    )
         return self._client
 
+    def warm_client(self) -> None:
+        """Create the client now, before threads start sharing it."""
+        _ = self.client
+
     def ensure_bucket_exists(self) -> bool:
         """Ensure the configured bucket exists, create if not."""
         try:
@@ -98,6 +152,98 @@ class S3Service:
             logger.error("S3 credentials not configured")
             return None
 
+    def upload_stream(
+        self,
+        chunks: Iterable[bytes],
+        object_key: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> Optional[str]:
+        """
+        Upload a stream of byte chunks to S3 as a multipart upload.
+
+        At most one part is held in memory. Streams shorter than one part are
+        sent with a single PutObject. If the chunk iterator raises, the
+        multipart upload is aborted and the exception propagates.
+
+        Args:
+            chunks: Iterable of byte chunks, read once
+            object_key: S3 object key (path in bucket)
+            content_type: MIME type of the file
+            metadata: Optional metadata dict
+            part_size: Bytes per part
+
+        Returns:
+            S3 object key if successful, None otherwise
+        """
+        bucket = self.settings.S3_BUCKET_NAME
+        extra_args = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
+        if metadata:
+            extra_args["Metadata"] = metadata
+
+        buffer = bytearray()
+        parts = []
+        upload_id = None
+
+        def send_part(body: bytes) -> None:
+            response = self.client.upload_part(
+                Bucket=bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=body,
+            )
+            parts.append({"PartNumber": len(parts) + 1, "ETag": response["ETag"]})
+
+        try:
+            for chunk in chunks:
+                buffer += chunk
+                while len(buffer) >= part_size:
+                    if upload_id is None:
+                        upload_id = self.client.create_multipart_upload(
+                            Bucket=bucket, Key=object_key, **extra_args
+                        )["UploadId"]
+                    send_part(bytes(buffer[:part_size]))
+                    del buffer[:part_size]
+
+            if upload_id is None:
+                self.client.put_object(Bucket=bucket, Key=object_key, Body=bytes(buffer), **extra_args)
+            else:
+                if buffer:
+                    send_part(bytes(buffer))
+                self.client.complete_multipart_upload(
+                    Bucket=bucket,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            logger.info(f"Uploaded file to S3: {object_key} ({len(parts) or 1} parts)")
+            return object_key
+        except ClientError as e:
+            self._abort_multipart_upload(object_key, upload_id)
+            logger.error(f"Failed to upload file to S3: {e}")
+            return None
+        except NoCredentialsError:
+            logger.error("S3 credentials not configured")
+            return None
+        except BaseException:
+            self._abort_multipart_upload(object_key, upload_id)
+            raise
+
+    def _abort_multipart_upload(self, object_key: str, upload_id: Optional[str]) -> None:
+        """Discard the parts of an unfinished multipart upload."""
+        if upload_id is None:
+            return
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.settings.S3_BUCKET_NAME, Key=object_key, UploadId=upload_id
+            )
+        except ClientError as e:
+            logger.error(f"Failed to abort multipart upload {object_key}: {e}")
+
     def download_file(self, object_key: str) -> Optional[BytesIO]:
         """
         Download a file from S3.
@@ -121,6 +267,87 @@ class S3Service:
             logger.error(f"Failed to download file from S3: {e}")
             return None
 
+    def open_download(
+        self,
+        object_key: str,
+        range_header: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> Optional[dict]:
+        """
+        Open a streaming GET for a file, passing Range and If-None-Match to S3.
+
+        Only single byte ranges are forwarded; other Range headers are ignored
+        and the whole file is returned, as HTTP allows. The body is read from
+        S3 one chunk at a time as the response is sent.
+
+        Args:
+            object_key: S3 object key
+            range_header: Client's Range header
+            if_none_match: Client's If-None-Match header
+            chunk_size: Bytes per chunk of the body
+
+        Returns:
+            Dict with status (200, 206, 304 or 416), response headers,
+            content_type and body (chunk iterator, None for 304/416);
+            None if the file could not be read
+        """
+        params = {"Bucket": self.settings.S3_BUCKET_NAME, "Key": object_key}
+        if range_header and _BYTE_RANGE.match(range_header.strip()):
+            params["Range"] = range_header.strip()
+        if if_none_match:
+            params["IfNoneMatch"] = if_none_match
+
+        try:
+            response = self.client.get_object(**params)
+        except ClientError as e:
+            status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            code = e.response.get("Error", {}).get("Code", "")
+            if status == 304 or code in ("304", "NotModified"):
+                etag = e.response.get("ResponseMetadata", {}).get("HTTPHeaders", {}).get("etag", if_none_match)
+                return {"status": 304, "headers": {"ETag": etag}, "content_type": None, "body": None}
+            if status == 416 or code == "InvalidRange":
+                size = e.response.get("Error", {}).get("ActualObjectSize")
+                headers = {"Content-Range": f"bytes */{size}"} if size else {}
+                return {"status": 416, "headers": headers, "content_type": None, "body": None}
+            logger.error(f"Failed to download file from S3: {e}")
+            return None
+
+        headers = {"Accept-Ranges": "bytes", "Content-Length": str(response["ContentLength"])}
+        if response.get("ETag"):
+            headers["ETag"] = response["ETag"]
+        if response.get("ContentRange"):
+            headers["Content-Range"] = response["ContentRange"]
+        return {
+            "status": 206 if response.get("ContentRange") else 200,
+            "headers": headers,
+            "content_type": response.get("ContentType"),
+            "body": _BodyChunks(response["Body"], chunk_size),
+        }
+
+    def read_range(self, object_key: str, start: int, end: int) -> Optional[bytes]:
+        """
+        Read part of a file from S3 with a ranged GET.
+
+        Args:
+            object_key: S3 object key
+            start: First byte
+            end: Last byte (inclusive)
+
+        Returns:
+            The bytes read if successful, None otherwise
+        """
+        try:
+            response = self.client.get_object(
+                Bucket=self.settings.S3_BUCKET_NAME,
+                Key=object_key,
+                Range=f"bytes={start}-{end}",
+            )
+            return response["Body"].read()
+        except ClientError as e:
+            logger.error(f"Failed to read range from S3: {e}")
+            return None
+
     def delete_file(self, object_key: str) -> bool:
         """
         Delete a file from S3.
@@ -137,6 +364,9 @@ class S3Service:
                 Key=object_key,
             )
             logger.info(f"Deleted file from S3: {object_key}")
+            with self._url_lock:
+                for cache_key in [k for k in self._url_cache if k[0] == object_key]:
+                    del self._url_cache[cache_key]
             return True
         except ClientError as e:
             logger.error(f"Failed to delete file from S3: {e}")
@@ -180,21 +410,79 @@ class S3Service:
         Returns:
             Presigned URL if successful, None otherwise
         """
+        files = [(object_key, filename)]
+        return self.get_presigned_urls(files, expiry=expiry, download=download)[files[0]]
+
+    def get_presigned_urls(
+        self,
+        files: Iterable[Tuple[str, Optional[str]]],
+        expiry: Optional[int] = None,
+        download: bool = False,
+    ) -> Dict[Tuple[str, Optional[str]], Optional[str]]:
+        """
+        Generate presigned download URLs for a batch of files, e.g. a page of attachments.
+
+        URLs are cached per object key, expiry and download filename, and
+        reused while at least half of their lifetime remains, so repeated
+        list renders do not re-sign every URL.
+
+        Args:
+            files: (object_key, filename) pairs
+            expiry: URL expiry time in seconds (default from settings)
+            download: If True, set Content-Disposition to attachment
+
+        Returns:
+            Presigned URL (None if signing failed) per (object_key, filename)
+            pair, so one key can be signed under several download names
+        """
+        expires_in = expiry or self.settings.S3_PRESIGNED_URL_EXPIRY
+        files = list(files)
+        wanted = [(key, expires_in, filename if download else None) for key, filename in files]
+        now = time.time()
+
+        urls: Dict[tuple, str] = {}
+        with self._url_lock:
+            for cache_key in wanted:
+                entry = self._url_cache.get(cache_key)
+                if entry and entry[1] - now >= expires_in / 2:
+                    self._url_cache.move_to_end(cache_key)
+                    urls[cache_key] = entry[0]
+
+        # Sign the misses outside the lock; signing is local, no request to S3
+        signed = {}
+        for cache_key in wanted:
+            if cache_key not in urls and cache_key not in signed:
+                url = self._sign_download(*cache_key)
+                if url:
+                    signed[cache_key] = (url, now + expires_in)
+
+        if signed:
+            with self._url_lock:
+                self._url_cache.update(signed)
+                for cache_key in signed:
+                    self._url_cache.move_to_end(cache_key)
+                while len(self._url_cache) > self.settings.S3_URL_CACHE_SIZE:
+                    self._url_cache.popitem(last=False)
+            urls.update({cache_key: entry[0] for cache_key, entry in signed.items()})
+
+        return {file: urls.get(cache_key) for file, cache_key in zip(files, wanted)}
+
+    def _sign_download(self, object_key: str, expires_in: int, filename: Optional[str]) -> Optional[str]:
+        """Sign one get_object URL."""
         try:
             params = {
                 "Bucket": self.settings.S3_BUCKET_NAME,
                 "Key": object_key,
             }
 
-            if download and filename:
+            if filename:
                 params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
 
-            url = self.client.generate_presigned_url(
+            return self.client.generate_presigned_url(
                 "get_object",
                 Params=params,
-                ExpiresIn=expiry or self.settings.S3_PRESIGNED_URL_EXPIRY,
+                ExpiresIn=expires_in,
             )
-            return url
         except ClientError as e:
             logger.error(f"Failed to generate presigned URL: {e}")
             return None
@@ -13,6 +13,7 @@ import logging
 from src.models.user import User
 from src.models.role import Role
 from src.models.user_role import UserRole
+from src.services.principal_cache import principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -264,6 +265,7 @@ class StaffService:
                 user.user_roles.append(user_role)
 
         self.db.commit()
+        principal_cache.invalidate(user_id)
         self.db.refresh(user)
 
         logger.info(f"User {user_id} updated by {updated_by}")
@@ -303,6 +305,7 @@ class StaffService:
                 user.user_roles.append(user_role)
 
             self.db.commit()
+            principal_cache.invalidate(user_id)
             self.db.refresh(user)
 
             logger.info(f"Roles updated for user {user_id} by {updated_by}: {roles}")
@@ -335,6 +338,7 @@ class StaffService:
             logger.info(f"User {user_id} unlocked by {updated_by}")
 
         self.db.commit()
+        principal_cache.invalidate(user_id)
         self.db.refresh(user)
         return user
 
@@ -371,6 +375,7 @@ class StaffService:
         user.locked_until = datetime.utcnow() + timedelta(days=365 * 100)
 
         self.db.commit()
+        principal_cache.invalidate(user_id)
         logger.info(f"User {user_id} ({user_email}) soft deleted by {deleted_by}")
         return True
 
@@ -0,0 +1,65 @@
+"""
+Zip archives built while they are sent.
+
+zipfile writes to a non-seekable sink in streaming mode (sizes and CRCs go
+in data descriptors after each member), so an archive can be produced chunk
+by chunk from file bodies that are themselves streamed, without staging the
+archive on disk or in memory.
+"""
+
+import zipfile
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+class _ZipSink:
+    """Write-only, non-seekable file object that collects output until drained."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._offset = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        yield from chunks
+
+
+def iter_zip(
+    entries: Iterable[Tuple[str, Iterable[bytes], Optional[datetime]]],
+    compression: int = zipfile.ZIP_STORED,
+) -> Iterator[bytes]:
+    """
+    Yield a zip archive of the entries as it is built.
+
+    Members are stored uncompressed by default: attachments are mostly PDFs
+    and images, which do not compress further.
+
+    Args:
+        entries: (archive name, body chunks, modified time) per member, read in order
+        compression: zipfile compression method
+
+    Yields:
+        Archive bytes, roughly one chunk per body chunk
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", compression=compression) as archive:
+        for name, chunks, modified in entries:
+            info = zipfile.ZipInfo(name, date_time=(modified or datetime.now()).timetuple()[:6])
+            info.compress_type = compression
+            with archive.open(info, "w") as member:
+                for chunk in chunks:
+                    member.write(chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+    yield from sink.drain()  # Central directory
@@ -10,10 +10,12 @@ import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from src.main import app
-from src.db.session import get_db
+from src.db.session import get_async_db, get_db
 from src.config.settings import settings
 
 
@@ -29,6 +31,27 @@ def get_test_engine():
     return _engine
 
 
+# asyncpg connections belong to the event loop that opened them and each test
+# runs on its own loop, so async sessions in tests never reuse a connection
+_async_engine = create_async_engine(settings.async_database_url, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    _async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+@pytest.fixture(autouse=True)
+def _async_db_without_pool():
+    """Serve get_async_db from the unpooled test engine."""
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield
+    app.dependency_overrides.pop(get_async_db, None)
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """
@@ -57,6 +80,23 @@ def db_session():
         connection.close()
 
 
+@pytest_asyncio.fixture
+async def async_db_session():
+    """
+    AsyncSession fixture, rolled back after the test like db_session.
+
+    Commits inside the test do not end the outer transaction.
+    """
+    async with _async_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, autoflush=False, expire_on_commit=False)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
 @pytest.fixture(scope="function")
 def client():
     """
@@ -23,6 +23,7 @@ from faker import Faker
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from src.db.pool_metrics import pool_metrics
 from src.db.session import get_db_session
 from src.models import (
     Member,
@@ -445,6 +446,7 @@ class LoadTest:
             self.users.append(user)
 
         # Start users with ramp-up
+        pool_metrics.reset()
         self.start_time = datetime.now()
         ramp_up_delay = (
             self.ramp_up_seconds / self.num_users if self.num_users > 0 else 0
@@ -608,6 +610,28 @@ class LoadTest:
 
         report.append("")
 
+        # Connection Pool
+        pool = pool_metrics.snapshot()
+        report.append("🔌 Connection Pool:")
+        if "pool" in pool:
+            report.append(
+                f"   Configured: size {pool['pool']['size']}, max overflow {pool['pool']['max_overflow']}, "
+                f"timeout {pool['pool']['timeout']}s"
+            )
+        report.append(f"   Checkouts: {pool['checkouts']:,} (new connections: {pool['connects']:,})")
+        report.append(f"   Peak checked out: {pool['peak_checked_out']} (peak overflow: {max(pool['peak_overflow'], 0)})")
+        report.append(
+            f"   Checkout wait: avg {pool['wait_ms']['avg']:.2f}ms, "
+            f"p95 {pool['wait_ms']['p95']:.2f}ms, max {pool['wait_ms']['max']:.2f}ms"
+        )
+        if pool["timeouts"]:
+            report.append(f"   ❌ Pool timeouts: {pool['timeouts']} - raise DB_POOL_SIZE / DB_MAX_OVERFLOW")
+        elif pool["wait_ms"]["p95"] > 50:
+            report.append("   ⚠️  Requests are queueing for connections - consider a larger pool")
+        else:
+            report.append("   ✅ No pool contention")
+        report.append("")
+
         # Scaling Recommendations
         report.append("📊 Scaling to 4000 Users:")
         concurrent_capacity = self.num_users * (100 / max(avg_response, 1))
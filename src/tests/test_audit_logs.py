@@ -1,5 +1,17 @@
 """Tests for AuditLogs endpoints (read-only)."""
 
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.audit_log import AuditLog
+from src.services.audit_log_service import (
+    decode_audit_cursor,
+    list_audit_logs_by_record,
+    list_audit_logs_by_table,
+    list_audit_logs_by_user,
+)
+
 
 async def test_list_audit_logs(async_client):
     """Test listing all audit logs."""
@@ -47,3 +59,56 @@ async def test_audit_logs_pagination(async_client):
     data = response.json()
     assert isinstance(data, list)
     assert len(data) <= 10
+
+
+async def test_audit_logs_invalid_cursor(async_client):
+    """A cursor that was not issued by the API is rejected."""
+    response = await async_client.get("/audit-logs/?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+class TestKeysetPagination:
+    """Keyset pages over (changed_at, id)."""
+
+    @pytest.fixture
+    def trail(self, db_session):
+        """Seven logs for one record; three share a timestamp."""
+        base = datetime(2020, 1, 1, 12, 0)
+        times = [base, base, base, base + timedelta(minutes=1), base + timedelta(minutes=2),
+                 base + timedelta(minutes=3), base + timedelta(minutes=4)]
+        logs = [
+            AuditLog(
+                table_name="keyset_test",
+                record_id="42",
+                action="READ",
+                changed_by="keyset-user",
+                changed_at=changed_at,
+            )
+            for changed_at in times
+        ]
+        db_session.add_all(logs)
+        db_session.flush()
+        return sorted(logs, key=lambda log: (log.changed_at, log.id), reverse=True)
+
+    def test_pages_cover_every_row_once_in_order(self, db_session, trail):
+        seen, cursor = [], None
+        while True:
+            logs, cursor = list_audit_logs_by_record(db_session, "keyset_test", "42", cursor=cursor, limit=2)
+            seen += logs
+            if cursor is None:
+                break
+
+        assert [log.id for log in seen] == [log.id for log in trail]
+
+    def test_last_full_page_has_no_cursor(self, db_session, trail):
+        logs, cursor = list_audit_logs_by_user(db_session, "keyset-user", limit=7)
+        assert len(logs) == 7
+        assert cursor is None
+
+    def test_table_pages_resume_after_cursor(self, db_session, trail):
+        first, cursor = list_audit_logs_by_table(db_session, "keyset_test", limit=5)
+        second, _ = list_audit_logs_by_table(db_session, "keyset_test", cursor=cursor, limit=5)
+
+        assert first[-1].changed_at == second[0].changed_at  # Tie split across pages
+        assert [log.id for log in first + second] == [log.id for log in trail]
+        assert decode_audit_cursor(cursor) == (first[-1].changed_at, first[-1].id)
@@ -0,0 +1,111 @@
+"""Tests for the batched background audit writer."""
+
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models.audit_log import AuditLog
+from src.services import audit_service
+from src.services.audit_writer import AuditWriter, AuditWriteMode
+
+
+@pytest.fixture
+def writer(db_session):
+    """Audit writer whose batches land inside the test transaction."""
+    connection = db_session.connection()
+
+    def session_factory():
+        return Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    w = AuditWriter(session_factory=session_factory, batch_size=3, flush_interval=60)
+    yield w
+    w.shutdown()
+
+
+def _audit_row(tag: str, record_id: int = 1) -> AuditLog:
+    return AuditLog(
+        table_name="members",
+        record_id=str(record_id),
+        action="READ",
+        changed_by=tag,
+        notes="writer test",
+    )
+
+
+def _count(db_session, tag: str) -> int:
+    return db_session.query(AuditLog).filter(AuditLog.changed_by == tag).count()
+
+
+class TestAuditWriter:
+    """Tests for AuditWriter batching and draining."""
+
+    def test_flush_writes_queued_rows(self, writer, db_session):
+        """Rows below the batch size are written on an explicit flush."""
+        tag = f"writer-{uuid.uuid4().hex[:8]}"
+        writer.submit(_audit_row(tag, 1))
+        writer.submit(_audit_row(tag, 2))
+
+        assert writer.flush(timeout=5)
+        assert _count(db_session, tag) == 2
+        assert writer.stats["batches"] == 1
+
+    def test_full_batch_is_written_without_flush(self, writer, db_session):
+        """Reaching batch_size triggers a write; wait=True blocks until committed."""
+        tag = f"writer-{uuid.uuid4().hex[:8]}"
+        writer.submit(_audit_row(tag, 1))
+        writer.submit(_audit_row(tag, 2))
+        writer.submit(_audit_row(tag, 3), wait=True)
+
+        assert _count(db_session, tag) == 3
+
+    def test_shutdown_drains_queue(self, writer, db_session):
+        """Shutdown writes everything still queued and stops the worker."""
+        tag = f"writer-{uuid.uuid4().hex[:8]}"
+        writer.submit(_audit_row(tag))
+
+        writer.shutdown()
+
+        assert not writer.is_running
+        assert _count(db_session, tag) == 1
+
+    def test_submit_after_shutdown_restarts_worker(self, writer, db_session):
+        """A stopped writer starts again lazily on the next submit."""
+        writer.shutdown()
+        tag = f"writer-{uuid.uuid4().hex[:8]}"
+        writer.submit(_audit_row(tag), wait=True)
+
+        assert writer.is_running
+        assert _count(db_session, tag) == 1
+
+
+class TestAuditServiceModes:
+    """Tests for AUDIT_WRITE_MODE dispatch in audit_service."""
+
+    def test_sync_mode_commits_on_request_session(self, db_session, monkeypatch):
+        """Sync mode keeps the legacy behaviour and returns a persisted row."""
+        monkeypatch.setattr(audit_service.settings, "AUDIT_WRITE_MODE", AuditWriteMode.SYNC)
+        monkeypatch.setattr(db_session, "commit", db_session.flush)
+
+        log = audit_service.log_read(db_session, "members", 1, changed_by="sync-test")
+
+        assert log.id is not None
+
+    def test_queued_mode_hands_row_to_writer(self, db_session, monkeypatch):
+        """Async mode never touches the request session."""
+        submitted = []
+        monkeypatch.setattr(audit_service.settings, "AUDIT_WRITE_MODE", AuditWriteMode.ASYNC)
+        monkeypatch.setattr(
+            audit_service.audit_writer, "submit", lambda log, wait=False: submitted.append((log, wait))
+        )
+
+        log = audit_service.log_read(db_session, "members", 1, changed_by="async-test")
+
+        assert log.id is None
+        assert log.changed_at is not None
+        assert submitted == [(log, False)]
+        assert log not in db_session
+
+    def test_unaudited_table_is_skipped(self, db_session):
+        """Tables outside AUDITED_TABLES are never queued."""
+        assert audit_service.log_read(db_session, "locations", 1) is None
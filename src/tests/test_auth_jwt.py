@@ -1,9 +1,13 @@
 """Tests for JWT utilities."""
 
 import pytest
+import time
 from datetime import timedelta
+from unittest.mock import patch
 
+from src.core import jwt as jwt_module
 from src.core.jwt import (
+    VerifiedTokenCache,
     create_access_token,
     create_refresh_token,
     verify_access_token,
@@ -90,3 +94,38 @@ class TestRefreshToken:
 
         assert token1 != token2
         assert hash1 != hash2
+
+
+class TestVerifiedTokenCache:
+    """Tests for the verified token cache."""
+
+    def test_repeat_verification_skips_decoding(self):
+        token = create_access_token(subject=789)
+        verify_access_token(token)
+
+        with patch.object(
+            jwt_module.jwt, "decode", side_effect=AssertionError("decoded again")
+        ):
+            assert verify_access_token(token)["sub"] == "789"
+
+    def test_tokens_are_cached_only_until_they_expire(self):
+        token = create_access_token(subject=790, expires_delta=timedelta(seconds=1))
+        verify_access_token(token)
+
+        time.sleep(2)
+        with pytest.raises(TokenExpiredError):
+            verify_access_token(token)
+
+    def test_invalid_tokens_are_not_cached(self):
+        token = create_access_token(subject=791)
+        with pytest.raises(TokenInvalidError):
+            verify_access_token(token[:-4] + "AAAA")
+        assert jwt_module.token_cache.get(token[:-4] + "AAAA") is None
+
+    def test_cache_is_bounded(self):
+        cache = VerifiedTokenCache(max_size=2)
+        for name in ("a", "b", "c"):
+            cache.put(name, {"sub": name, "exp": time.time() + 60})
+
+        assert cache.get("a") is None
+        assert cache.get("c")["sub"] == "c"
@@ -0,0 +1,157 @@
+"""Tests for the seed bulk loader."""
+
+import random
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Column, Date, Integer, MetaData, Numeric, String, Table, create_engine, select
+from sqlalchemy.orm import Session
+
+from src.db.enums import MemberClassification, MemberStatus, OrganizationType
+from src.models.member import Member
+from src.models.member_employment import MemberEmployment
+from src.models.organization import Organization
+from src.seed.base_seed import copy_records, derive_seed, max_id, new_ids, shard_faker
+from src.seed.parallel_seed import SeedPhase, run_phases
+from src.seed.stress_test_file_attachments import plan_attachment_shards
+from src.seed.stress_test_member_employments import (
+    EMPLOYMENT_COLUMNS,
+    generate_employment_rows,
+    plan_employment_shards,
+)
+from src.seed.stress_test_members import MEMBER_COLUMNS, MEMBER_SHARD_SIZE, generate_member_rows
+
+
+def _member_rows(tag: str, count: int):
+    for i in range(count):
+        yield (
+            f"{tag}-{i}", "Bulk", f"Tab\tNew\nLine\\{i}", None, None, None, None, None,
+            None, None, date(1990, 1, 1), None, MemberStatus.ACTIVE,
+            MemberClassification.JOURNEYMAN, None,
+        )
+
+
+class TestCopyRecords:
+    """COPY path (PostgreSQL)."""
+
+    def test_streams_rows_and_applies_python_defaults(self, db_session: Session):
+        tag = f"BULK{uuid.uuid4().hex[:6]}"
+        before = max_id(db_session, Member.__table__)
+
+        loaded = copy_records(db_session, Member.__table__, MEMBER_COLUMNS, _member_rows(tag, 25))
+
+        ids = new_ids(db_session, Member.__table__, before)
+        assert loaded == len(ids) == 25
+        member = db_session.get(Member, ids[3])
+        assert member.last_name == "Tab\tNew\nLine\\3"  # Escaped for COPY text format
+        assert member.status == MemberStatus.ACTIVE
+        assert member.middle_name is None
+        assert member.created_at is not None
+        assert member.is_deleted is False
+
+    def test_employment_rows_resolve_foreign_keys_from_ids(self, db_session: Session):
+        tag = f"BULK{uuid.uuid4().hex[:6]}"
+        before = max_id(db_session, Member.__table__)
+        copy_records(db_session, Member.__table__, MEMBER_COLUMNS, _member_rows(tag, 3))
+        member_ids = new_ids(db_session, Member.__table__, before)
+        employer = Organization(name=f"{tag} Electric", org_type=OrganizationType.EMPLOYER)
+        db_session.add(employer)
+        db_session.flush()
+
+        rows = generate_employment_rows(member_ids, [2, 4, 3], [employer.id], 0.2, random.Random(1))
+        loaded = copy_records(db_session, MemberEmployment.__table__, EMPLOYMENT_COLUMNS, rows)
+
+        employments = db_session.execute(
+            select(MemberEmployment).where(MemberEmployment.member_id.in_(member_ids))
+        ).scalars().all()
+        assert loaded == 9 == len(employments)
+        assert {e.organization_id for e in employments} == {employer.id}
+
+
+class TestShardPlanning:
+    """Stress shards do not depend on how many workers load them."""
+
+    def test_derived_seeds_are_stable_and_distinct(self):
+        assert derive_seed(42, "members", 3) == derive_seed(42, "members", 3)
+        assert derive_seed(42, "members", 3) != derive_seed(42, "members", 4)
+        assert derive_seed(42, "members", 3) != derive_seed(43, "members", 3)
+
+    def test_member_shard_rows_repeat_for_the_same_seed(self):
+        def shard_rows():
+            return list(generate_member_rows(MEMBER_SHARD_SIZE, MEMBER_SHARD_SIZE + 20, shard_faker(42, "members", 1)))
+
+        assert shard_rows() == shard_rows()
+
+    def test_employment_shards_get_consecutive_id_ranges(self):
+        member_ids = list(range(1, MEMBER_SHARD_SIZE * 2 + 51))
+        shards = plan_employment_shards(42, member_ids, [7, 8], 1, 5, 0.2, id_offset=100)
+
+        assert [len(shard["member_ids"]) for shard in shards] == [MEMBER_SHARD_SIZE, MEMBER_SHARD_SIZE, 50]
+        assert shards[0]["id_start"] == 101
+        for previous, shard in zip(shards, shards[1:]):
+            assert shard["id_start"] == previous["id_start"] + sum(previous["job_counts"])
+        assert shards == plan_employment_shards(42, member_ids, [7, 8], 1, 5, 0.2, id_offset=100)
+
+    def test_attachment_shards_cover_every_record_type(self):
+        shards = plan_attachment_shards(42, [1, 2, 3], [10], [20, 21])
+
+        assert [shard["record_type"] for shard in shards] == ["member", "student", "organization", "grievance"]
+        assert shards[0]["id_start"] == 1
+        assert all(1 <= count <= 20 for count in shards[0]["file_counts"])
+
+
+class TestRunPhases:
+    """Phase scheduler (inline, workers=1)."""
+
+    def test_runs_phases_after_their_dependencies(self):
+        calls = []
+
+        def load(db, label):
+            calls.append(label)
+            return 1
+
+        phases = [
+            SeedPhase("attachments", depends_on=["members", "students"], plan=lambda db: [(load, {"label": "a"})]),
+            SeedPhase("students", depends_on=["members"], run=lambda db: calls.append("students")),
+            SeedPhase(
+                "members",
+                plan=lambda db: [(load, {"label": "m1"}), (load, {"label": "m2"})],
+                finish=lambda db: calls.append("sync"),
+            ),
+        ]
+
+        finished = run_phases(None, phases, workers=1)
+
+        assert calls == ["m1", "m2", "sync", "students", "a"]
+        assert set(finished) == {"members", "students", "attachments"}
+
+    def test_rejects_unknown_dependencies(self):
+        with pytest.raises(ValueError):
+            run_phases(None, [SeedPhase("students", depends_on=["members"], run=lambda db: None)])
+
+
+class TestInsertFallback:
+    """executemany path for databases without COPY."""
+
+    def test_sqlite_batches_and_defaults(self):
+        metadata = MetaData()
+        table = Table(
+            "items",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50)),
+            Column("price", Numeric(10, 2)),
+            Column("added_on", Date, default=date(2026, 1, 1)),
+        )
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine)
+
+        with Session(engine) as db:
+            rows = ((f"item{i}", Decimal("1.50")) for i in range(12))
+            loaded = copy_records(db, table, ("name", "price"), rows, batch_size=5)
+
+            assert loaded == 12
+            assert new_ids(db, table, None) == list(range(1, 13))
+            assert db.execute(select(table.c.added_on).distinct()).scalars().all() == [date(2026, 1, 1)]
@@ -0,0 +1,64 @@
+"""Tests for content-addressed attachment storage."""
+
+import hashlib
+import uuid
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+from fastapi import UploadFile
+
+from src.models.file_blob import FileBlob
+from src.services import blob_store
+from src.services.blob_store import acquire_blob, blob_key, release_blob
+from src.services.file_attachment_service import create_file_attachment
+
+
+@pytest.fixture
+def blob_root(tmp_path, monkeypatch):
+    root = tmp_path / "blobs"
+    monkeypatch.setattr(blob_store, "LOCAL_BLOB_ROOT", str(root))
+    return root
+
+
+def _upload(content: bytes, filename: str = "dd214.pdf") -> UploadFile:
+    return UploadFile(file=BytesIO(content), filename=filename, headers={"content-type": "application/pdf"})
+
+
+def test_blob_key_shards_by_hash(blob_root):
+    content_hash = "ab" + "c" * 62
+    assert blob_key(content_hash, "s3") == f"blobs/ab/{content_hash}"
+    assert blob_key(content_hash, "local") == str(blob_root / "ab" / "cc" / content_hash)
+
+
+def test_acquire_and_release_count_references(db_session, blob_root):
+    content_hash = hashlib.sha256(uuid.uuid4().bytes).hexdigest()
+
+    first, created = acquire_blob(db_session, content_hash, 10, "local")
+    second, created_again = acquire_blob(db_session, content_hash, 10, "local")
+    other_backend, s3_created = acquire_blob(db_session, content_hash, 10, "s3")
+
+    assert (created, created_again, s3_created) == (True, False, True)
+    assert second.id == first.id and second.ref_count == 2
+    assert other_backend.id != first.id
+
+    assert release_blob(db_session, first.id) is None
+    released = release_blob(db_session, first.id)
+    assert released.id == first.id
+    assert db_session.get(FileBlob, first.id) is None
+
+
+def test_identical_local_uploads_are_stored_once(db_session, blob_root):
+    content = f"discharge papers {uuid.uuid4()}".encode()
+    data = SimpleNamespace(record_type="member", record_id=1, file_category="general", description=None)
+
+    first = create_file_attachment(db_session, data, _upload(content), entity_id="M1")
+    second = create_file_attachment(db_session, data, _upload(content, "copy.pdf"), entity_id="M2")
+
+    stored = [str(path) for path in blob_root.rglob("*") if path.is_file()]
+    assert stored == [first.file_path]
+    assert first.file_path == second.file_path
+    assert first.logical_path != second.logical_path
+    assert first.content_hash == hashlib.sha256(content).hexdigest()
+    assert first.file_size == len(content)
+    assert db_session.get(FileBlob, first.blob_id).ref_count == 2
@@ -0,0 +1,102 @@
+"""Tests for DashboardService stats aggregation and caching."""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.enums import MemberClassification, MemberStatus
+from src.models.member import Member
+from src.services.dashboard_service import (
+    DashboardService,
+    StatsCache,
+    dashboard_stats_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    dashboard_stats_cache.invalidate()
+    yield
+    dashboard_stats_cache.invalidate()
+
+
+class TestDashboardStats:
+    """Tests for the aggregated stats query."""
+
+    async def test_get_stats_returns_all_cards(self, async_db_session: AsyncSession):
+        """One query fills every stat card."""
+        stats = await DashboardService(async_db_session).get_stats()
+
+        assert set(stats) == {
+            "active_members",
+            "members_change",
+            "active_students",
+            "pending_grievances",
+            "dues_mtd",
+        }
+        assert isinstance(stats["dues_mtd"], float)
+
+    async def test_member_commit_invalidates_cache(self, async_db_session: AsyncSession):
+        """Committing a member write drops the cached stats."""
+        service = DashboardService(async_db_session)
+        before = await service.get_stats()
+
+        async_db_session.add(
+            Member(
+                member_number=f"DASH-{uuid.uuid4().hex[:8]}",
+                first_name="Dash",
+                last_name="Board",
+                status=MemberStatus.ACTIVE,
+                classification=MemberClassification.JOURNEYMAN,
+            )
+        )
+        await async_db_session.commit()
+
+        after = await service.get_stats()
+        assert after["active_members"] == before["active_members"] + 1
+
+
+class TestStatsCache:
+    """Tests for the shared TTL cache."""
+
+    async def test_value_computed_once_per_ttl(self):
+        calls = []
+        cache = StatsCache(ttl_seconds=60)
+
+        async def compute():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        for _ in range(3):
+            await cache.get_or_compute("k", compute)
+
+        assert len(calls) == 1
+
+    async def test_concurrent_misses_compute_once(self):
+        calls = []
+        cache = StatsCache(ttl_seconds=60)
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"n": len(calls)}
+
+        results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(r == {"n": 1} for r in results)
+
+    async def test_expired_entry_is_recomputed(self):
+        calls = []
+        cache = StatsCache(ttl_seconds=0)
+
+        async def compute():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        await cache.get_or_compute("k", compute)
+        await cache.get_or_compute("k", compute)
+
+        assert len(calls) == 2
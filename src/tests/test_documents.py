@@ -1,9 +1,14 @@
 """Tests for Document Management endpoints (Phase 3)."""
 
+import hashlib
+import time
+import uuid
+import zipfile
 import pytest
 from unittest.mock import patch, MagicMock
 from io import BytesIO
 
+from src.services.s3_service import S3Service
 from src.tests.helpers import create_member
 
 
@@ -13,11 +18,13 @@ class MockS3Service:
     def __init__(self):
         self.files = {}
         self.bucket_exists = True
+        self.uploads = 0
 
     def ensure_bucket_exists(self):
         return self.bucket_exists
 
     def upload_file(self, file_data, object_key, content_type=None, metadata=None):
+        self.uploads += 1
         content = file_data.read()
         self.files[object_key] = {
             "content": content,
@@ -27,25 +34,62 @@ class MockS3Service:
         }
         return True
 
+    def upload_stream(self, chunks, object_key, content_type=None, metadata=None):
+        return self.upload_file(BytesIO(b"".join(chunks)), object_key, content_type, metadata)
+
     def download_file(self, object_key):
         if object_key not in self.files:
             return None
         return BytesIO(self.files[object_key]["content"])
 
+    def open_download(self, object_key, range_header=None, if_none_match=None):
+        if object_key not in self.files:
+            return None
+        content = self.files[object_key]["content"]
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        if if_none_match == etag:
+            return {"status": 304, "headers": {"ETag": etag}, "content_type": None, "body": None}
+        headers = {"Accept-Ranges": "bytes", "ETag": etag}
+        status = 200
+        if range_header:
+            start, end = range_header.removeprefix("bytes=").split("-")
+            start, end = int(start), min(int(end or len(content) - 1), len(content) - 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+            content, status = content[start : end + 1], 206
+        headers["Content-Length"] = str(len(content))
+        return {
+            "status": status,
+            "headers": headers,
+            "content_type": self.files[object_key]["content_type"],
+            "body": iter([content]),
+        }
+
     def get_presigned_url(self, object_key, expiry=None, download=False, filename=None):
         if object_key not in self.files:
             return None
-        return f"http://minio:9000/test-bucket/{object_key}?presigned=true"
+        url = f"http://minio:9000/test-bucket/{object_key}?presigned=true"
+        return f"{url}&filename={filename}" if download and filename else url
+
+    def get_presigned_urls(self, files, expiry=None, download=False):
+        return {(key, filename): self.get_presigned_url(key, expiry, download, filename) for key, filename in files}
 
     def get_upload_presigned_url(self, object_key, content_type=None, expiry=None):
         return f"http://minio:9000/test-bucket/{object_key}?upload=true"
 
+    def read_range(self, object_key, start, end):
+        if object_key not in self.files:
+            return None
+        return self.files[object_key]["content"][start : end + 1]
+
     def delete_file(self, object_key):
         if object_key in self.files:
             del self.files[object_key]
             return True
         return False
 
+    def file_exists(self, object_key):
+        return object_key in self.files
+
     def get_file_metadata(self, object_key):
         if object_key not in self.files:
             return None
@@ -89,6 +133,309 @@ async def test_upload_document(async_client, mock_s3):
     assert result["category"] == "certifications"
     assert "id" in result
     assert "s3_key" in result
+    assert result["content_hash"] == hashlib.sha256(file_content).hexdigest()
+
+
+class _FakeBody:
+    def __init__(self, content):
+        self.content = content
+        self.closed = False
+
+    def iter_chunks(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeS3Client:
+    """boto3 client stand-in recording multipart and get_object calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.parts = []
+        self.bodies = []
+        self.get_error = None
+
+    def get_object(self, **kwargs):
+        self.calls.append(("get", kwargs))
+        if self.get_error:
+            raise self.get_error
+        if "Range" in kwargs:
+            body = _FakeBody(b"0123")
+            self.bodies.append(body)
+            return {"ContentLength": 4, "ContentRange": "bytes 0-3/10", "ETag": '"e1"', "Body": body}
+        body = _FakeBody(b"0123456789")
+        self.bodies.append(body)
+        return {"ContentLength": 10, "ETag": '"e1"', "ContentType": "application/pdf", "Body": body}
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append("create")
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, Body, PartNumber, **kwargs):
+        self.parts.append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, MultipartUpload, **kwargs):
+        self.calls.append(("complete", [part["PartNumber"] for part in MultipartUpload["Parts"]]))
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append("abort")
+
+    def put_object(self, Body, **kwargs):
+        self.calls.append(("put", Body))
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.calls.append("sign")
+        return f"https://s3/{Params['Key']}?expires={ExpiresIn}&n={self.calls.count('sign')}"
+
+    def delete_object(self, **kwargs):
+        pass
+
+
+def _s3_with_fake_client():
+    service = S3Service()
+    service._client = _FakeS3Client()
+    return service
+
+
+def test_upload_stream_sends_bounded_parts():
+    """Chunks are regrouped into parts of part_size; the last part holds the rest."""
+    service = _s3_with_fake_client()
+
+    key = service.upload_stream(iter([b"abc"] * 4), "docs/a.pdf", part_size=5)
+
+    assert key == "docs/a.pdf"
+    assert service.client.parts == [b"abcab", b"cabca", b"bc"]
+    assert service.client.calls == ["create", ("complete", [1, 2, 3])]
+
+
+def test_upload_stream_small_file_uses_single_put():
+    service = _s3_with_fake_client()
+
+    service.upload_stream(iter([b"tiny"]), "docs/tiny.txt", part_size=5)
+
+    assert service.client.calls == [("put", b"tiny")]
+
+
+def test_upload_stream_aborts_when_source_fails():
+    """A failing source (e.g. the size limit) aborts the multipart upload."""
+    service = _s3_with_fake_client()
+
+    def chunks():
+        yield b"x" * 10
+        raise ValueError("File too large")
+
+    with pytest.raises(ValueError):
+        service.upload_stream(chunks(), "docs/big.pdf", part_size=5)
+
+    assert service.client.calls == ["create", "abort"]
+
+
+def test_upload_document_enforces_size_limit_while_streaming(db_session, mock_s3):
+    """Uploads without a declared size are cut off once they pass the limit."""
+    from src.services.document_service import DocumentService
+
+    service = DocumentService(db_session)
+    service.settings = service.settings.model_copy(update={"MAX_FILE_SIZE_MB": 1})
+
+    with pytest.raises(ValueError, match="too large"):
+        service.upload_document(
+            file_data=BytesIO(b"x" * (2 * 1024 * 1024)),
+            filename="big.pdf",
+            content_type="application/pdf",
+            size=None,
+            record_type="member",
+            record_id=1,
+        )
+    assert mock_s3.files == {}
+
+
+def test_presigned_urls_are_cached_until_half_expired():
+    """A page of URLs is signed once and reused while at least half their lifetime remains."""
+    service = _s3_with_fake_client()
+    files = [(f"docs/{n}.pdf", f"{n}.pdf") for n in range(3)]
+
+    first = service.get_presigned_urls(files, expiry=600, download=True)
+    again = service.get_presigned_urls(files, expiry=600, download=True)
+    single = service.get_presigned_url("docs/0.pdf", expiry=600, download=True, filename="0.pdf")
+
+    assert service.client.calls.count("sign") == 3
+    assert again == first
+    assert single == first[("docs/0.pdf", "0.pdf")]
+
+    with patch("src.services.s3_service.time.time", return_value=time.time() + 301):
+        service.get_presigned_urls(files[:1], expiry=600, download=True)
+    assert service.client.calls.count("sign") == 4
+
+
+def test_presigned_url_cache_is_bounded_and_evicted_on_delete():
+    service = _s3_with_fake_client()
+    service.settings = service.settings.model_copy(update={"S3_URL_CACHE_SIZE": 2})
+
+    service.get_presigned_urls([("a", None), ("b", None), ("c", None)])
+    assert [key[0] for key in service._url_cache] == ["b", "c"]
+
+    service.delete_file("c")
+    assert [key[0] for key in service._url_cache] == ["b"]
+
+
+def test_open_download_streams_chunks_and_forwards_range():
+    service = _s3_with_fake_client()
+
+    full = service.open_download("docs/a.pdf", chunk_size=4)
+    partial = service.open_download("docs/a.pdf", range_header="bytes=0-3")
+    ignored = service.open_download("docs/a.pdf", range_header="bytes=0-1,5-6")
+
+    assert full["status"] == 200
+    assert list(full["body"]) == [b"0123", b"4567", b"89"]
+    assert full["headers"] == {"Accept-Ranges": "bytes", "Content-Length": "10", "ETag": '"e1"'}
+    assert partial["status"] == 206
+    assert partial["headers"]["Content-Range"] == "bytes 0-3/10"
+    assert service.client.calls[1][1]["Range"] == "bytes=0-3"
+    assert "Range" not in service.client.calls[2][1]  # Multi-range requests get the whole file
+    assert ignored["status"] == 200
+
+
+def test_open_download_body_releases_connection_unread():
+    service = _s3_with_fake_client()
+
+    service.open_download("docs/a.pdf")["body"].close()
+
+    assert service.client.bodies[0].closed
+
+
+def test_abandoned_export_closes_prefetched_downloads(db_session):
+    """A client that disconnects mid-export leaves no S3 body open."""
+    from src.services.document_service import EXPORT_PREFETCH, DocumentService
+
+    service = DocumentService(db_session)
+    service.s3 = _s3_with_fake_client()
+    files = [(f"general/{n}.pdf", f"docs/{n}.pdf", None) for n in range(EXPORT_PREFETCH + 2)]
+
+    entries = service._export_entries(files)
+    name, body, _ = next(entries)
+    assert name == "general/0.pdf"
+    assert next(body) == b"0123456789"
+    entries.close()  # What the zip stream does when the client goes away
+
+    deadline = time.monotonic() + 5
+    while not all(opened.closed for opened in service.s3.client.bodies) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(service.s3.client.bodies) > 1  # Prefetched beyond the entry being written
+    assert all(opened.closed for opened in service.s3.client.bodies)
+
+
+def test_open_download_maps_not_modified():
+    from botocore.exceptions import ClientError
+
+    service = _s3_with_fake_client()
+    service.client.get_error = ClientError(
+        {"Error": {"Code": "304", "Message": "Not Modified"}, "ResponseMetadata": {"HTTPStatusCode": 304}},
+        "GetObject",
+    )
+
+    result = service.open_download("docs/a.pdf", if_none_match='"e1"')
+
+    assert service.client.calls[0][1]["IfNoneMatch"] == '"e1"'
+    assert result == {"status": 304, "headers": {"ETag": '"e1"'}, "content_type": None, "body": None}
+
+
+async def test_download_supports_range_and_etag(async_client, mock_s3):
+    """Direct downloads honour Range (206) and If-None-Match (304)."""
+    member = await create_member(async_client)
+    content = b"0123456789" * 100
+    files = {"file": ("range_test.pdf", BytesIO(content), "application/pdf")}
+    data = {"record_type": "member", "record_id": member["id"]}
+    doc_id = (await async_client.post("/documents/upload", files=files, data=data)).json()["id"]
+
+    full = await async_client.get(f"/documents/{doc_id}/download")
+    assert full.status_code == 200
+    assert full.content == content
+    assert full.headers["accept-ranges"] == "bytes"
+    etag = full.headers["etag"]
+
+    partial = await async_client.get(f"/documents/{doc_id}/download", headers={"Range": "bytes=10-19"})
+    assert partial.status_code == 206
+    assert partial.content == content[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(content)}"
+
+    cached = await async_client.get(f"/documents/{doc_id}/download", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+async def test_export_documents_streams_zip(async_client, mock_s3):
+    """A record's documents come back as one zip, grouped by category, duplicates renamed."""
+    member = await create_member(async_client)
+    uploads = [
+        ("report.pdf", b"first report", "grievances"),
+        ("report.pdf", b"second report", "grievances"),
+        ("cert.pdf", b"certificate", "certifications"),
+        ("gone.pdf", b"deleted from storage", "certifications"),
+    ]
+    for filename, content, category in uploads:
+        response = await async_client.post(
+            "/documents/upload",
+            files={"file": (filename, BytesIO(content), "application/pdf")},
+            data={"record_type": "member", "record_id": member["id"], "category": category},
+        )
+        if filename == "gone.pdf":
+            del mock_s3.files[response.json()["s3_key"]]
+
+    response = await async_client.get(f"/documents/export?record_type=member&record_id={member['id']}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert response.headers["x-document-count"] == "4"
+    archive = zipfile.ZipFile(BytesIO(response.content))
+    assert archive.testzip() is None
+    assert archive.read("certifications/cert.pdf") == b"certificate"
+    assert {archive.read("grievances/report.pdf"), archive.read("grievances/report (2).pdf")} == {
+        b"first report",
+        b"second report",
+    }
+    assert archive.read("MISSING.txt") == b"certifications/gone.pdf\n"
+
+
+async def test_export_documents_requires_filter(async_client, mock_s3):
+    response = await async_client.get("/documents/export")
+    assert response.status_code == 400
+
+    response = await async_client.get("/documents/export?record_type=member&record_id=999999999")
+    assert response.status_code == 404
+
+
+async def test_duplicate_uploads_share_one_stored_object(async_client, mock_s3):
+    """The same content attached to two records is stored once and freed with its last reference."""
+    content = f"scanned license {uuid.uuid4()}".encode()
+    doc_ids = []
+    for _ in range(2):
+        member = await create_member(async_client)
+        response = await async_client.post(
+            "/documents/upload",
+            files={"file": ("license.pdf", BytesIO(content), "application/pdf")},
+            data={"record_type": "member", "record_id": member["id"], "category": "certifications"},
+        )
+        assert response.status_code == 201
+        doc_ids.append(response.json()["id"])
+        s3_key = response.json()["s3_key"]
+
+    assert mock_s3.uploads == 1
+    assert list(mock_s3.files) == [s3_key]
+    assert s3_key == f"blobs/{s3_key.rsplit('/', 1)[-1][:2]}/{hashlib.sha256(content).hexdigest()}"
+
+    response = await async_client.delete(f"/documents/{doc_ids[0]}?hard_delete=true")
+    assert response.status_code == 200
+    assert s3_key in mock_s3.files  # Still used by the second document
+
+    response = await async_client.get(f"/documents/{doc_ids[1]}/download")
+    assert response.content == content
+
+    await async_client.delete(f"/documents/{doc_ids[1]}?hard_delete=true")
+    assert mock_s3.files == {}
 
 
 async def test_upload_document_invalid_extension(async_client, mock_s3):
@@ -169,6 +516,41 @@ async def test_list_documents(async_client, mock_s3):
     assert isinstance(result["documents"], list)
 
 
+async def test_list_documents_includes_download_urls(async_client, mock_s3):
+    """Listed documents carry presigned download URLs, signed as one batch."""
+    member = await create_member(async_client)
+    files = {"file": ("listed.pdf", BytesIO(b"listed"), "application/pdf")}
+    await async_client.post("/documents/upload", files=files, data={"record_type": "member", "record_id": member["id"]})
+
+    with patch.object(mock_s3, "get_presigned_urls", wraps=mock_s3.get_presigned_urls) as batch:
+        response = await async_client.get(f"/documents/?record_type=member&record_id={member['id']}")
+
+    documents = response.json()["documents"]
+    assert len(documents) == 1
+    assert documents[0]["download_url"].startswith("http://minio:9000/test-bucket/")
+    assert batch.call_count == 1
+
+
+async def test_list_documents_signs_shared_content_per_filename(async_client, mock_s3):
+    """Documents sharing one stored blob still download under their own names."""
+    member = await create_member(async_client)
+    content = f"shared {uuid.uuid4()}".encode()
+    for name in ("first.pdf", "second.pdf"):
+        await async_client.post(
+            "/documents/upload",
+            files={"file": (name, BytesIO(content), "application/pdf")},
+            data={"record_type": "member", "record_id": member["id"]},
+        )
+
+    with patch.object(mock_s3, "get_presigned_urls", wraps=mock_s3.get_presigned_urls) as batch:
+        response = await async_client.get(f"/documents/?record_type=member&record_id={member['id']}")
+
+    assert batch.call_count == 1
+    urls = {doc["original_filename"]: doc["download_url"] for doc in response.json()["documents"]}
+    assert urls["first.pdf"].endswith("filename=first.pdf")
+    assert urls["second.pdf"].endswith("filename=second.pdf")
+
+
 async def test_list_documents_with_filters(async_client, mock_s3):
     """Test listing documents with filters."""
     # Upload a document
@@ -254,6 +636,37 @@ async def test_presigned_upload_url(async_client, mock_s3):
     assert "expires_in" in result
 
 
+async def test_confirm_upload_records_content_hash(async_client, mock_s3):
+    """Confirming a direct upload records the uploaded object's hash."""
+    member = await create_member(async_client)
+    response = await async_client.post(
+        "/documents/presigned-upload",
+        json={
+            "filename": "scan.pdf",
+            "content_type": "application/pdf",
+            "record_type": "member",
+            "record_id": member["id"],
+        },
+    )
+    s3_key = response.json()["s3_key"]
+    content = b"%PDF-1.4 direct upload" * 1000
+    mock_s3.upload_file(BytesIO(content), s3_key, content_type="application/pdf")
+
+    response = await async_client.post(
+        "/documents/confirm-upload",
+        data={
+            "s3_key": s3_key,
+            "filename": "scan.pdf",
+            "content_type": "application/pdf",
+            "record_type": "member",
+            "record_id": member["id"],
+        },
+    )
+
+    assert response.status_code == 201, response.json()
+    assert response.json()["content_hash"] == hashlib.sha256(content).hexdigest()
+
+
 async def test_presigned_upload_invalid_extension(async_client, mock_s3):
     """Test presigned upload rejects invalid extensions."""
     member = await create_member(async_client)
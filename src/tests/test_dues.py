@@ -535,3 +535,221 @@ async def test_delete_pending_adjustment(async_client):
     # Verify it's gone
     get_response = await async_client.get(f"/dues-adjustments/{created['id']}")
     assert get_response.status_code == 404
+
+
+# ============================================================================
+# BULK DUES GENERATION TESTS
+# ============================================================================
+
+def test_generate_period_dues_bulk_counts(db_session):
+    """Bulk generation bills members with a rate once and reports counts."""
+    from datetime import date
+    from decimal import Decimal
+
+    from src.db.enums import MemberClassification
+    from src.models.dues_payment import DuesPayment
+    from src.models.dues_period import DuesPeriod
+    from src.models.dues_period_summary import DuesPeriodSummary
+    from src.models.dues_rate import DuesRate
+    from src.models.member import Member
+    from src.services.dues_payment_service import generate_period_dues
+
+    # Year 1901 keeps the period clear of seed/test data; rolled back afterwards
+    period = DuesPeriod(
+        period_year=1901,
+        period_month=1,
+        due_date=date(1901, 1, 1),
+        grace_period_end=date(1901, 1, 15),
+    )
+    rate = DuesRate(
+        classification=MemberClassification.HONORARY,
+        monthly_amount=Decimal("12.50"),
+        effective_date=date(1900, 1, 1),
+    )
+    unique = str(uuid.uuid4())[:8]
+    billed = Member(
+        member_number=f"GEN{unique}A",
+        first_name="Billed",
+        last_name="Member",
+        classification=MemberClassification.HONORARY,
+    )
+    unrated = Member(
+        member_number=f"GEN{unique}B",
+        first_name="Unrated",
+        last_name="Member",
+        classification=MemberClassification.JOURNEYMAN,
+    )
+    db_session.add_all([period, rate, billed, unrated])
+    db_session.flush()
+
+    result = generate_period_dues(db_session, period.id, member_ids=[billed.id, unrated.id])
+
+    assert result.active_members == 2
+    assert result.created == 1
+    assert result.already_existing == 0
+    assert result.skipped_no_rate == 1
+
+    payment = db_session.query(DuesPayment).filter(DuesPayment.period_id == period.id).one()
+    assert payment.member_id == billed.id
+    assert payment.amount_due == Decimal("12.50")
+    assert payment.receipt_number.startswith("RCP-190101-")
+    assert len(payment.receipt_number) == len("RCP-190101-") + 32
+
+    # Bulk insert bypasses the ORM but still refreshes the period rollup
+    summary = db_session.get(DuesPeriodSummary, period.id)
+    assert summary.member_count == 1
+    assert summary.total_due == Decimal("12.50")
+
+    # Re-running is idempotent
+    again = generate_period_dues(db_session, period.id, member_ids=[billed.id, unrated.id])
+    assert again.created == 0
+    assert again.already_existing == 1
+
+
+async def test_generate_dues_unknown_period(async_client):
+    """Generating dues for a missing period returns 404."""
+    response = await async_client.post("/dues-payments/generate/999999999")
+    assert response.status_code == 404
+
+
+def test_run_overdue_sweep_batches(db_session):
+    """Sweep marks only unpaid past-grace payments OVERDUE, in batches."""
+    from datetime import date
+    from decimal import Decimal
+
+    from src.db.enums import DuesPaymentStatus, MemberClassification
+    from src.models.dues_payment import DuesPayment
+    from src.models.dues_period import DuesPeriod
+    from src.models.member import Member
+    from src.services.dues_payment_service import run_overdue_sweep
+
+    # Year 1901 keeps the period clear of seed/test data; rolled back afterwards
+    period = DuesPeriod(
+        period_year=1901,
+        period_month=2,
+        due_date=date(1901, 2, 1),
+        grace_period_end=date(1901, 2, 15),
+    )
+    unique = str(uuid.uuid4())[:8]
+    members = [
+        Member(
+            member_number=f"OVD{unique}{i}",
+            first_name="Overdue",
+            last_name=f"Member{i}",
+            classification=MemberClassification.JOURNEYMAN,
+        )
+        for i in range(4)
+    ]
+    db_session.add(period)
+    db_session.add_all(members)
+    db_session.flush()
+
+    statuses = [
+        (DuesPaymentStatus.PENDING, Decimal("0")),
+        (DuesPaymentStatus.PARTIAL, Decimal("10.00")),
+        (DuesPaymentStatus.DUE, Decimal("0")),
+        (DuesPaymentStatus.PAID, Decimal("25.00")),
+    ]
+    payments = [
+        DuesPayment(
+            member_id=member.id,
+            period_id=period.id,
+            amount_due=Decimal("25.00"),
+            amount_paid=amount_paid,
+            status=status,
+        )
+        for member, (status, amount_paid) in zip(members, statuses)
+    ]
+    db_session.add_all(payments)
+    db_session.flush()
+
+    # Nothing is overdue until the grace period has passed
+    assert run_overdue_sweep(db_session, as_of=date(1901, 2, 15)).updated == 0
+
+    preview = run_overdue_sweep(db_session, as_of=date(1901, 3, 1), dry_run=True)
+    assert preview.dry_run is True
+    assert preview.updated == 3
+
+    result = run_overdue_sweep(db_session, batch_size=2, as_of=date(1901, 3, 1))
+    assert result.updated == 3
+    assert result.batches == 2
+
+    db_session.expire_all()
+    assert [p.status for p in payments] == [
+        DuesPaymentStatus.OVERDUE,
+        DuesPaymentStatus.OVERDUE,
+        DuesPaymentStatus.OVERDUE,
+        DuesPaymentStatus.PAID,
+    ]
+
+    # A second sweep finds nothing left to update
+    assert run_overdue_sweep(db_session, as_of=date(1901, 3, 1)).updated == 0
+
+
+def test_dues_period_summary_rollup(db_session):
+    """Payment writes keep the per-period rollup in step with the payments."""
+    from datetime import date, datetime
+    from decimal import Decimal
+
+    from src.db.enums import DuesPaymentStatus, MemberClassification
+    from src.models.dues_payment import DuesPayment
+    from src.models.dues_period import DuesPeriod
+    from src.models.dues_period_summary import DuesPeriodSummary
+    from src.models.member import Member
+    from src.services.dues_summary_service import get_period_summaries
+
+    # Year 1901 keeps the period clear of seed/test data; rolled back afterwards
+    period = DuesPeriod(
+        period_year=1901,
+        period_month=3,
+        due_date=date(1901, 3, 1),
+        grace_period_end=date(1901, 3, 15),
+    )
+    empty_period = DuesPeriod(
+        period_year=1901,
+        period_month=4,
+        due_date=date(1901, 4, 1),
+        grace_period_end=date(1901, 4, 15),
+    )
+    unique = str(uuid.uuid4())[:8]
+    members = [
+        Member(
+            member_number=f"SUM{unique}{i}",
+            first_name="Summary",
+            last_name=f"Member{i}",
+            classification=MemberClassification.JOURNEYMAN,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all([period, empty_period, *members])
+    db_session.flush()
+
+    payments = [
+        DuesPayment(member_id=member.id, period_id=period.id, amount_due=Decimal("40.00"))
+        for member in members
+    ]
+    db_session.add_all(payments)
+    db_session.flush()
+
+    summary = db_session.get(DuesPeriodSummary, period.id)
+    assert summary.member_count == 3
+    assert summary.paid_count == 0
+    assert summary.total_due == Decimal("120.00")
+
+    payments[0].amount_paid = Decimal("40.00")
+    payments[0].status = DuesPaymentStatus.PAID
+    payments[1].amount_paid = Decimal("15.00")
+    payments[2].deleted_at = datetime.utcnow()
+    db_session.flush()
+
+    rows = get_period_summaries(db_session, 1901)
+    march = next(r for r in rows if r["month"] == 3)
+    assert march["member_count"] == 2
+    assert march["paid_count"] == 1
+    assert march["total_due"] == Decimal("80.00")
+    assert march["total_paid"] == Decimal("55.00")
+
+    # Periods without payments still appear, with zero totals
+    april = next(r for r in rows if r["month"] == 4)
+    assert april["member_count"] == 0
+    assert april["total_due"] == Decimal("0")
@@ -1,4 +1,18 @@
 import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from src.routers import files
+from src.services.file_attachment_service import save_uploaded_file
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    """Write /files/upload output under the test's temp dir, not the working directory."""
+    monkeypatch.setattr(files, "UPLOAD_DIR", str(tmp_path))
+    return tmp_path
 
 
 async def test_upload_pdf(async_client):
@@ -26,3 +40,33 @@ async def test_reject_invalid_type(async_client):
     )
     # API currently accepts all files - adjust when validation is added
     assert response.status_code in (200, 201, 400, 415, 422)
+
+
+async def test_upload_is_written_whole(async_client, upload_dir):
+    content = b"%PDF-1.4 " + b"x" * (3 * 1024 * 1024)
+    response = await async_client.post(
+        "/files/upload", files={"file": ("large.pdf", io.BytesIO(content), "application/pdf")}
+    )
+    file_path = response.json()["file_path"]
+    assert os.path.dirname(file_path) == str(upload_dir)
+    with open(file_path, "rb") as f:
+        assert f.read() == content
+
+
+def test_save_uploaded_file_streams_to_temp_and_renames(tmp_path):
+    class _FailingFile(io.BytesIO):
+        def read(self, size=-1):
+            if self.tell() >= 4:
+                raise OSError("connection reset")
+            return super().read(size)
+
+    target = tmp_path / "member" / "doc.pdf"
+    save_uploaded_file(str(target), UploadFile(file=io.BytesIO(b"first version"), filename="doc.pdf"), chunk_size=4)
+    assert target.read_bytes() == b"first version"
+
+    with pytest.raises(OSError):
+        save_uploaded_file(str(target), UploadFile(file=_FailingFile(b"second"), filename="doc.pdf"), chunk_size=4)
+
+    # A failed write leaves the previous file intact and no temp file behind
+    assert target.read_bytes() == b"first version"
+    assert os.listdir(target.parent) == ["doc.pdf"]
@@ -0,0 +1,252 @@
+"""Tests for the streaming file attachment integrity check."""
+
+import hashlib
+import threading
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import literal_column, text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+
+from src.db.base import Base
+from src.db.integrity_check import IntegrityChecker, IntegrityIssue, load_watermark, save_watermark
+from src.db.integrity_repair import IntegrityRepairer
+from src.db.integrity_rules import build_table_rules
+from src.models.file_attachment import FileAttachment
+from src.models.file_blob import FileBlob
+from src.models.member_employment import MemberEmployment
+from src.models.refresh_token import RefreshToken
+from src.services.blob_store import acquire_blob
+
+
+def _attachment(db: Session, file_path: str, file_size: int = 1024) -> FileAttachment:
+    attachment = FileAttachment(
+        record_type="member",
+        record_id=1,
+        file_name=file_path.rsplit("/", 1)[-1] or "unnamed",
+        file_path=file_path,
+        file_type="application/pdf",
+        file_size=file_size,
+    )
+    db.add(attachment)
+    db.flush()
+    return attachment
+
+
+class _RecordingCheck:
+    """File existence check that records the paths it was asked about."""
+
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.paths = []
+        self._lock = threading.Lock()
+
+    def __call__(self, file_path: str) -> bool:
+        with self._lock:
+            self.paths.append(file_path)
+        return file_path in self.existing
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / "integrity_watermark.json")
+
+
+@pytest.fixture
+def orphan_employment(db_session):
+    """Employment pointing at a member and organization that do not exist."""
+    db_session.execute(text("SET LOCAL session_replication_role = replica"))  # Skip FK triggers
+    employment = MemberEmployment(
+        member_id=2_000_000_000,
+        organization_id=2_000_000_000,
+        start_date=date(2024, 6, 1),
+        end_date=date(2024, 1, 1),
+    )
+    db_session.add(employment)
+    db_session.flush()
+    db_session.execute(text("SET LOCAL session_replication_role = origin"))
+    return employment
+
+
+class TestTableRules:
+    """Rules generated from the model metadata."""
+
+    def test_every_foreign_key_gets_a_rule(self):
+        table_rules = build_table_rules(Base.metadata)
+
+        fk_rules = sum(1 for rules in table_rules for rule in rules.rules if rule.name.startswith("fk_"))
+        assert fk_rules == sum(len(table.foreign_key_constraints) for table in Base.metadata.tables.values())
+
+    def test_one_pass_reports_every_broken_rule_of_a_row(self, db_session, orphan_employment):
+        checker = IntegrityChecker(db_session)
+        checker.check_table_rules()
+
+        found = {
+            (issue.category, issue.fix_action)
+            for issue in checker.issues
+            if issue.table == "member_employments" and issue.record_id == orphan_employment.id
+        }
+        assert ("foreign_key", "delete") in found
+        assert ("date_logic", "swap dates or set end_date to NULL") in found
+        descriptions = [issue.description for issue in checker.issues if issue.record_id == orphan_employment.id]
+        assert any("non-existent members (member_id=2000000000)" in d for d in descriptions)
+        assert any("non-existent organizations (organization_id=2000000000)" in d for d in descriptions)
+        assert "member_employments" in checker.table_timings
+
+    def test_only_missing_tables_are_skipped(self, db_session):
+        table_rules = build_table_rules(Base.metadata)
+        members = next(rules for rules in table_rules if rules.table.name == "members")
+        checker = IntegrityChecker(db_session)
+
+        db_session.execute(text("ALTER TABLE members RENAME TO members_moved"))
+        assert checker._query_table_rules(members)[1] is None
+        db_session.execute(text("ALTER TABLE members_moved RENAME TO members"))
+
+        members.rules[0].condition = literal_column("no_such_column").is_(None)
+        with pytest.raises(ProgrammingError):
+            checker._query_table_rules(members)
+
+    def test_repairer_deletes_orphans(self, db_session, orphan_employment):
+        checker = IntegrityChecker(db_session)
+        checker.check_table_rules()
+        orphan_issues = [
+            issue
+            for issue in checker.issues
+            if issue.category == "foreign_key" and issue.record_id == orphan_employment.id
+        ]
+
+        repairer = IntegrityRepairer(db_session)
+        actions = [repairer._repair_issue(issue) for issue in orphan_issues]
+
+        assert all(action.success for action in actions)
+        db_session.flush()
+        assert db_session.get(MemberEmployment, orphan_employment.id) is None
+
+    def test_orphans_outside_the_allowlist_need_review(self, db_session, monkeypatch):
+        db_session.execute(text("SET LOCAL session_replication_role = replica"))
+        token = RefreshToken(
+            user_id=2_000_000_000,
+            token_hash=uuid.uuid4().hex,
+            expires_at=datetime.utcnow() + timedelta(days=1),
+        )
+        db_session.add(token)
+        db_session.flush()
+        db_session.execute(text("SET LOCAL session_replication_role = origin"))
+
+        checker = IntegrityChecker(db_session)
+        checker.check_table_rules()
+        issues = [
+            issue
+            for issue in checker.issues
+            if issue.table == "refresh_tokens" and issue.record_id == token.id
+        ]
+        assert [(issue.fix_action, issue.auto_fixable) for issue in issues] == [
+            ("delete", False)
+        ]
+
+        repairer = IntegrityRepairer(db_session)
+        action = repairer._repair_issue(issues[0])
+        assert not action.success
+        assert db_session.get(RefreshToken, token.id) is token
+
+        monkeypatch.setattr("builtins.input", lambda prompt: "1")
+        actions = repairer.interactive_repair_orphans(issues)
+        assert [action.action_taken for action in actions] == ["delete"]
+        db_session.expunge_all()
+        assert db_session.get(RefreshToken, token.id) is None
+
+    def test_deleting_attachments_releases_shared_content(self, db_session, tmp_path):
+        content_path = tmp_path / "content"
+        content_path.write_bytes(b"shared")
+        content_hash = hashlib.sha256(uuid.uuid4().bytes).hexdigest()
+        attachments = []
+        for _ in range(2):
+            blob, _ = acquire_blob(
+                db_session, content_hash, 6, "local", storage_key=str(content_path)
+            )
+            attachment = _attachment(db_session, blob.storage_key)
+            attachment.blob_id = blob.id
+            attachments.append(attachment)
+        db_session.flush()
+
+        repairer = IntegrityRepairer(db_session)
+        for attachment in attachments:
+            issue = IntegrityIssue(
+                category="foreign_key",
+                severity="warning",
+                table="file_attachments",
+                record_id=attachment.id,
+                description="orphaned attachment",
+                auto_fixable=True,
+                fix_action="delete",
+            )
+            assert repairer._repair_issue(issue).success
+            db_session.flush()
+            if attachment is attachments[0]:
+                assert db_session.get(FileBlob, blob.id).ref_count == 1
+                assert content_path.exists()
+
+        assert db_session.get(FileBlob, blob.id) is None
+        assert not content_path.exists()
+
+
+class TestCheckFileAttachments:
+    """Chunked file checks and the incremental watermark."""
+
+    def test_flags_missing_files_empty_paths_and_odd_sizes(self, db_session, state_file):
+        present = _attachment(db_session, "/tmp/present.pdf")
+        missing = _attachment(db_session, "/tmp/missing.pdf")
+        no_path = _attachment(db_session, "")
+        huge = _attachment(db_session, "/tmp/huge.pdf", file_size=200_000_000)
+        remote = _attachment(db_session, "https://example.com/remote.pdf")
+        check = _RecordingCheck(existing={"/tmp/present.pdf", "/tmp/huge.pdf"})
+
+        checker = IntegrityChecker(db_session, file_exists=check, state_file=state_file)
+        checker.chunk_size = 2  # Several chunks
+        checker.check_file_attachments()
+
+        issues = {(issue.record_id, issue.severity) for issue in checker.issues}
+        assert (missing.id, "warning") in issues
+        assert (no_path.id, "critical") in issues
+        assert (huge.id, "info") in issues
+        assert not any(issue.record_id in (present.id, remote.id) for issue in checker.issues)
+        assert "https://example.com/remote.pdf" not in check.paths
+
+    def test_completed_run_saves_watermark(self, db_session, state_file):
+        attachment = _attachment(db_session, "/tmp/a.pdf")
+
+        IntegrityChecker(db_session, file_exists=_RecordingCheck(), state_file=state_file).check_file_attachments()
+
+        watermark = load_watermark(state_file)
+        assert watermark["last_id"] >= attachment.id
+        assert watermark["updated_at"] >= attachment.updated_at
+
+    def test_incremental_run_only_checks_new_and_updated_rows(self, db_session, state_file):
+        old = _attachment(db_session, "/tmp/old.pdf")
+        changed = _attachment(db_session, "/tmp/changed.pdf")
+        new = _attachment(db_session, "/tmp/new.pdf")
+        cutoff = datetime.utcnow() - timedelta(hours=1)
+        old.updated_at = cutoff
+        changed.file_path = "/tmp/changed-v2.pdf"
+        changed.updated_at = cutoff + timedelta(minutes=5)
+        db_session.flush()
+        save_watermark(state_file, new.id - 1, cutoff)
+
+        check = _RecordingCheck()
+        IntegrityChecker(
+            db_session, incremental=True, file_exists=check, state_file=state_file
+        ).check_file_attachments()
+
+        assert "/tmp/old.pdf" not in check.paths
+        assert {"/tmp/changed-v2.pdf", "/tmp/new.pdf"} <= set(check.paths)
+        assert load_watermark(state_file)["last_id"] >= new.id
+
+    def test_incremental_without_watermark_checks_everything(self, db_session, state_file):
+        _attachment(db_session, "/tmp/first-run.pdf")
+        check = _RecordingCheck()
+
+        IntegrityChecker(db_session, incremental=True, file_exists=check, state_file=state_file).check_file_attachments()
+
+        assert "/tmp/first-run.pdf" in check.paths
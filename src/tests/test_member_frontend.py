@@ -3,9 +3,21 @@ Comprehensive member frontend tests.
 Tests landing, search, detail, employment, and dues sections.
 """
 
+import uuid
+
 import pytest
 from httpx import AsyncClient
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.enums import MemberClassification, MemberStatus
+from src.models.member import Member
+from src.services import member_frontend_service
+from src.services.member_frontend_service import (
+    MemberFrontendService,
+    build_member_tsquery,
+    decode_search_cursor,
+)
 
 
 class TestMembersLanding:
@@ -69,6 +81,91 @@ class TestMembersSearch:
         assert response.status_code in [200, 302, 401, 422]
 
 
+class TestMemberSearchService:
+    """Tests for the indexed member search behind /members/search."""
+
+    @pytest.fixture
+    async def tagged_members(self, async_db_session: AsyncSession):
+        """Five members sharing a unique surname, plus one matching only by email."""
+        tag = f"zq{uuid.uuid4().hex[:8]}"
+        members = [
+            Member(
+                member_number=f"{tag}{i}",
+                first_name=f"First{i}",
+                last_name=tag.capitalize(),
+                status=MemberStatus.ACTIVE,
+                classification=MemberClassification.JOURNEYMAN,
+            )
+            for i in range(5)
+        ]
+        members.append(
+            Member(
+                member_number=f"EM-{uuid.uuid4().hex[:8]}",
+                first_name="Email",
+                last_name="Only",
+                email=f"{tag}@example.org",
+                status=MemberStatus.INACTIVE,
+                classification=MemberClassification.JOURNEYMAN,
+            )
+        )
+        async_db_session.add_all(members)
+        await async_db_session.flush()
+        return tag, members
+
+    def test_tsquery_uses_prefix_terms(self):
+        assert build_member_tsquery("Jo  Smi") == "jo:* & smi:*"
+        assert build_member_tsquery("o'brien") == "o:* & brien:*"
+        assert build_member_tsquery(" -- ") is None
+        assert build_member_tsquery(None) is None
+
+    def test_malformed_cursor_is_first_page(self):
+        assert decode_search_cursor("not-a-cursor", 2) is None
+        assert decode_search_cursor(None, 2) is None
+
+    async def test_prefix_search_ranks_name_matches_first(self, async_db_session, tagged_members):
+        tag, members = tagged_members
+        service = MemberFrontendService(async_db_session)
+
+        found, total, next_cursor = await service.search_members(query=tag[:6])
+
+        assert total == 6
+        assert next_cursor is None
+        assert found[-1].id == members[-1].id  # Email-only match ranks last
+
+    async def test_filters_combine_with_search(self, async_db_session, tagged_members):
+        tag, members = tagged_members
+        service = MemberFrontendService(async_db_session)
+
+        found, total, _ = await service.search_members(query=tag, status="inactive")
+
+        assert [m.id for m in found] == [members[-1].id]
+        assert total == 1
+
+    async def test_keyset_pages_cover_every_match_once(self, async_db_session, tagged_members):
+        tag, members = tagged_members
+        service = MemberFrontendService(async_db_session)
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            found, _, cursor = await service.search_members(query=tag, cursor=cursor, per_page=2)
+            seen.extend(m.id for m in found)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert sorted(seen) == sorted(m.id for m in members)
+
+    async def test_count_is_capped(self, async_db_session, tagged_members, monkeypatch):
+        tag, _ = tagged_members
+        monkeypatch.setattr(member_frontend_service, "SEARCH_COUNT_CAP", 3)
+        service = MemberFrontendService(async_db_session)
+
+        _, total, _ = await service.search_members(query=tag)
+
+        assert total == 4  # Cap + 1: the page shows "3+"
+
+
 class TestMemberDetail:
     """Tests for member detail page."""
 
@@ -0,0 +1,181 @@
+"""Tests for the bcrypt pool, async password wrappers and rehash-on-login."""
+
+import asyncio
+import threading
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+
+from src.config.auth_config import auth_settings
+from src.core.security import (
+    PasswordHashPool,
+    hash_password,
+    hash_password_async,
+    needs_rehash,
+    password_hash_pool,
+    verify_password_async,
+)
+from src.main import app
+from src.models.user import User
+from src.routers.dependencies.auth import get_current_user
+from src.services.auth_service import (
+    InvalidCredentialsError,
+    authenticate_user,
+    authenticate_user_async,
+)
+
+
+def _create_user(session, password: str) -> User:
+    user = User(
+        email=f"hashing-{uuid.uuid4().hex[:8]}@test.com",
+        password_hash=hash_password(password),
+        first_name="Hash",
+        last_name="Test",
+    )
+    session.add(user)
+    session.flush()
+    return user
+
+
+class TestPasswordHashPool:
+    """PasswordHashPool concurrency limit and metrics."""
+
+    def test_jobs_beyond_the_worker_count_queue(self):
+        pool = PasswordHashPool(max_workers=1)
+        started, release = threading.Event(), threading.Event()
+
+        def hold():
+            started.set()
+            return release.wait()
+
+        try:
+            first = pool.submit(hold)
+            started.wait(timeout=5)
+            second = pool.submit(lambda: "done")
+            snapshot = pool.snapshot()
+            release.set()
+
+            assert snapshot["running"] == 1
+            assert snapshot["queued"] == 1
+            assert second.result(timeout=5) == "done"
+            assert first.result(timeout=5) is True
+        finally:
+            pool.shutdown(wait=True)
+
+        snapshot = pool.snapshot()
+        assert snapshot["queued"] == 0
+        assert snapshot["peak_queued"] == 1
+        assert snapshot["completed"] == 2
+        assert snapshot["wait_ms"]["samples"] == 2
+
+    def test_reset_keeps_live_state(self):
+        pool = PasswordHashPool(max_workers=1)
+        pool.run(len, "abc")
+
+        pool.reset()
+
+        snapshot = pool.snapshot()
+        assert snapshot["completed"] == 0
+        assert snapshot["wait_ms"]["samples"] == 0
+        pool.shutdown(wait=True)
+
+    async def test_async_wrappers_do_not_block_the_event_loop(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        try:
+            hashed = await hash_password_async("Shift-Change-1")
+            assert await verify_password_async("Shift-Change-1", hashed)
+            assert not await verify_password_async("wrong", hashed)
+        finally:
+            task.cancel()
+
+        assert ticks > 5
+
+
+class TestRehashOnLogin:
+    """Hashes at an outdated cost factor are upgraded at login."""
+
+    def test_needs_rehash(self, monkeypatch):
+        hashed = hash_password("TestPassword123")
+
+        assert not needs_rehash(hashed)
+        monkeypatch.setattr(auth_settings, "bcrypt_rounds", 4)
+        assert needs_rehash(hashed)
+        assert not needs_rehash("not-a-bcrypt-hash")
+
+    def test_login_rehashes_at_configured_cost(self, db_session, monkeypatch):
+        user = _create_user(db_session, "TestPassword123")
+        old_hash = user.password_hash
+        monkeypatch.setattr(auth_settings, "bcrypt_rounds", 4)
+
+        authenticate_user(db_session, user.email, "TestPassword123")
+
+        assert user.password_hash != old_hash
+        assert user.password_hash.split("$")[2] == "04"
+        # Already current: left alone on the next login
+        current_hash = user.password_hash
+        authenticate_user(db_session, user.email, "TestPassword123")
+        assert user.password_hash == current_hash
+
+    async def test_async_login_rehashes_and_counts_failures(
+        self, db_session, monkeypatch
+    ):
+        monkeypatch.setattr(auth_settings, "bcrypt_rounds", 4)
+        user = _create_user(db_session, "TestPassword123")
+        monkeypatch.setattr(auth_settings, "bcrypt_rounds", 5)
+
+        with pytest.raises(InvalidCredentialsError):
+            await authenticate_user_async(db_session, user.email, "wrong")
+        assert user.failed_login_attempts == 1
+        assert (
+            user.password_hash.split("$")[2] == "04"
+        )  # No rehash without the right password
+
+        await authenticate_user_async(db_session, user.email, "TestPassword123")
+        assert user.failed_login_attempts == 0
+        assert user.password_hash.split("$")[2] == "05"
+
+
+class TestPasswordHashingMetricsEndpoint:
+    """Tests for /admin/metrics/password-hashing."""
+
+    async def test_requires_admin(self, async_client: AsyncClient):
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+            role_names=["staff"]
+        )
+        try:
+            response = await async_client.get("/admin/metrics/password-hashing")
+        finally:
+            app.dependency_overrides.pop(get_current_user, None)
+        assert response.status_code == 403
+
+    async def test_reports_pool_state(self, async_client: AsyncClient):
+        hash_password("TestPassword123")
+
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+            role_names=["admin"]
+        )
+        try:
+            response = await async_client.get(
+                "/admin/metrics/password-hashing?reset=true"
+            )
+        finally:
+            app.dependency_overrides.pop(get_current_user, None)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["completed"] >= 1
+        assert data["config"] == {
+            "workers": auth_settings.password_hash_workers,
+            "bcrypt_rounds": auth_settings.bcrypt_rounds,
+        }
+        assert password_hash_pool.snapshot()["completed"] == 0
@@ -0,0 +1,115 @@
+"""Tests for connection pool instrumentation and the admin metrics endpoint."""
+
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import create_engine, text
+
+from src.config.settings import settings
+from src.db.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+    async_pool_metrics,
+    pool_metrics,
+)
+from src.db.session import async_engine, engine, get_async_db
+from src.main import app
+from src.routers.dependencies.auth import get_current_user
+
+
+@pytest.fixture
+def small_engine():
+    test_engine = create_engine(str(settings.DATABASE_URL), pool_size=1, max_overflow=1)
+    yield test_engine
+    test_engine.dispose()
+
+
+class TestPoolMetrics:
+    """Tests for the pool event listeners."""
+
+    def test_checkout_and_overflow_tracking(self, small_engine):
+        metrics = PoolMetrics()
+        metrics.attach(small_engine.pool)
+
+        first = small_engine.connect()
+        second = small_engine.connect()  # Beyond pool_size: uses overflow
+        snapshot = metrics.snapshot()
+        first.close()
+        second.close()
+
+        assert snapshot["checked_out"] == 2
+        assert snapshot["peak_overflow"] == 1
+        assert snapshot["pool"]["overflow_in_use"] == 1
+
+        after = metrics.snapshot()
+        assert after["checkouts"] == 2
+        assert after["checkins"] == 2
+        assert after["checked_out"] == 0
+        assert after["pool"]["checked_out"] == 0
+
+    def test_reset_keeps_live_checked_out_count(self, small_engine):
+        metrics = PoolMetrics()
+        metrics.attach(small_engine.pool)
+
+        with small_engine.connect():
+            metrics.reset()
+            assert metrics.snapshot()["checked_out"] == 1
+            assert metrics.snapshot()["checkouts"] == 0
+
+    def test_app_engine_records_checkout_wait(self):
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        before = pool_metrics.snapshot()["wait_ms"]["samples"]
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert pool_metrics.snapshot()["wait_ms"]["samples"] >= min(before + 1, 1000)
+
+    async def test_async_engine_has_its_own_metrics(self):
+        assert isinstance(async_engine.pool, InstrumentedAsyncAdaptedQueuePool)
+        async_pool_metrics.reset()
+
+        try:
+            async for session in get_async_db():
+                assert (await session.execute(text("SELECT 1"))).scalar() == 1
+                assert async_pool_metrics.snapshot()["checked_out"] == 1
+        finally:
+            await async_engine.dispose()  # Pooled asyncpg connections are tied to this test's loop
+
+        snapshot = async_pool_metrics.snapshot()
+        assert snapshot["checkouts"] == 1
+        assert snapshot["checked_out"] == 0
+        assert snapshot["wait_ms"]["samples"] == 1
+
+
+class TestDbPoolEndpoint:
+    """Tests for /admin/metrics/db-pool."""
+
+    async def test_requires_authentication(self, async_client: AsyncClient):
+        response = await async_client.get("/admin/metrics/db-pool")
+        assert response.status_code == 401
+
+    async def test_admin_gets_pool_snapshot(self, async_client: AsyncClient):
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(role_names=["admin"])
+        try:
+            response = await async_client.get("/admin/metrics/db-pool")
+        finally:
+            app.dependency_overrides.pop(get_current_user, None)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["config"]["pool_size"] == settings.DB_POOL_SIZE
+        assert data["pool"]["size"] == settings.DB_POOL_SIZE
+        assert {"avg", "p95", "max", "samples"} <= set(data["wait_ms"])
+        assert data["async"]["pool"]["size"] == settings.DB_POOL_SIZE
+
+    async def test_non_admin_forbidden(self, async_client: AsyncClient):
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(role_names=["staff"])
+        try:
+            response = await async_client.get("/admin/metrics/db-pool")
+        finally:
+            app.dependency_overrides.pop(get_current_user, None)
+
+        assert response.status_code == 403
@@ -0,0 +1,121 @@
+"""Tests for background document previews and the browse list that serves them."""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+
+from src.main import app
+from src.routers.dependencies.auth_cookie import require_auth
+from src.services import document_service
+from src.services.preview_jobs import PreviewQueue, render_thumbnail
+from src.tests.helpers import create_member
+from src.tests.test_documents import MockS3Service
+
+
+def _image_bytes(size, mode="RGB", color="navy", fmt="JPEG") -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, size, color).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def mock_s3():
+    mock = MockS3Service()
+    with patch("src.services.document_service.get_s3_service", return_value=mock):
+        yield mock
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    job_queue = PreviewQueue(max_dimension=320, executor_factory=ThreadPoolExecutor)
+    monkeypatch.setattr(document_service, "preview_jobs", job_queue)
+    yield job_queue
+    job_queue.shutdown(wait=True)
+
+
+class TestRenderThumbnail:
+    """render_thumbnail output."""
+
+    def test_large_photo_is_downscaled(self):
+        photo = _image_bytes((4000, 3000))
+
+        thumbnail = Image.open(BytesIO(render_thumbnail(BytesIO(photo), "image/jpeg", 320)))
+
+        assert thumbnail.format == "JPEG"
+        assert thumbnail.size == (320, 240)
+
+    def test_transparency_is_flattened_onto_white(self):
+        logo = _image_bytes((100, 50), mode="RGBA", color=(0, 0, 0, 0), fmt="PNG")
+
+        thumbnail = Image.open(BytesIO(render_thumbnail(BytesIO(logo), "image/png", 320)))
+
+        assert thumbnail.size == (100, 50)  # Never upscaled
+        assert thumbnail.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_pdf_first_page(self):
+        pytest.importorskip("pypdfium2")
+        pdf = _image_bytes((850, 1100), color="red", fmt="PDF")
+
+        thumbnail = Image.open(BytesIO(render_thumbnail(BytesIO(pdf), "application/pdf", 320)))
+
+        assert max(thumbnail.size) == 320
+
+
+class TestPreviewPipeline:
+    """Uploads queue a preview that the browse list then serves."""
+
+    async def test_upload_generates_preview_served_by_browse(self, async_client: AsyncClient, mock_s3, queue):
+        member = await create_member(async_client)
+        photo = _image_bytes((4000, 3000), color=(uuid.uuid4().int % 256, 80, 160))
+
+        response = await async_client.post(
+            "/documents/upload",
+            files={"file": ("id_photo.jpg", BytesIO(photo), "image/jpeg")},
+            data={"record_type": "member", "record_id": member["id"]},
+        )
+        assert response.status_code == 201
+        s3_key = response.json()["s3_key"]
+        queue.shutdown(wait=True)  # Let the background render finish
+
+        preview_key = f"{s3_key}.preview.jpg"
+        assert mock_s3.files[preview_key]["content_type"] == "image/jpeg"
+        assert len(mock_s3.files[preview_key]["content"]) < len(photo) / 10
+
+        app.dependency_overrides[require_auth] = lambda: {"email": "docs@test.com"}
+        try:
+            browse = await async_client.get(
+                f"/documents/browse?entity_type=member&entity_id={member['id']}",
+                headers={"HX-Request": "true"},
+            )
+        finally:
+            app.dependency_overrides.pop(require_auth, None)
+        assert browse.status_code == 200
+        assert f"test-bucket/{preview_key}" in browse.text
+        assert "id_photo.jpg" in browse.text
+
+        # The preview goes with the content's last reference
+        await async_client.delete(f"/documents/{response.json()['id']}?hard_delete=true")
+        assert mock_s3.files == {}
+
+    async def test_browse_without_previews_shows_icons(self, async_client: AsyncClient, mock_s3, queue):
+        member = await create_member(async_client)
+        await async_client.post(
+            "/documents/upload",
+            files={"file": ("notes.txt", BytesIO(b"plain text"), "text/plain")},
+            data={"record_type": "member", "record_id": member["id"]},
+        )
+
+        app.dependency_overrides[require_auth] = lambda: {"email": "docs@test.com"}
+        try:
+            browse = await async_client.get(f"/documents/browse?entity_type=member&entity_id={member['id']}")
+        finally:
+            app.dependency_overrides.pop(require_auth, None)
+
+        assert browse.status_code == 200
+        assert "notes.txt" in browse.text
+        assert ".preview.jpg" not in browse.text
@@ -0,0 +1,104 @@
+"""Tests for the principal cache behind cookie authentication."""
+
+import uuid
+
+import pytest
+
+from src.core.jwt import create_access_token
+from src.models.user import User
+from src.services.principal_cache import PrincipalCache, principal_cache
+from src.services.staff_service import StaffService
+
+
+def _create_user(session, roles=("staff",)) -> User:
+    user = User(
+        email=f"principal-{uuid.uuid4().hex[:8]}@test.com",
+        password_hash="not-a-real-hash",
+        first_name="Cache",
+        last_name="Test",
+    )
+    session.add(user)
+    session.flush()
+    StaffService(session).update_user_roles(user.id, list(roles), updated_by="test")
+    return user
+
+
+def _cookie(user: User) -> dict:
+    token = create_access_token(user.id, additional_claims={"email": user.email, "roles": ["staff"]})
+    return {"access_token": token}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_principals():
+    principal_cache.invalidate()
+    yield
+    principal_cache.invalidate()
+
+
+class TestPrincipalCache:
+    """PrincipalCache loading and expiry."""
+
+    def test_load_reads_once_until_ttl(self, db_session):
+        user = _create_user(db_session, roles=("staff", "organizer"))
+        cache = PrincipalCache(ttl_seconds=60)
+
+        principal = cache.load(db_session, user.id)
+        assert principal.is_active and not principal.is_locked
+        assert set(principal.roles) == {"staff", "organizer"}
+
+        user.is_active = False
+        db_session.flush()
+        assert cache.load(db_session, user.id).is_active  # Served from cache
+
+        cache.invalidate(user.id)
+        assert not cache.load(db_session, user.id).is_active
+
+    def test_missing_user(self, db_session):
+        assert PrincipalCache(ttl_seconds=60).load(db_session, 2_000_000_000) is None
+
+    def test_expired_entries_are_reloaded(self, db_session):
+        user = _create_user(db_session)
+        cache = PrincipalCache(ttl_seconds=0)
+
+        cache.load(db_session, user.id)
+
+        assert cache.get(user.id) is None
+
+
+class TestCookieAuthentication:
+    """require_auth checks the account behind the cookie."""
+
+    async def test_locking_a_user_ends_their_session(self, async_client_with_db):
+        client, session = async_client_with_db
+        user = _create_user(session)
+        client.cookies.update(_cookie(user))
+
+        response = await client.get("/documents", follow_redirects=False)
+        assert response.status_code == 200
+
+        StaffService(session).toggle_lock(user.id, lock=True, updated_by="admin@test.com")
+
+        response = await client.get("/documents", follow_redirects=False)
+        assert response.status_code == 302
+        assert "/login" in response.headers["location"]
+
+    async def test_role_changes_apply_before_the_token_expires(self, async_client_with_db):
+        client, session = async_client_with_db
+        user = _create_user(session, roles=("staff",))
+        client.cookies.update(_cookie(user))
+        await client.get("/documents", follow_redirects=False)
+        assert principal_cache.get(user.id).roles == ("staff",)
+
+        StaffService(session).update_user_roles(user.id, ["officer"], updated_by="admin@test.com")
+        assert principal_cache.get(user.id) is None
+        await client.get("/documents", follow_redirects=False)
+
+        assert principal_cache.get(user.id).roles == ("officer",)
+
+    async def test_deleted_user_is_rejected(self, async_client):
+        user = User(id=2_000_000_001, email="gone@test.com")
+        async_client.cookies.update(_cookie(user))
+
+        response = await async_client.get("/documents", follow_redirects=False)
+
+        assert response.status_code == 302
@@ -0,0 +1,195 @@
+"""Tests for the report job queue and its on-disk result cache."""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from httpx import AsyncClient
+
+from src.main import app
+from src.routers import reports as reports_router
+from src.routers.dependencies.auth_cookie import require_auth
+from src.services import report_jobs as report_jobs_module
+from src.services.report_jobs import (
+    ReportJobQueue,
+    ReportJobStatus,
+    report_cache_key,
+)
+
+
+def _write_fake_pdf(html_content: str, path: str) -> str:
+    with open(path, "wb") as f:
+        f.write(b"%PDF-" + html_content.encode())
+    return path
+
+
+def _fail_render(html_content: str, path: str) -> str:
+    raise RuntimeError("renderer unavailable")
+
+
+def _wait_for(queue: ReportJobQueue, job_id: str, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job.status != ReportJobStatus.PENDING:
+            return job
+        time.sleep(0.01)
+    raise AssertionError("report job did not finish")
+
+
+@pytest.fixture
+def queue(tmp_path):
+    job_queue = ReportJobQueue(cache_dir=str(tmp_path), executor_factory=ThreadPoolExecutor)
+    yield job_queue
+    job_queue.shutdown(wait=True)
+
+
+class TestReportCacheKey:
+    """Tests for cache key derivation."""
+
+    def test_key_is_stable_and_parameter_order_independent(self):
+        assert report_cache_key("roster", {"a": 1, "b": 2}, [3]) == report_cache_key(
+            "roster", {"b": 2, "a": 1}, [3]
+        )
+
+    def test_data_version_changes_key(self):
+        assert report_cache_key("roster", {}, [1]) != report_cache_key("roster", {}, [2])
+
+
+class TestReportJobQueue:
+    """Tests for job submission, caching and failure handling."""
+
+    def test_finished_report_is_served_from_cache(self, queue):
+        job = queue.submit("abc", "roster", "roster.pdf", "<h1>1</h1>", render=_write_fake_pdf)
+        assert _wait_for(queue, "abc").status == ReportJobStatus.DONE
+
+        calls = []
+        again = queue.submit(
+            "abc", "roster", "roster.pdf", "<h1>2</h1>",
+            render=lambda html, path: calls.append(html),
+        )
+
+        assert job.job_id == again.job_id
+        assert again.status == ReportJobStatus.DONE
+        assert again.filename == "roster.pdf"
+        assert calls == []
+        with open(queue.cached_path("abc"), "rb") as f:
+            assert f.read() == b"%PDF-<h1>1</h1>"
+
+    def test_cached_report_visible_to_another_queue(self, queue):
+        queue.submit("shared", "roster", "roster.pdf", "x", render=_write_fake_pdf)
+        _wait_for(queue, "shared")
+
+        other = ReportJobQueue(cache_dir=queue.cache_dir, executor_factory=ThreadPoolExecutor)
+        job = other.get("shared")
+
+        assert job.status == ReportJobStatus.DONE
+        assert job.filename == "roster.pdf"
+
+    def test_pending_and_failed_jobs_visible_to_another_queue(self, queue):
+        release = threading.Event()
+
+        def slow_fail(html_content, path):
+            release.wait(5)
+            raise RuntimeError("renderer unavailable")
+
+        queue.submit("busy", "roster", "roster.pdf", "x", render=slow_fail)
+        other = ReportJobQueue(cache_dir=queue.cache_dir, executor_factory=ThreadPoolExecutor)
+        try:
+            assert other.get("busy").status == ReportJobStatus.PENDING
+            # Already rendering elsewhere: not queued a second time
+            assert other.submit("busy", "roster", "roster.pdf", "x", render=_fail_render).status == (
+                ReportJobStatus.PENDING
+            )
+            assert other._executor is None
+
+            release.set()
+            _wait_for(queue, "busy")
+            failed = other.get("busy")
+            assert failed.status == ReportJobStatus.FAILED
+            assert "renderer unavailable" in failed.error
+        finally:
+            other.shutdown(wait=True)
+
+    def test_lost_pending_job_expires(self, queue):
+        release = threading.Event()
+        queue.submit("lost", "roster", "roster.pdf", "x", render=lambda html, path: release.wait(5))
+        other = ReportJobQueue(
+            cache_dir=queue.cache_dir, job_timeout_seconds=0, executor_factory=ThreadPoolExecutor
+        )
+        time.sleep(0.01)
+
+        assert other.get("lost") is None
+        release.set()
+
+    def test_failed_render_reports_error_and_can_retry(self, queue):
+        queue.submit("bad", "roster", "roster.pdf", "x", render=_fail_render)
+        job = _wait_for(queue, "bad")
+
+        assert job.status == ReportJobStatus.FAILED
+        assert "renderer unavailable" in job.error
+        assert queue.cached_path("bad") is None
+
+        queue.submit("bad", "roster", "roster.pdf", "x", render=_write_fake_pdf)
+        assert _wait_for(queue, "bad").status == ReportJobStatus.DONE
+
+    def test_unknown_job(self, queue):
+        assert queue.get("missing") is None
+
+
+class TestReportJobRoutes:
+    """Tests for PDF report routes going through the job queue."""
+
+    @pytest.fixture
+    def route_queue(self, queue, monkeypatch):
+        monkeypatch.setattr(reports_router, "report_jobs", queue)
+        monkeypatch.setattr(
+            report_jobs_module.ReportService, "generate_pdf", staticmethod(lambda html: b"%PDF-test")
+        )
+        app.dependency_overrides[require_auth] = lambda: {"email": "reports@test.com"}
+        yield queue
+        app.dependency_overrides.pop(require_auth, None)
+
+    async def test_pdf_report_queues_then_downloads(self, async_client: AsyncClient, route_queue):
+        url = "/reports/dues/summary?format=pdf&year=1899"
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        assert 'id="report-job"' in response.text
+
+        job_id = re.search(r"/reports/jobs/(\w+)", response.text).group(1)
+        _wait_for(route_queue, job_id)
+
+        status_response = await async_client.get(
+            f"/reports/jobs/{job_id}", headers={"HX-Request": "true"}
+        )
+        assert "Download PDF" in status_response.text
+        assert "hx-trigger" not in status_response.text
+
+        download = await async_client.get(f"/reports/jobs/{job_id}/download")
+        assert download.status_code == 200
+        assert download.content == b"%PDF-test"
+
+        # Unchanged data: the same request is now a direct download
+        cached = await async_client.get(url)
+        assert cached.status_code == 200
+        assert cached.content == b"%PDF-test"
+        assert "attachment" in cached.headers["content-disposition"]
+
+    async def test_cached_reports_are_per_user(self, async_client: AsyncClient, route_queue):
+        url = "/reports/dues/summary?format=pdf&year=1899"
+        first = await async_client.get(url)
+        first_job = re.search(r"/reports/jobs/(\w+)", first.text).group(1)
+        _wait_for(route_queue, first_job)
+
+        app.dependency_overrides[require_auth] = lambda: {"email": "other@test.com"}
+        second = await async_client.get(url)
+
+        # Not the first user's PDF: a separate job, stamped with this user
+        second_job = re.search(r"/reports/jobs/(\w+)", second.text).group(1)
+        assert second_job != first_job
+
+    async def test_unknown_job_404(self, async_client: AsyncClient, route_queue):
+        response = await async_client.get("/reports/jobs/doesnotexist")
+        assert response.status_code == 404
@@ -98,6 +98,47 @@ class TestReportService:
         assert isinstance(result, bytes)
         assert len(result) > 0
 
+    def test_stream_excel_round_trip(self):
+        """Streamed Excel file contains the title, header and data rows."""
+        from io import BytesIO
+
+        from openpyxl import load_workbook
+
+        rows = ({"name": f"Member {i}", "age": i} for i in range(500))
+        columns = [
+            {"key": "name", "header": "Name", "width": 20},
+            {"key": "age", "header": "Age"},
+        ]
+
+        chunks = list(
+            ReportService.stream_excel(
+                rows, columns, sheet_name="Data", title="Test Report", chunk_size=1024
+            )
+        )
+
+        assert len(chunks) > 1
+        assert chunks[0][:2] == b"PK"
+        ws = load_workbook(BytesIO(b"".join(chunks)))["Data"]
+        values = list(ws.values)
+        assert values[0][0] == "Test Report"
+        assert values[2] == ("Name", "Age")
+        assert values[3] == ("Member 0", 0)
+        assert values[502] == ("Member 499", 499)
+
+    def test_stream_excel_is_lazy(self):
+        """Rows are not consumed until the response body is iterated."""
+        consumed = []
+
+        def rows():
+            consumed.append(True)
+            yield {"name": "Test"}
+
+        stream = ReportService.stream_excel(rows(), [{"key": "name", "header": "Name"}])
+        assert consumed == []
+
+        assert b"".join(stream)[:2] == b"PK"
+        assert consumed == [True]
+
     @pytest.mark.skipif(not weasyprint_available, reason="WeasyPrint not available")
     def test_generate_pdf_basic(self):
         """Generate PDF from basic HTML."""
@@ -189,6 +230,23 @@ class TestMemberReports:
         )
         assert response.status_code in [200, 302, 401]
 
+    @pytest.mark.asyncio
+    async def test_member_roster_excel_streams_workbook(self, async_client: AsyncClient):
+        """Authenticated roster Excel export is a streamed .xlsx download."""
+        from src.routers.dependencies.auth_cookie import require_auth
+        from src.main import app
+
+        app.dependency_overrides[require_auth] = lambda: {"email": "reports@test.com"}
+        try:
+            response = await async_client.get("/reports/members/roster?format=excel")
+        finally:
+            app.dependency_overrides.pop(require_auth, None)
+
+        assert response.status_code == 200
+        assert "attachment; filename=member_roster_" in response.headers["content-disposition"]
+        assert "content-length" not in response.headers
+        assert response.content[:2] == b"PK"
+
 
 class TestDuesReports:
     """Tests for dues reports."""